@@ -9,11 +9,12 @@ See authors, license and disclaimer at the top level directory of this project.
 """
 
 # Imports =====================================================================
-from typing import Dict
+from typing import Dict, List
 from lxml import etree
 from scipy.interpolate import interp1d
 
 import datetime
+import functools
 import logging
 import numpy as np
 import os
@@ -28,6 +29,9 @@ logger = logging.getLogger(__name__)
 #: Defines column names for the validationResults DataFrame
 VALICOLS = ["EGXFN", "VALIGRP", "PARAM",
             "VALUE", "XPATH", "VALIMSG", "VALIOUT"]
+# Column index shared by the validation DataFrames built from rows, so pandas
+# does not build and normalize a new one every time
+_VALICOLS_INDEX = pd.Index(VALICOLS)
 
 #: Codes used in sequences
 TIME_CODES = ["TIME_ABSOLUTE", "TIME_RELATIVE"]
@@ -94,6 +98,26 @@ def new_validation_row(egxfile: str, valgroup: str, param: str) -> Dict:
     return validation_row
 
 
+@functools.lru_cache(maxsize=1024)
+def compiled_xpath(xpath: str, ns: str = "") -> etree.XPath:
+    """ Returns the compiled lxml XPath object for an xpath expression
+
+    Compiled expressions are cached, so the xpath expressions used for every
+    aECG file are only parsed once.
+
+    Args:
+        xpath (str): xpath expression. If `ns` is not empty, every node step
+            of the expression is qualified with the `ns` namespace.
+        ns (str): namespace for xpath
+
+    Returns:
+        etree.XPath: Compiled xpath expression
+    """
+    if ns != "":
+        return etree.XPath(xpath.replace("/", "/ns:"), namespaces={"ns": ns})
+    return etree.XPath(xpath)
+
+
 def validate_xpath(xmlnode: etree._ElementTree, xpath: str, ns: str, attr: str,
                    valrow: Dict, failcat: str = "ERROR") -> Dict:
     """ Populates valrow with validation results
@@ -116,12 +140,31 @@ def validate_xpath(xmlnode: etree._ElementTree, xpath: str, ns: str, attr: str,
     """
 
     valrow["XPATH"] = xpath
-    if ns != "":
-        valnodes = xmlnode.xpath(xpath.replace("/", "/ns:"),
-                                 namespaces={"ns": ns})
-    else:
-        valnodes = xmlnode.xpath(xpath)
+    valnodes = compiled_xpath(xpath, ns)(xmlnode)
+
+    return validate_nodes(valnodes, attr, valrow, failcat)
+
+
+def validate_nodes(valnodes: List[etree._Element], attr: str, valrow: Dict,
+                   failcat: str = "ERROR") -> Dict:
+    """ Populates valrow with validation results of already selected nodes
+
+    Applies the same checks as :any:`validate_xpath` to the nodes returned by
+    an xpath expression evaluated beforehand, so that several attributes of
+    the same node can be validated without evaluating the expression again.
+    The XPATH of `valrow` is left untouched.
 
+    Args:
+        valnodes (List[etree._Element]): nodes found by the xpath expression
+        attr (str): String with the attribute for wihc retrieve the value. If
+            empty, the text value of the first node (if found) is used instead.
+        valrow (Dict): initialized validation row where populate validation
+            result.
+        failcat (str): string with validation output category when validation
+            fails (i.e., ERROR or WARNING)
+    Returns:
+        Dict: Validation row populated with the validation results.
+    """
     valrow["VALIOUT"] = "ERROR"
     valrow[
         "VALIMSG"] = "Validation unknown error parsing xpath expression in XML"
@@ -191,17 +234,21 @@ class AecgLead:
         scale: A ratio-scale quantity that is factored out of the sequence of
             digit values.
         scale_unit: Units of the scale value.
-        digits: List of sampled values.
+        digits: Sampled values as a numpy array of 64-bit integers (a list
+            in earlier versions). Empty if the digits were not read.
         LEADTIME: (optional) Time when the lead was recorded
     """
 
+    __slots__ = ("leadname", "origin", "origin_unit", "scale", "scale_unit",
+                 "digits", "LEADTIME")
+
     def __init__(self):
         self.leadname = ""
         self.origin = 0
         self.origin_unit = "uV"
         self.scale = 1
         self.scale_unit = "uV"
-        self.digits = []
+        self.digits = np.empty(0, dtype=np.int64)
         self.LEADTIME = {"code": "", "head": "", "increment": "", "unit": ""}
 
     def display_name(self):
@@ -223,6 +270,8 @@ class AecgAnnotationSet:
         anns: Annotations
     """
 
+    __slots__ = ("person", "device", "anns")
+
     def __init__(self):
         self.person = ""
         self.device = {"model": "", "name": ""}
@@ -286,6 +335,14 @@ class Aecg:
 
     """
 
+    __slots__ = ("filename", "zipContainer", "isValid", "xmlfound", "xmldoc",
+                 "UUID", "EGDTC", "DEVICE", "USUBJID", "SEX", "BIRTHTIME",
+                 "RACE", "TRTA", "STUDYID", "STUDYTITLE", "TPT", "RTPT",
+                 "PTPT", "RHYTHMID", "RHYTHMCODE", "RHYTHMEGDTC", "RHYTHMTIME",
+                 "RHYTHMLEADS", "RHYTHMANNS", "DERIVEDID", "DERIVEDCODE",
+                 "DERIVEDEGDTC", "DERIVEDTIME", "DERIVEDLEADS", "DERIVEDANNS",
+                 "_validator_rows", "_validator_df")
+
     def __init__(self):
 
         # Datasource
@@ -346,8 +403,27 @@ class Aecg:
 
         self.DERIVEDANNS = []
 
-        # Validator results when reading and parsing the aECG XML
-        self.validatorResults = pd.DataFrame()
+        # Validator results when reading and parsing the aECG XML. Rows are
+        # accumulated in a list and only turned into a DataFrame on access.
+        self._validator_rows = []
+        self._validator_df = None
+
+    @property
+    def validatorResults(self) -> pd.DataFrame:
+        """pd.DataFrame: validation log generated when reading the file"""
+        if self._validator_df is None or \
+                len(self._validator_rows) != self._validator_df.shape[0]:
+            if len(self._validator_rows) > 0:
+                self._validator_df = pd.DataFrame(self._validator_rows,
+                                                  columns=_VALICOLS_INDEX)
+            else:
+                self._validator_df = pd.DataFrame()
+        return self._validator_df
+
+    @validatorResults.setter
+    def validatorResults(self, valpd: pd.DataFrame):
+        self._validator_df = valpd
+        self._validator_rows = valpd.to_dict("records")
 
     def xmlstring(self):
         """Returns the :attr:`xmldoc` as a string
@@ -778,7 +854,7 @@ def lead_values_mv(aecglead: AecgLead) -> np.array:
         raise UnknownUnitsError(
             f"Unknown unit in scale of {aecglead.leadname}")
     # Return digits in mV
-    return np.array([d * scale + origin for d in aecglead.digits])
+    return np.asarray(aecglead.digits) * scale + origin
 
 
 def lead_mv_per_ms(start_time: datetime.datetime, ecg_lead: AecgLead,
@@ -543,8 +543,8 @@ def index_study_xml_file(study_aecg_files_df: pd.DataFrame,
                                   "ZIPFILE": [study_aecg_row.ZIPFILE]})
 
         logger.info(
-            f',{zip_fn},'
-            f'Indexing {xml_fn} [zip container: {zip_fn}]')
+            ',%s,Indexing %s [zip container: %s]',
+            zip_fn, xml_fn, zip_fn)
         try:
             # Read aECG XML
             my_aecg = read_aecg(xml_fn,
@@ -618,7 +618,8 @@ class DirectoryIndexer:
         """
         if (aecg_dir == "") or not os.path.isdir(aecg_dir):
             logger.error(
-                f',,Directory requested for indexing not found ({aecg_dir})')
+                ',,Directory requested for indexing not found (%s)',
+                aecg_dir)
             raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT),
                                     aecg_dir)
         # Retrieve the XML files to be indexed
@@ -668,8 +669,9 @@ class DirectoryIndexer:
             progress_callback.pbar.unit = " aECG files"
 
         if num_processes > 1:
-            logger.debug(f',,Index directory started with {num_processes} '
-                         f'parallel processes')
+            logger.debug(
+                ',,Index directory started with %s parallel processes',
+                num_processes)
             indexing_func = partial(
                 index_study_xml_file,
                 include_all_found_intervals=include_all_found_intervals,
@@ -706,8 +708,9 @@ class DirectoryIndexer:
                             by=["EGSTUDYID", "USUBJID", "EGDTC"],
                             ignore_index=True)
 
-        logger.debug(f',,Index directory finished. {studyindex_df.shape[0]}'
-                     f' waveforms found in {aecg_files.shape[0]} XML files.')
+        logger.debug(
+            ',,Index directory finished. %s waveforms found in %s XML files.',
+            studyindex_df.shape[0], aecg_files.shape[0])
 
         self.cancel_indexing = False
 
@@ -9,707 +9,944 @@ See authors, license and disclaimer at the top level directory of this project.
 """
 
 # Imports =====================================================================
-from typing import Dict, Tuple
+from functools import lru_cache, partial
+from multiprocessing import Pool
+from typing import Callable, Dict, List, NamedTuple, Tuple, Union
 from lxml import etree
-from aecg import validate_xpath, new_validation_row, VALICOLS, \
-    TIME_CODES, SEQUENCE_CODES, \
+from aecg import validate_xpath, validate_nodes, compiled_xpath, \
+    new_validation_row, VALICOLS, TIME_CODES, SEQUENCE_CODES, \
     Aecg, AecgLead, AecgAnnotationSet
+from aecg.core import _VALICOLS_INDEX
 
-import copy
+import contextlib
 import logging
+import numpy as np
+import os
 import pandas as pd
-import re
+import sys
+import warnings
 import zipfile
 
 
 # Python logging ==============================================================
 logger = logging.getLogger(__name__)
 
+# HL7 aECG namespace of all the XPath queries and tags on aECG documents
+_NSURI = 'urn:hl7-org:v3'
+
+# Clark-notation tags of nodes reached without XPath (find, iterchildren,
+# iterparse)
+_T_ADMINISTRATIVEGENDERCODE = f'{{{_NSURI}}}administrativeGenderCode'
+_T_ANNOTATION = f'{{{_NSURI}}}annotation'
+_T_BIRTHTIME = f'{{{_NSURI}}}birthTime'
+_T_BOUNDARY = f'{{{_NSURI}}}boundary'
+_T_CODE = f'{{{_NSURI}}}code'
+_T_COMPONENT = f'{{{_NSURI}}}component'
+_T_ID = f'{{{_NSURI}}}id'
+_T_RACECODE = f'{{{_NSURI}}}raceCode'
+_T_SEQUENCESET = f'{{{_NSURI}}}sequenceSet'
+_T_SUBJECTDEMOGRAPHICPERSON = f'{{{_NSURI}}}subjectDemographicPerson'
+_T_SUPPORT = f'{{{_NSURI}}}support'
+_T_SUPPORTINGROI = f'{{{_NSURI}}}supportingROI'
+_T_VALUE = f'{{{_NSURI}}}value'
+
+# Child tag chains walked from the parent of an annotation code node
+_ANNOTATION_CODE_TAGS = (_T_COMPONENT, _T_ANNOTATION, _T_CODE)
+_ANNOTATION_VALUE_TAGS = (_T_COMPONENT, _T_ANNOTATION, _T_VALUE)
+_ROI_BOUNDARY_CODE_TAGS = (_T_SUPPORT, _T_SUPPORTINGROI, _T_COMPONENT,
+                           _T_BOUNDARY, _T_CODE)
+
+# (annotation key, attribute) pairs read from the ../value node of an
+# annotation code. An empty attribute reads the node text instead.
+_BEAT_VALUE_ATTRS = (("wavecomponent", "code"),
+                     ("value", "value"),
+                     ("value_unit", "unit"))
+_NOBEAT_VALUE_ATTRS = (("wavecomponent", "code"),
+                       ("value", ""),
+                       ("value", "value"),
+                       ("value_unit", "unit"))
+
+# Fields of each annotation dict, in the order they are reported
+_ANN_KEYS = ("anngrpid", "beatnum", "code", "codetype",
+             "wavecomponent", "wavecomponent2", "timecode",
+             "value", "value_unit", "low", "low_unit", "high", "high_unit",
+             "lead")
+_ANN_TEMPLATE = dict.fromkeys(_ANN_KEYS, "")
+# Fields cleared before each annotation of a group without a beat (the code
+# type and lead of the group carry over)
+_NOBEAT_ANN_RESET = dict.fromkeys(("wavecomponent", "wavecomponent2",
+                                   "timecode", "value", "value_unit", "low",
+                                   "low_unit", "high", "high_unit"), "")
+
+# Annotation fields drawn from a small vocabulary (codes, units, leads) whose
+# values are interned so repeated strings are shared across annotations
+_CODED_ANN_KEYS = frozenset(("code", "codetype", "wavecomponent",
+                             "wavecomponent2", "timecode", "lead",
+                             "value_unit", "low_unit", "high_unit"))
+
+# Supporting ROI boundaries of annotations stored without a beat, paired with
+# their relative path for the validation XPATH label
+_NOBEAT_ROI_XPATHS = tuple(
+    (rel_path, compiled_xpath(rel_path, _NSURI))
+    for rel_path in ("../support/supportingROI/component/boundary",
+                     "../component/annotation/support/supportingROI/"
+                     "component/boundary"))
+
+
+# Supporting ROI boundary values of an annotation code ("" for value, low and
+# high), with the annotation fields receiving their value and unit
+_ROI_VALUE_XPATHS = tuple(
+    (n, n or "value", (n or "value") + "_unit", rel_path,
+     compiled_xpath(rel_path, _NSURI))
+    for n, rel_path in (
+        ("", "../support/supportingROI/component/boundary/value"),
+        ("low", "../support/supportingROI/component/boundary/value/low"),
+        ("high", "../support/supportingROI/component/boundary/value/high")))
+
+# Fallbacks used by annotations without a beat when the supporting ROI of
+# the annotation itself has no value: wave component and boundary values of
+# the annotations it contains
+_NOBEAT_WAVECOMPONENT2_PATH = "../component/annotation/value"
+_NOBEAT_ROI_FALLBACK_PATHS = {
+    n: "../component/annotation/support/supportingROI/component/boundary/"
+       "value" + ("/" + n if n != "" else "")
+    for n in ("", "low", "high")}
+
+# (name, ElementPath, reported XPath, validation parameter) of the aECG
+# effectiveTime components, built once instead of on every loop iteration
+_EGDTC_LOOKUPS = tuple(
+    (n, "{*}effectiveTime/{*}" + n,
+     "./*[local-name() = \"effectiveTime\"]/*[local-name() = \"" + n + "\"]",
+     "EGDTC_" + n)
+    for n in ("low", "center", "high"))
+
+
+class _InfoField(NamedTuple):
+    """Field of an aECG read by :any:`_parse_info_fields`"""
+    # XPath of the node holding the field, also reported in the XPATH column
+    xpath: str
+    # Child of the node holding the field instead (e.g., low or high of an
+    # effectiveTime), or empty string
+    child: str
+    # Attribute with the value (empty string for node text)
+    attr: str
+    # Aecg dictionary attribute and key receiving the value
+    target: str
+    key: str
+    valgroup: str
+    param: str
+    # Description of the field in the log messages
+    label: str
+    found_level: int = logging.INFO
+    missing_level: int = logging.DEBUG
+    # Value expected for the field, if any
+    expected: str = None
+
+
+def _series_info_fields(valgroup: str, series_xpath: str,
+                        series_code: str) -> Tuple[_InfoField, ...]:
+    """Returns the table of fields of the rhythm or derived waveform series"""
+    id_xpath = series_xpath + "/id"
+    code_xpath = series_xpath + "/code"
+    time_xpath = series_xpath + "/effectiveTime"
+    return (
+        _InfoField(id_xpath, "", "root", valgroup + "ID", "root", valgroup,
+                   "ID_root", valgroup + " ID root",
+                   missing_level=logging.WARNING),
+        _InfoField(id_xpath, "", "extension", valgroup + "ID", "extension",
+                   valgroup, "ID_extension", valgroup + " ID extension",
+                   missing_level=logging.WARNING),
+        _InfoField(code_xpath, "", "code", valgroup + "CODE", "code",
+                   valgroup, "CODE", valgroup + " code",
+                   found_level=logging.DEBUG, missing_level=logging.WARNING,
+                   expected=series_code),
+        _InfoField(code_xpath, "", "displayName", valgroup + "CODE",
+                   "displayName", valgroup, "CODE_displayName",
+                   valgroup + " displayName", found_level=logging.DEBUG),
+        _InfoField(time_xpath, "low", "value", valgroup + "EGDTC", "low",
+                   valgroup, "EGDTC_low", valgroup + "EGDTC low"),
+        _InfoField(time_xpath, "high", "value", valgroup + "EGDTC", "high",
+                   valgroup, "EGDTC_high", valgroup + "EGDTC high"))
+
+
+_RHYTHM_INFO_FIELDS = _series_info_fields(
+    "RHYTHM", "./component/series", "RHYTHM")
+_DERIVED_INFO_FIELDS = _series_info_fields(
+    "DERIVED", "./component/series/derivation/derivedSeries",
+    "REPRESENTATIVE_BEAT")
+
+_TPT_XPATH = "./componentOf/timepointEvent"
+_RTPT_XPATH = "./definition/relativeTimepoint"
+_PTPT_XPATH = _RTPT_XPATH + "/componentOf/protocolTimepointEvent"
+_TIMEPOINT_FIELDS = (
+    _InfoField(_TPT_XPATH + "/code", "", "code", "TPT", "code", "STUDYINFO",
+               "TPT_code", "TPT code"),
+    _InfoField(_TPT_XPATH + "/code", "", "displayName", "TPT", "displayName",
+               "STUDYINFO", "TPT_displayName", "TPT displayName"),
+    _InfoField(_TPT_XPATH + "/reasonCode", "", "code", "TPT", "reasonCode",
+               "STUDYINFO", "TPT_reasonCode", "TPT reasonCode"),
+    _InfoField(_TPT_XPATH + "/effectiveTime", "low", "value", "TPT", "low",
+               "STUDYINFO", "TPT_low", "TPT low"),
+    _InfoField(_TPT_XPATH + "/effectiveTime", "high", "value", "TPT", "high",
+               "STUDYINFO", "TPT_high", "TPT high"),
+    # RTPT displayName has always been read from the code attribute
+    _InfoField(_RTPT_XPATH + "/code", "", "code", "RTPT", "code",
+               "STUDYINFO", "RTPT_code", "RTPT code"),
+    _InfoField(_RTPT_XPATH + "/code", "", "code", "RTPT", "displayName",
+               "STUDYINFO", "RTPT_displayName", "RTPT displayName"),
+    _InfoField(_RTPT_XPATH + "/componentOf/pauseQuantity", "", "value",
+               "RTPT", "pauseQuantity", "STUDYINFO", "RTPT_pauseQuantity",
+               "RTPT pauseQuantity value"),
+    _InfoField(_RTPT_XPATH + "/componentOf/pauseQuantity", "", "unit",
+               "RTPT", "pauseQuantity_unit", "STUDYINFO",
+               "RTPT_pauseQuantity_unit", "RTPT pauseQuantity unit"),
+    _InfoField(_PTPT_XPATH + "/code", "", "code", "PTPT", "code",
+               "STUDYINFO", "PTPT_code", "PTPT code"),
+    _InfoField(_PTPT_XPATH + "/code", "", "displayName", "PTPT",
+               "displayName", "STUDYINFO", "PTPT_displayName",
+               "PTPT displayName"),
+    _InfoField(_PTPT_XPATH + "/component/referenceEvent/code", "", "code",
+               "PTPT", "referenceEvent", "STUDYINFO", "PTPT_referenceEvent",
+               "PTPT referenceEvent code"),
+    _InfoField(_PTPT_XPATH + "/component/referenceEvent/code", "",
+               "displayName", "PTPT", "referenceEvent_displayName",
+               "STUDYINFO", "PTPT_referenceEvent_displayName",
+               "PTPT referenceEvent displayName"))
+
+# ElementPaths of the sequence value components, keyed by the XPath relative
+# to the sequence code node reported in the validation rows. They are
+# evaluated from the sequence node (the parent of the code node).
+_SEQUENCE_VALUE_PATHS = {
+    "../value/" + n: f"{_T_VALUE}/{{{_NSURI}}}{n}"
+    for n in ("head", "increment", "origin", "scale", "digits")}
+# ElementPaths of the rhythm and derived sequence code nodes, relative to the
+# root node
+_RHYTHM_SEQUENCE_CODE_PATH = "/".join(
+    f"{{{_NSURI}}}{tag}" for tag in ("component", "series", "component",
+                                     "sequenceSet", "component", "sequence",
+                                     "code"))
+_DERIVED_SEQUENCE_CODE_PATH = "/".join(
+    f"{{{_NSURI}}}{tag}" for tag in ("component", "series", "derivation",
+                                     "derivedSeries", "component",
+                                     "sequenceSet", "component", "sequence",
+                                     "code"))
+
+# Paths of the device information, relative to the root node. The series
+# author node is looked up once and the device fields are then found under it.
+_SERIES_AUTHOR_PATH = "./component/series/author/seriesAuthor"
+_SERIES_AUTHOR_ELEMPATH = "/".join(
+    f"{{{_NSURI}}}{tag}" for tag in _SERIES_AUTHOR_PATH[2:].split("/"))
+_DEVICE_FIELDS = tuple(
+    (n, path, tuple(f"{{{_NSURI}}}{tag}" for tag in path.split("/")))
+    for n, path in (
+        ("manufacturer", "manufacturerOrganization/name"),
+        ("model", "manufacturedSeriesDevice/manufacturerModelName"),
+        ("software", "manufacturedSeriesDevice/softwareName")))
+
+# Paths of the subject information, relative to the root node. The trial
+# subject node is looked up once and the subject id and demographics are then
+# found under it.
+_TRIAL_SUBJECT_PATH = "./componentOf/timepointEvent/componentOf/" \
+    "subjectAssignment/subject/trialSubject"
+_TRIAL_SUBJECT_ELEMPATH = "/".join(
+    f"{{{_NSURI}}}{tag}" for tag in _TRIAL_SUBJECT_PATH[2:].split("/"))
+_DEMOGRAPHIC_PERSON_PATH = _TRIAL_SUBJECT_PATH + "/subjectDemographicPerson"
+
+# Paths of the author information of an annotation set, relative to the
+# annotation set node. The author type node is looked up once and the name,
+# model and device name are then found under it.
+_ANNSET_AUTHOR_TYPE_PATH = "author/assignedEntity/assignedAuthorType"
+_ANNSET_AUTHOR_TYPE_XPATH = compiled_xpath("./" + _ANNSET_AUTHOR_TYPE_PATH,
+                                           _NSURI)
+_ANNSET_PERSON_PATH = _ANNSET_AUTHOR_TYPE_PATH + "/assignedPerson/name"
+_ANNSET_MODEL_PATH = _ANNSET_AUTHOR_TYPE_PATH + \
+    "/assignedDevice/manufacturerModelName"
+_ANNSET_DEVICE_NAME_PATH = _ANNSET_AUTHOR_TYPE_PATH + \
+    "/assignedDevice/playedManufacturedDevice/manufacturerOrganization/name"
+_ANNSET_AUTHOR_SUBPATHS = {
+    rel_path: "/".join(
+        f"{{{_NSURI}}}{tag}"
+        for tag in rel_path[len(_ANNSET_AUTHOR_TYPE_PATH) + 1:].split("/"))
+    for rel_path in (_ANNSET_PERSON_PATH, _ANNSET_MODEL_PATH,
+                     _ANNSET_DEVICE_NAME_PATH)}
+
+
+@lru_cache(maxsize=4)
+def _xml_parser(ns_clean: bool = True,
+                remove_blank_text: bool = True) -> etree.XMLParser:
+    """Returns the parser for aECG XML documents
+
+    Comments are dropped and xml:id attributes are not indexed, as neither is
+    used when reading aECG documents. Entities are not resolved and nothing
+    is loaded from the network. One parser is kept per combination of
+    options and reused for every file read in the process.
 
-def parse_annotations(xml_filename: str,
-                      zip_filename: str,
-                      aecg_doc: etree._ElementTree,
-                      aecgannset: AecgAnnotationSet,
-                      path_prefix: str,
-                      annsset_xmlnode_path: str,
-                      valgroup: str = "RHYTHM",
-                      log_validation: bool = False) -> Tuple[
-                          AecgAnnotationSet, pd.DataFrame]:
-    """Parses `aecg_doc` XML document and extracts annotations
+    Args:
+        ns_clean (bool, optional): Indicates whether to clean up namespaces.
+            Defaults to True.
+        remove_blank_text (bool, optional): Indicates whether to clean up
+            blank text. Defaults to True.
+
+    Returns:
+        etree.XMLParser: The XML parser.
+    """
+    return etree.XMLParser(ns_clean=ns_clean,
+                           remove_blank_text=remove_blank_text,
+                           remove_comments=True,
+                           collect_ids=False,
+                           resolve_entities=False,
+                           no_network=True)
+
+
+@lru_cache(maxsize=8)
+def _load_xml_schema(schema_path: str) -> etree.XMLSchema:
+    """Parses and compiles the XML schema in `schema_path`
+
+    The xsd file is parsed without comments, blank text, xml:id indexing or
+    entity resolution, none of which is needed to compile the schema.
 
     Args:
-        xml_filename (str): Filename of the aECG XML file.
-        zip_filename (str): Filename of zip file containint the aECG XML file.
-            If '', then xml file is not stored in a zip file.
-        aecg_doc (etree._ElementTree): XML document of the aECG XML file.
-        aecgannset (AecgAnnotationSet): Annotation set to which append found
-            annotations.
-        path_prefix (str): Prefix of xml path from which start searching for
-            annotations.
-        annsset_xmlnode_path (str): Path to xml node of the annotation set
-            containing the annotations.
-        valgroup (str, optional): Indicates whether to search annotations in
-            rhythm or derived waveform. Defaults to "RHYTHM".
-        log_validation (bool, optional): Indicates whether to maintain the
-            validation results in `aecg.validatorResults`. Defaults to
-            False.
+        schema_path (str): Absolute path to the xsd file.
 
     Returns:
-        Tuple[AecgAnnotationSet, pd.DataFrame]: Annotation set updated with
-        found annotations and dataframe with results of validation.
+        etree.XMLSchema: The compiled schema.
+    """
+    schema_parser = etree.XMLParser(remove_blank_text=True,
+                                    remove_comments=True,
+                                    collect_ids=False,
+                                    resolve_entities=False,
+                                    no_network=True)
+    return etree.XMLSchema(etree.parse(schema_path, schema_parser))
+
+
+def _xml_schema(schema_filename: str) -> etree.XMLSchema:
+    """Returns the compiled XML schema in `schema_filename`
+
+    Compiling the aECG schema takes much longer than validating a document
+    against it, so compiled schemas are cached by absolute path and reused
+    for every file validated in the process.
+
+    Args:
+        schema_filename (str): Path to the xsd file.
+
+    Raises:
+        etree.XMLSchemaParseError: if the schema is not valid.
+
+    Returns:
+        etree.XMLSchema: The compiled schema.
+    """
+    return _load_xml_schema(os.path.abspath(schema_filename))
+
+
+def _find_path(nodes: Union[etree._Element, List[etree._Element]],
+               tags: Tuple[str, ...]) -> List[etree._Element]:
+    """Returns the descendants of `nodes` reached by the child tag chain `tags`
+
+    Equivalent to the relative XPath ``tag1/tag2/...`` (in document order)
+    evaluated from a node, or from each node of a list, without going
+    through the XPath engine.
+    """
+    if isinstance(nodes, etree._Element):
+        nodes = [nodes]
+    for tag in tags:
+        nodes = [child for n in nodes for child in n.iterchildren(tag)]
+    return nodes
+
+
+def _annotation_codes(codenode: etree._Element,
+                      skip_intervals: bool = False) -> List[etree._Element]:
+    """Returns MDC_ECG_ annotation code nodes nested next to `codenode`
+
+    Same nodes as ``../component/annotation/code[contains(@code,
+    "MDC_ECG_")]`` evaluated from `codenode`. If `skip_intervals` is True,
+    annotations reporting interval values only (MDC_ECG_TIME_PD_*) are
+    left out in the same pass.
     """
+    nodes = []
+    for node in _find_path(codenode.getparent(), _ANNOTATION_CODE_TAGS):
+        code = node.get("code", "")
+        if "MDC_ECG_" in code and not (
+                skip_intervals and code.startswith("MDC_ECG_TIME_PD_")):
+            nodes.append(node)
+    return nodes
+
+
+def _parse_annotations(xml_filename: str,
+                       zip_filename: str,
+                       aecg_doc: etree._ElementTree,
+                       aecgannset: AecgAnnotationSet,
+                       path_prefix: str,
+                       annsset_xmlnode_path: str,
+                       valgroup: str = "RHYTHM",
+                       log_validation: bool = False,
+                       doc_nodes: Dict[str, List[etree._Element]] = None
+                       ) -> Tuple[AecgAnnotationSet, List[Dict]]:
+    """Extracts the annotations of an annotation set
+
+    Same as :any:`parse_annotations` but returns the validation rows as a
+    list, empty when `log_validation` is False.
+
+    The annotation nodes are searched from `path_prefix` in the whole
+    `aecg_doc`, so the result is the same for every annotation set of the
+    document. If `doc_nodes` is given, the nodes found are stored in it by
+    xpath and reused by the next calls for the same document.
+    """
+
+    def find_doc_nodes(xpath: str) -> List[etree._Element]:
+        if doc_nodes is None:
+            return compiled_xpath(xpath, _NSURI)(aecg_doc)
+        if xpath not in doc_nodes:
+            doc_nodes[xpath] = compiled_xpath(xpath, _NSURI)(aecg_doc)
+        return doc_nodes[xpath]
+
     anngrpid = 0
+    new_row = _validation_row_factory(xml_filename, log_validation)
+    beat_row = partial(new_row, valgroup, "ANNSET_BEAT_ANNS")
+    nobeat_row = partial(new_row, valgroup, "ANNSET_NOBEAT_ANNS")
+
     # Annotations stored within a beat
-    beatnodes = aecg_doc.xpath((
-        path_prefix +
-        "/component/annotation/code[@code=\'MDC_ECG_BEAT\']").replace(
-        '/', '/ns:'), namespaces={'ns': 'urn:hl7-org:v3'})
+    beatnodes = find_doc_nodes(
+        path_prefix + "/component/annotation/code[@code=\'MDC_ECG_BEAT\']")
     beatnum = 0
-    valpd = pd.DataFrame()
+    val_rows = []
     if len(beatnodes) > 0:
-        logger.info(
-            f'{xml_filename},{zip_filename},'
-            f'{valgroup} {len(beatnodes)} annotated beats found')
-    for beatnode in beatnodes:
-        for rel_path in ["../component/annotation/"
-                         "code[contains(@code, \"MDC_ECG_\")]"]:
-            annsnodes = beatnode.xpath(rel_path.replace('/', '/ns:'),
-                                       namespaces={'ns': 'urn:hl7-org:v3'})
-            rel_path2 = "../value"
-            for annsnode in annsnodes:
-                ann = {"anngrpid": anngrpid, "beatnum": "", "code": "",
-                       "codetype": "",
-                       "wavecomponent": "", "wavecomponent2": "",
-                       "timecode": "",
-                       "value": "", "value_unit": "",
-                       "low": "", "low_unit": "",
-                       "high": "", "high_unit": "",
-                       "lead": ""}
-                # Annotation code
-                valrow2 = validate_xpath(
-                    annsnode,
-                    ".",
-                    "urn:hl7-org:v3",
-                    "code",
-                    new_validation_row(xml_filename,
-                                       valgroup,
-                                       "ANNSET_BEAT_ANNS"),
-                    failcat="WARNING")
-                valrow2["XPATH"] = annsset_xmlnode_path + "/" + rel_path
-                if valrow2["VALIOUT"] == "PASSED":
-                    ann["code"] = valrow2["VALUE"]
+        logger.info('%s,%s,%s %d annotated beats found',
+                    xml_filename, zip_filename, valgroup, len(beatnodes))
+    # Relative paths and validation labels reused for every beat
+    rel_path = "../component/annotation/code[contains(@code, \"MDC_ECG_\")]"
+    rel_path2 = "../value"
+    rel_path4 = "../support/supportingROI/component/boundary/code"
+    annset_value_path = annsset_xmlnode_path + "/value"
+    beat_anns_path = annsset_xmlnode_path + "/" + rel_path
+    beat_anns_value_path = beat_anns_path + "/" + rel_path2
+    beat_anns_roi_path = beat_anns_path + "/" + rel_path4
+    beat_roi_value_paths = {rp: beat_anns_path + "/" + rp
+                            for _, _, _, rp, _ in _ROI_VALUE_XPATHS}
+
+    def extract_values(node, ann, attrs, new_row, xpath_label):
+        # Copies the ../value attributes listed in attrs into ann, looking up
+        # the ../value node only once
+        value_nodes = node.getparent().findall(_T_VALUE)
+        if not log_validation:
+            # Same outcome as validate_nodes without filling any row
+            if len(value_nodes) == 1:
+                value_node = value_nodes[0]
+                for key, attr in attrs:
+                    if attr == "":
+                        value = value_node.text
+                    else:
+                        value = value_node.get(attr)
+                    if value is not None:
+                        if key in _CODED_ANN_KEYS:
+                            value = sys.intern(value)
+                        ann[key] = value
+            return
+        for key, attr in attrs:
+            valrow = validate_nodes(value_nodes, attr,
+                                    new_row(),
+                                    failcat="WARNING")
+            if valrow["VALIOUT"] == "PASSED":
+                if key in _CODED_ANN_KEYS:
+                    ann[key] = sys.intern(valrow["VALUE"])
+                else:
+                    ann[key] = valrow["VALUE"]
+            valrow["XPATH"] = xpath_label
+            val_rows.append(valrow)
 
-                # Annotation type from top level value
-                valrow2 = validate_xpath(annsnode,
-                                         "../value",
-                                         "urn:hl7-org:v3",
-                                         "code",
-                                         new_validation_row(
-                                             xml_filename, valgroup,
-                                             "ANNSET_BEAT_ANNS"),
-                                         failcat="WARNING")
-                valrow2["XPATH"] = annsset_xmlnode_path + "/value"
+    for beatnode in beatnodes:
+        annsnodes = _annotation_codes(beatnode)
+        for annsnode in annsnodes:
+            ann = _ANN_TEMPLATE.copy()
+            ann["anngrpid"] = anngrpid
+            # Annotation code, read once: nodes are selected by their @code
+            # so it is always present (and was never a logged validation)
+            ann_code = annsnode.get("code")
+            ann["code"] = sys.intern(ann_code)
 
-                if log_validation:
-                    valpd = valpd.append(pd.DataFrame(
-                        [valrow2], columns=VALICOLS), ignore_index=True)
+            # Annotation type from top level value
+            value_nodes = annsnode.getparent().findall(_T_VALUE)
+            valrow2 = validate_nodes(value_nodes,
+                                     "code",
+                                     beat_row(),
+                                     failcat="WARNING")
+            if log_validation:
+                valrow2["XPATH"] = annset_value_path
+                val_rows.append(valrow2)
 
-                if valrow2["VALIOUT"] == "PASSED":
-                    ann["codetype"] = valrow2["VALUE"]
+            if valrow2["VALIOUT"] == "PASSED":
+                ann["codetype"] = sys.intern(valrow2["VALUE"])
+
+            # Annotations type
+            valrow2 = validate_nodes(
+                value_nodes,
+                "code",
+                beat_row(),
+                failcat="WARNING")
+            if log_validation:
+                valrow2["XPATH"] = beat_anns_value_path
 
-                # Annotations type
-                valrow2 = validate_xpath(
-                    annsnode,
-                    rel_path2,
-                    "urn:hl7-org:v3",
-                    "code",
-                    new_validation_row(xml_filename,
-                                       valgroup,
-                                       "ANNSET_BEAT_ANNS"),
-                    failcat="WARNING")
-                valrow2["XPATH"] = annsset_xmlnode_path + "/" + rel_path + \
-                    "/" + rel_path2
+            if valrow2["VALIOUT"] == "PASSED":
+                ann["beatnum"] = beatnum
+                ann["codetype"] = sys.intern(valrow2["VALUE"])
+                if log_validation:
+                    val_rows.append(valrow2)
 
-                if valrow2["VALIOUT"] == "PASSED":
-                    ann["beatnum"] = beatnum
-                    ann["codetype"] = valrow2["VALUE"]
-                    if log_validation:
-                        valpd = valpd.append(
-                            pd.DataFrame([valrow2], columns=VALICOLS),
-                            ignore_index=True)
-
-                    subannsnodes = annsnode.xpath(
-                        rel_path.replace('/', '/ns:'),
-                        namespaces={'ns': 'urn:hl7-org:v3'})
-                    if len(subannsnodes) == 0:
-                        subannsnodes = [annsnode]
-                    else:
-                        subannsnodes += [annsnode]
-                    # Exclude annotations reporting interval values only
-                    subannsnodes = [
-                        sa for sa in subannsnodes
-                        if not sa.get("code").startswith("MDC_ECG_TIME_PD_")]
-                    for subannsnode in subannsnodes:
-                        # Annotations type
-                        valrow2 = validate_xpath(subannsnode,
-                                                 rel_path2,
-                                                 "urn:hl7-org:v3",
-                                                 "code",
-                                                 new_validation_row(
-                                                     xml_filename,
-                                                     valgroup,
-                                                     "ANNSET_BEAT_ANNS"),
-                                                 failcat="WARNING")
-                        valrow2["XPATH"] = annsset_xmlnode_path + "/" + \
-                            rel_path + "/" + rel_path2
+                # Exclude annotations reporting interval values only
+                subannsnodes = _annotation_codes(annsnode,
+                                                 skip_intervals=True)
+                if not ann_code.startswith("MDC_ECG_TIME_PD_"):
+                    subannsnodes.append(annsnode)
+                for subannsnode in subannsnodes:
+                    extract_values(subannsnode, ann, _BEAT_VALUE_ATTRS,
+                                   beat_row, beat_anns_value_path)
 
-                        if valrow2["VALIOUT"] == "PASSED":
-                            ann["wavecomponent"] = valrow2["VALUE"]
+                    # annotations info from supporting ROI
+                    for n, key, unit_key, rp, rp_xpath in _ROI_VALUE_XPATHS:
+                        rp_nodes = rp_xpath(subannsnode)
+                        valrow3 = validate_nodes(
+                            rp_nodes,
+                            "value",
+                            beat_row(),
+                            failcat="WARNING")
                         if log_validation:
-                            valpd = valpd.append(
-                                pd.DataFrame([valrow2], columns=VALICOLS),
-                                ignore_index=True)
-
-                        # Annotations value
-                        valrow2 = validate_xpath(subannsnode,
-                                                 rel_path2,
-                                                 "urn:hl7-org:v3",
-                                                 "value",
-                                                 new_validation_row(
-                                                     xml_filename,
-                                                     valgroup,
-                                                     "ANNSET_BEAT_ANNS"),
-                                                 failcat="WARNING")
-                        valrow2["XPATH"] = annsset_xmlnode_path + "/" + \
-                            rel_path + "/" + rel_path2
-                        if valrow2["VALIOUT"] == "PASSED":
-                            ann["value"] = valrow2["VALUE"]
+                            valrow3["XPATH"] = beat_roi_value_paths[rp]
+                        if valrow3["VALIOUT"] == "PASSED":
+                            ann[key] = valrow3["VALUE"]
                         if log_validation:
-                            valpd = valpd.append(
-                                pd.DataFrame([valrow2], columns=VALICOLS),
-                                ignore_index=True)
-
-                        # Annotations value units
-                        valrow2 = validate_xpath(subannsnode,
-                                                 rel_path2,
-                                                 "urn:hl7-org:v3",
-                                                 "unit",
-                                                 new_validation_row(
-                                                     xml_filename,
-                                                     valgroup,
-                                                     "ANNSET_BEAT_ANNS"),
-                                                 failcat="WARNING")
-                        valrow2["XPATH"] = annsset_xmlnode_path + "/" + \
-                            rel_path + "/" + rel_path2
-                        if valrow2["VALIOUT"] == "PASSED":
-                            ann["value_unit"] = valrow2["VALUE"]
+                            val_rows.append(valrow3)
+                        valrow3 = validate_nodes(
+                            rp_nodes,
+                            "unit",
+                            beat_row(),
+                            failcat="WARNING")
                         if log_validation:
-                            valpd = valpd.append(
-                                pd.DataFrame([valrow2], columns=VALICOLS),
-                                ignore_index=True)
-
-                        # annotations info from supporting ROI
-                        rel_path3 = "../support/supportingROI/component/"\
-                                    "boundary/value"
-                        for n in ["", "low", "high"]:
-                            if n != "":
-                                rp = rel_path3 + "/" + n
+                            valrow3["XPATH"] = beat_roi_value_paths[rp]
+                        if valrow3["VALIOUT"] == "PASSED":
+                            ann[unit_key] = sys.intern(valrow3["VALUE"])
+                        if log_validation:
+                            val_rows.append(valrow3)
+
+                    # annotations time encoding, lead and other info used
+                    # by value and supporting ROI
+                    roinodes = _find_path(subannsnode.getparent(),
+                                          _ROI_BOUNDARY_CODE_TAGS)
+                    for roinode in roinodes:
+                        valrow4 = validate_nodes(
+                            [roinode],
+                            "code",
+                            beat_row(),
+                            failcat="WARNING")
+                        if log_validation:
+                            valrow4["XPATH"] = beat_anns_roi_path
+                        if valrow4["VALIOUT"] == "PASSED":
+                            if valrow4["VALUE"] in ["TIME_ABSOLUTE",
+                                                    "TIME_RELATIVE"]:
+                                ann["timecode"] = sys.intern(valrow4["VALUE"])
                             else:
-                                rp = rel_path3
-                            valrow3 = validate_xpath(
-                                subannsnode,
-                                rp,
-                                "urn:hl7-org:v3",
-                                "value",
-                                new_validation_row(xml_filename,
-                                                   valgroup,
-                                                   "ANNSET_BEAT_ANNS"),
-                                failcat="WARNING")
-                            valrow3["XPATH"] = annsset_xmlnode_path + "/" + \
-                                rel_path + "/" + rp
-                            if valrow3["VALIOUT"] == "PASSED":
-                                if n != "":
-                                    ann[n] = valrow3["VALUE"]
-                                else:
-                                    ann["value"] = valrow3["VALUE"]
-                            if log_validation:
-                                valpd = valpd.append(
-                                    pd.DataFrame([valrow3], columns=VALICOLS),
-                                    ignore_index=True)
-                            valrow3 = validate_xpath(
-                                subannsnode,
-                                rp,
-                                "urn:hl7-org:v3",
-                                "unit",
-                                new_validation_row(xml_filename,
-                                                   valgroup,
-                                                   "ANNSET_BEAT_ANNS"),
-                                failcat="WARNING")
-                            valrow3["XPATH"] = annsset_xmlnode_path + "/" + \
-                                rel_path + "/" + rp
-                            if valrow3["VALIOUT"] == "PASSED":
-                                if n != "":
-                                    ann[n + "_unit"] = valrow3["VALUE"]
-                                else:
-                                    ann["value_unit"] = valrow3["VALUE"]
-                            if log_validation:
-                                valpd = valpd.append(
-                                    pd.DataFrame([valrow3], columns=VALICOLS),
-                                    ignore_index=True)
-
-                        # annotations time encoding, lead and other info used
-                        # by value and supporting ROI
-                        rel_path4 = "../support/supportingROI/component/"\
-                                    "boundary/code"
-                        roinodes = subannsnode.xpath(
-                            rel_path4.replace('/', '/ns:'),
-                            namespaces={'ns': 'urn:hl7-org:v3'})
-                        for roinode in roinodes:
-                            valrow4 = validate_xpath(
-                                roinode,
-                                ".",
-                                "urn:hl7-org:v3",
-                                "code",
-                                new_validation_row(xml_filename,
-                                                   valgroup,
-                                                   "ANNSET_BEAT_ANNS"),
-                                failcat="WARNING")
-                            valrow4["XPATH"] = annsset_xmlnode_path + "/" + \
-                                rel_path + "/" + rel_path4
-                            if valrow4["VALIOUT"] == "PASSED":
-                                if valrow4["VALUE"] in ["TIME_ABSOLUTE",
-                                                        "TIME_RELATIVE"]:
-                                    ann["timecode"] = valrow4["VALUE"]
-                                else:
-                                    ann["lead"] = valrow4["VALUE"]
-                            if log_validation:
-                                valpd = valpd.append(
-                                    pd.DataFrame([valrow4], columns=VALICOLS),
-                                    ignore_index=True)
+                                ann["lead"] = sys.intern(valrow4["VALUE"])
+                        if log_validation:
+                            val_rows.append(valrow4)
 
-                        aecgannset.anns.append(copy.deepcopy(ann))
+                    aecgannset.anns.append(ann.copy())
 
-                else:
-                    # Annotations type
-                    valrow2 = validate_xpath(annsnode,
-                                             ".",
-                                             "urn:hl7-org:v3",
-                                             "code",
-                                             new_validation_row(xml_filename,
-                                                                valgroup,
-                                                                "ANNSET_BEAT_"
-                                                                "ANNS"),
-                                             failcat="WARNING")
-                    valrow2["XPATH"] = annsset_xmlnode_path + "/" + rel_path +\
-                        "/" + rel_path2
-                    if valrow2["VALIOUT"] == "PASSED":
-                        ann["beatnum"] = beatnum
-                        ann["codetype"] = valrow2["VALUE"]
-                        if log_validation:
-                            valpd = valpd.append(
-                                pd.DataFrame([valrow2], columns=VALICOLS),
-                                ignore_index=True)
-
-                        # Annotations value
-                        valrow2 = validate_xpath(annsnode,
-                                                 rel_path2,
-                                                 "urn:hl7-org:v3",
-                                                 "value",
-                                                 new_validation_row(
-                                                     xml_filename,
-                                                     valgroup,
-                                                     "ANNSET_BEAT_ANNS"),
+            else:
+                # Annotations type
+                valrow2 = validate_nodes([annsnode],
+                                         "code",
+                                         beat_row(),
+                                         failcat="WARNING")
+                if log_validation:
+                    valrow2["XPATH"] = beat_anns_value_path
+                if valrow2["VALIOUT"] == "PASSED":
+                    ann["beatnum"] = beatnum
+                    ann["codetype"] = sys.intern(valrow2["VALUE"])
+                    if log_validation:
+                        val_rows.append(valrow2)
+
+                    extract_values(annsnode, ann, _BEAT_VALUE_ATTRS[1:],
+                                   beat_row, beat_anns_value_path)
+
+                    # annotations time encoding, lead and other info used
+                    # by value and supporting ROI
+                    roinodes = _find_path(annsnode.getparent(),
+                                          _ROI_BOUNDARY_CODE_TAGS)
+                    for roinode in roinodes:
+                        valrow4 = validate_nodes([roinode],
+                                                 "code",
+                                                 beat_row(),
                                                  failcat="WARNING")
-                        valrow2["XPATH"] = annsset_xmlnode_path + "/" + \
-                            rel_path + "/" + rel_path2
-                        if valrow2["VALIOUT"] == "PASSED":
-                            ann["value"] = valrow2["VALUE"]
                         if log_validation:
-                            valpd = valpd.append(
-                                pd.DataFrame([valrow2], columns=VALICOLS),
-                                ignore_index=True)
-
-                        # Annotations value units
-                        valrow2 = validate_xpath(annsnode,
-                                                 rel_path2,
-                                                 "urn:hl7-org:v3",
-                                                 "unit",
-                                                 new_validation_row(
-                                                     xml_filename,
-                                                     valgroup,
-                                                     "ANNSET_BEAT_ANNS"),
-                                                 failcat="WARNING")
-                        valrow2["XPATH"] = annsset_xmlnode_path + "/" + \
-                            rel_path + "/" + rel_path2
-                        if valrow2["VALIOUT"] == "PASSED":
-                            ann["value_unit"] = valrow2["VALUE"]
+                            valrow4["XPATH"] = beat_anns_roi_path
+                        if valrow4["VALIOUT"] == "PASSED":
+                            if valrow4["VALUE"] in ["TIME_ABSOLUTE",
+                                                    "TIME_RELATIVE"]:
+                                ann["timecode"] = sys.intern(valrow4["VALUE"])
+                            else:
+                                ann["lead"] = sys.intern(valrow4["VALUE"])
                         if log_validation:
-                            valpd = valpd.append(
-                                pd.DataFrame([valrow2], columns=VALICOLS),
-                                ignore_index=True)
-
-                        # annotations time encoding, lead and other info used
-                        # by value and supporting ROI
-                        rel_path4 = "../support/supportingROI/component/" \
-                                    "boundary/code"
-                        roinodes = annsnode.xpath(
-                            rel_path4.replace('/', '/ns:'),
-                            namespaces={'ns': 'urn:hl7-org:v3'})
-                        for roinode in roinodes:
-                            valrow4 = validate_xpath(roinode,
-                                                     ".",
-                                                     "urn:hl7-org:v3",
-                                                     "code",
-                                                     new_validation_row(
-                                                         xml_filename,
-                                                         valgroup,
-                                                         "ANNSET_BEAT_ANNS"),
-                                                     failcat="WARNING")
-                            valrow4["XPATH"] = annsset_xmlnode_path + "/" + \
-                                rel_path + "/" + rel_path4
-                            if valrow4["VALIOUT"] == "PASSED":
-                                if valrow4["VALUE"] in ["TIME_ABSOLUTE",
-                                                        "TIME_RELATIVE"]:
-                                    ann["timecode"] = valrow4["VALUE"]
-                                else:
-                                    ann["lead"] = valrow4["VALUE"]
-                            if log_validation:
-                                valpd = valpd.append(
-                                    pd.DataFrame([valrow4],
-                                                 columns=VALICOLS),
-                                    ignore_index=True)
+                            val_rows.append(valrow4)
 
-                        aecgannset.anns.append(copy.deepcopy(ann))
+                    # Not reused: the next annotation starts a new dict
+                    aecgannset.anns.append(ann)
 
-                    else:
-                        if log_validation:
-                            valpd = valpd.append(
-                                pd.DataFrame([valrow2], columns=VALICOLS),
-                                ignore_index=True)
-            anngrpid = anngrpid + 1
+                else:
+                    if log_validation:
+                        val_rows.append(valrow2)
+        anngrpid = anngrpid + 1
         beatnum = beatnum + 1
     if len(beatnodes) > 0:
-        logger.info(
-            f'{xml_filename},{zip_filename},'
-            f'{valgroup} {beatnum} annotated beats and {anngrpid} '
-            f'annotations groups found')
+        logger.info('%s,%s,%s %d annotated beats and %d annotations groups '
+                    'found', xml_filename, zip_filename, valgroup, beatnum,
+                    anngrpid)
     anngrpid_from_beats = anngrpid
     # Annotations stored without an associated beat
     for codetype_path in ["/component/annotation/code["
                           "(contains(@code, \"MDC_ECG_\") and"
                           " not (@code=\'MDC_ECG_BEAT\'))]"]:
-        annsnodes = aecg_doc.xpath(
-            (path_prefix + codetype_path).replace('/', '/ns:'),
-            namespaces={'ns': 'urn:hl7-org:v3'})
-        rel_path2 = "../value"
+        annsnodes = find_doc_nodes(path_prefix + codetype_path)
+        nobeat_anns_path = annsset_xmlnode_path + "/.." + codetype_path
+        nobeat_anns_value_path = nobeat_anns_path + "/" + rel_path2
+        # Validation labels of the lookups relative to each annotation
+        nobeat_paths = {rp: nobeat_anns_path + "/" + rp for rp in
+                        ["code", _NOBEAT_WAVECOMPONENT2_PATH] +
+                        [rp for _, _, _, rp, _ in _ROI_VALUE_XPATHS] +
+                        [rp for rp, _ in _NOBEAT_ROI_XPATHS] +
+                        list(_NOBEAT_ROI_FALLBACK_PATHS.values())}
+        # Compiled once per code type and evaluated for every annotation node
+        sub_anns_xpath = compiled_xpath(".." + codetype_path, _NSURI)
         for annsnode in annsnodes:
-            ann = {"anngrpid": anngrpid, "beatnum": "", "code": "",
-                   "codetype": "",
-                   "wavecomponent": "", "wavecomponent2": "",
-                   "timecode": "",
-                   "value": "", "value_unit": "",
-                   "low": "", "low_unit": "",
-                   "high": "", "high_unit": "",
-                   "lead": ""}
+            ann = _ANN_TEMPLATE.copy()
+            ann["anngrpid"] = anngrpid
             # Annotations code
-            valrow2 = validate_xpath(annsnode,
-                                     ".",
-                                     "urn:hl7-org:v3",
+            valrow2 = validate_nodes([annsnode],
                                      "code",
-                                     new_validation_row(xml_filename, valgroup,
-                                                        "ANNSET_NOBEAT_ANNS"),
+                                     nobeat_row(),
                                      failcat="WARNING")
-            valrow2["XPATH"] = annsset_xmlnode_path
-
             if log_validation:
-                valpd = valpd.append(pd.DataFrame([valrow2], columns=VALICOLS),
-                                     ignore_index=True)
+                valrow2["XPATH"] = annsset_xmlnode_path
+                val_rows.append(valrow2)
             if valrow2["VALIOUT"] == "PASSED":
-                ann["code"] = valrow2["VALUE"]
+                ann["code"] = sys.intern(valrow2["VALUE"])
 
             # Annotation type from top level value
-            valrow2 = validate_xpath(annsnode,
-                                     "../value",
-                                     "urn:hl7-org:v3",
+            valrow2 = validate_nodes(annsnode.getparent().findall(_T_VALUE),
                                      "code",
-                                     new_validation_row(xml_filename, valgroup,
-                                                        "ANNSET_NOBEAT_ANNS"),
+                                     nobeat_row(),
                                      failcat="WARNING")
-            valrow2["XPATH"] = annsset_xmlnode_path + "/value"
-
             if log_validation:
-                valpd = valpd.append(pd.DataFrame([valrow2], columns=VALICOLS),
-                                     ignore_index=True)
+                valrow2["XPATH"] = annset_value_path
+                val_rows.append(valrow2)
             if valrow2["VALIOUT"] == "PASSED":
-                ann["codetype"] = valrow2["VALUE"]
+                ann["codetype"] = sys.intern(valrow2["VALUE"])
 
-            subannsnodes = annsnode.xpath(
-                (".." + codetype_path).replace('/', '/ns:'),
-                namespaces={'ns': 'urn:hl7-org:v3'})
+            subannsnodes = sub_anns_xpath(annsnode)
             if len(subannsnodes) == 0:
                 subannsnodes = [annsnode]
             for subannsnode in subannsnodes:
 
-                subsubannsnodes = subannsnode.xpath(
-                    (".." + codetype_path).replace('/', '/ns:'),
-                    namespaces={'ns': 'urn:hl7-org:v3'})
+                subsubannsnodes = sub_anns_xpath(subannsnode)
 
                 tmpnodes = [subannsnode]
-                if len(subsubannsnodes) > 0:
-                    tmpnodes = tmpnodes + subsubannsnodes
+                tmpnodes.extend(subsubannsnodes)
 
                 for subsubannsnode in tmpnodes:
-                    ann["wavecomponent"] = ""
-                    ann["wavecomponent2"] = ""
-                    ann["timecode"] = ""
-                    ann["value"] = ""
-                    ann["value_unit"] = ""
-                    ann["low"] = ""
-                    ann["low_unit"] = ""
-                    ann["high"] = ""
-                    ann["high_unit"] = ""
-
-                    roi_base = "../support/supportingROI/component/boundary"
-                    rel_path3 = roi_base + "/value"
-
-                    valrow2 = validate_xpath(
-                        subsubannsnode,
-                        ".",
-                        "urn:hl7-org:v3",
-                        "code",
-                        new_validation_row(xml_filename,
-                                           valgroup,
-                                           "ANNSET_NOBEAT_"
-                                           "ANNS"),
-                        failcat="WARNING")
-                    valrow2["XPATH"] = annsset_xmlnode_path + "/.." + \
-                        codetype_path + "/code"
-                    if valrow2["VALIOUT"] == "PASSED":
-                        if not ann["codetype"].endswith("WAVE"):
-                            ann["codetype"] = valrow2["VALUE"]
-                    if log_validation:
-                        valpd = valpd.append(
-                            pd.DataFrame([valrow2], columns=VALICOLS),
-                            ignore_index=True)
-
-                    # Annotations type
-                    valrow2 = validate_xpath(
-                        subsubannsnode,
-                        rel_path2,
-                        "urn:hl7-org:v3",
+                    ann.update(_NOBEAT_ANN_RESET)
+
+                    valrow2 = validate_nodes(
+                        [subsubannsnode],
                         "code",
-                        new_validation_row(xml_filename,
-                                           valgroup,
-                                           "ANNSET_NOBEAT_"
-                                           "ANNS"),
+                        nobeat_row(),
                         failcat="WARNING")
-                    valrow2["XPATH"] = annsset_xmlnode_path + "/.." + \
-                        codetype_path + "/" + rel_path2
-                    if valrow2["VALIOUT"] == "PASSED":
-                        ann["wavecomponent"] = valrow2["VALUE"]
-                        # if ann["wavecomponent"] == "":
-                        #     ann["wavecomponent"] = valrow2["VALUE"]
-                        # else:
-                        #     ann["wavecomponent2"] = valrow2["VALUE"]
                     if log_validation:
-                        valpd = valpd.append(
-                            pd.DataFrame([valrow2], columns=VALICOLS),
-                            ignore_index=True)
-
-                    # Annotations value
-                    valrow2 = validate_xpath(
-                        subsubannsnode,
-                        rel_path2,
-                        "urn:hl7-org:v3",
-                        "",
-                        new_validation_row(xml_filename,
-                                           valgroup,
-                                           "ANNSET_NOBEAT_"
-                                           "ANNS"),
-                        failcat="WARNING")
-                    valrow2["XPATH"] = annsset_xmlnode_path + "/.." + \
-                        codetype_path + "/" + rel_path2
+                        valrow2["XPATH"] = nobeat_paths["code"]
                     if valrow2["VALIOUT"] == "PASSED":
-                        ann["value"] = valrow2["VALUE"]
-                    if log_validation:
-                        valpd = valpd.append(
-                            pd.DataFrame([valrow2], columns=VALICOLS),
-                            ignore_index=True)
-
-                    # Annotations value as attribute
-                    valrow2 = validate_xpath(
-                        subsubannsnode,
-                        rel_path2,
-                        "urn:hl7-org:v3",
-                        "value",
-                        new_validation_row(xml_filename,
-                                           valgroup,
-                                           "ANNSET_NOBEAT_"
-                                           "ANNS"),
-                        failcat="WARNING")
-                    valrow2["XPATH"] = annsset_xmlnode_path + "/.." + \
-                        codetype_path + "/" + rel_path2
-                    if valrow2["VALIOUT"] == "PASSED":
-                        ann["value"] = valrow2["VALUE"]
-                    if log_validation:
-                        valpd = valpd.append(
-                            pd.DataFrame([valrow2], columns=VALICOLS),
-                            ignore_index=True)
-                    # Annotations value units
-                    valrow2 = validate_xpath(
-                        subsubannsnode,
-                        rel_path2,
-                        "urn:hl7-org:v3",
-                        "unit",
-                        new_validation_row(xml_filename,
-                                           valgroup,
-                                           "ANNSET_NOBEAT_"
-                                           "ANNS"),
-                        failcat="WARNING")
-                    valrow2["XPATH"] = annsset_xmlnode_path + "/.." + \
-                        codetype_path + "/" + rel_path2
-                    if valrow2["VALIOUT"] == "PASSED":
-                        ann["value_unit"] = valrow2["VALUE"]
+                        if not ann["codetype"].endswith("WAVE"):
+                            ann["codetype"] = sys.intern(valrow2["VALUE"])
                     if log_validation:
-                        valpd = valpd.append(
-                            pd.DataFrame([valrow2], columns=VALICOLS),
-                            ignore_index=True)
+                        val_rows.append(valrow2)
+
+                    extract_values(subsubannsnode, ann, _NOBEAT_VALUE_ATTRS,
+                                   nobeat_row, nobeat_anns_value_path)
 
                     # annotations info from supporting ROI
-                    for n in ["", "low", "high"]:
-                        if n != "":
-                            rp = rel_path3 + "/" + n
-                        else:
-                            rp = rel_path3
-                        valrow3 = validate_xpath(
-                            subsubannsnode,
-                            rp,
-                            "urn:hl7-org:v3",
+                    for n, key, unit_key, rp, rp_xpath in _ROI_VALUE_XPATHS:
+                        rp_nodes = rp_xpath(subsubannsnode)
+                        valrow3 = validate_nodes(
+                            rp_nodes,
                             "value",
-                            new_validation_row(xml_filename,
-                                               valgroup,
-                                               "ANNSET_NOBEAT_"
-                                               "ANNS"),
+                            nobeat_row(),
                             failcat="WARNING")
-                        valrow3["XPATH"] = annsset_xmlnode_path + "/.." + \
-                            codetype_path + "/" + rp
+                        if log_validation:
+                            valrow3["XPATH"] = nobeat_paths[rp]
                         if valrow3["VALIOUT"] == "PASSED":
-                            if n != "":
-                                ann[n] = valrow3["VALUE"]
-                            else:
-                                ann["value"] = valrow3["VALUE"]
+                            ann[key] = valrow3["VALUE"]
                         else:
-                            roi_base = "../component/annotation/support/"\
-                                       "supportingROI/component/boundary"
                             # Annotations type
-                            valrow2 = validate_xpath(subsubannsnode,
-                                                     "../component/annotation/"
-                                                     "value",
-                                                     "urn:hl7-org:v3",
-                                                     "code",
-                                                     new_validation_row(
-                                                         xml_filename,
-                                                         valgroup,
-                                                         "ANNSET_NOBEAT_ANNS"),
-                                                     failcat="WARNING")
-                            valrow2["XPATH"] = annsset_xmlnode_path + "/.." + \
-                                codetype_path + "/" + \
-                                "../component/annotation/value"
+                            valrow2 = validate_nodes(
+                                _find_path(subsubannsnode.getparent(),
+                                           _ANNOTATION_VALUE_TAGS),
+                                "code",
+                                nobeat_row(),
+                                failcat="WARNING")
+                            if log_validation:
+                                valrow2["XPATH"] = nobeat_paths[
+                                    _NOBEAT_WAVECOMPONENT2_PATH]
                             if valrow2["VALIOUT"] == "PASSED":
-                                ann["wavecomponent2"] = valrow2["VALUE"]
+                                ann["wavecomponent2"] = sys.intern(
+                                    valrow2["VALUE"])
                             if log_validation:
-                                valpd = valpd.append(
-                                    pd.DataFrame([valrow2], columns=VALICOLS),
-                                    ignore_index=True)
+                                val_rows.append(valrow2)
                             # annotation values
-
-                            if n != "":
-                                rp = roi_base + "/value/" + n
-                            else:
-                                rp = roi_base + "/value"
-                            valrow3 = validate_xpath(subsubannsnode,
-                                                     rp,
-                                                     "urn:hl7-org:v3",
-                                                     "value",
-                                                     new_validation_row(
-                                                         xml_filename,
-                                                         valgroup,
-                                                         "ANNSET_NOBEAT_ANNS"),
-                                                     failcat="WARNING")
-                            valrow3["XPATH"] = annsset_xmlnode_path + "/.." + \
-                                codetype_path + "/" + rp
+                            rp = _NOBEAT_ROI_FALLBACK_PATHS[n]
+                            rp_nodes = compiled_xpath(rp, _NSURI)(
+                                subsubannsnode)
+                            valrow3 = validate_nodes(
+                                rp_nodes,
+                                "value",
+                                nobeat_row(),
+                                failcat="WARNING")
+                            if log_validation:
+                                valrow3["XPATH"] = nobeat_paths[rp]
                             if valrow3["VALIOUT"] == "PASSED":
-                                if n != "":
-                                    ann[n] = valrow3["VALUE"]
-                                else:
-                                    ann["value"] = valrow3["VALUE"]
+                                ann[key] = valrow3["VALUE"]
                         if log_validation:
-                            valpd = valpd.append(
-                                pd.DataFrame([valrow3], columns=VALICOLS),
-                                ignore_index=True)
-                        valrow3 = validate_xpath(
-                            subsubannsnode,
-                            rp,
-                            "urn:hl7-org:v3",
+                            val_rows.append(valrow3)
+                        valrow3 = validate_nodes(
+                            rp_nodes,
                             "unit",
-                            new_validation_row(xml_filename,
-                                               valgroup,
-                                               "ANNSET_NOBEAT"
-                                               "_ANNS"),
+                            nobeat_row(),
                             failcat="WARNING")
-                        valrow3["XPATH"] = annsset_xmlnode_path + "/.." + \
-                            codetype_path + "/" + rp
+                        if log_validation:
+                            valrow3["XPATH"] = nobeat_paths[rp]
 
                         if valrow3["VALIOUT"] == "PASSED":
-                            if n != "":
-                                ann[n + "_unit"] = valrow3["VALUE"]
-                            else:
-                                ann["value_unit"] = valrow3["VALUE"]
+                            ann[unit_key] = sys.intern(valrow3["VALUE"])
                         if log_validation:
-                            valpd = valpd.append(
-                                pd.DataFrame([valrow3], columns=VALICOLS),
-                                ignore_index=True)
+                            val_rows.append(valrow3)
 
                     # annotations time encoding, lead and other info used by
                     # value and supporting ROI
-                    for rel_path4 in ["../support/supportingROI/component/"
-                                      "boundary",
-                                      "../component/annotation/support/"
-                                      "supportingROI/component/boundary"]:
-                        roinodes = subsubannsnode.xpath(
-                            rel_path4.replace('/', '/ns:'),
-                            namespaces={'ns': 'urn:hl7-org:v3'})
+                    for rel_path4, roi_xpath in _NOBEAT_ROI_XPATHS:
+                        roinodes = roi_xpath(subsubannsnode)
                         for roinode in roinodes:
-                            valrow4 = validate_xpath(roinode,
-                                                     "./code",
-                                                     "urn:hl7-org:v3",
-                                                     "code",
-                                                     new_validation_row(
-                                                         xml_filename,
-                                                         valgroup,
-                                                         "ANNSET_NOBEAT_ANNS"),
-                                                     failcat="WARNING")
-                            valrow4["XPATH"] = annsset_xmlnode_path + "/.." + \
-                                codetype_path + "/" + rel_path4
+                            valrow4 = validate_nodes(
+                                roinode.findall(_T_CODE),
+                                "code",
+                                nobeat_row(),
+                                failcat="WARNING")
+                            if log_validation:
+                                valrow4["XPATH"] = nobeat_paths[rel_path4]
                             if valrow4["VALIOUT"] == "PASSED":
                                 if valrow4["VALUE"] in ["TIME_ABSOLUTE",
                                                         "TIME_RELATIVE"]:
-                                    ann["timecode"] = valrow4["VALUE"]
+                                    ann["timecode"] = sys.intern(
+                                        valrow4["VALUE"])
                                 else:
-                                    ann["lead"] = valrow4["VALUE"]
+                                    ann["lead"] = sys.intern(valrow4["VALUE"])
                             if log_validation:
-                                valpd = valpd.append(
-                                    pd.DataFrame([valrow4], columns=VALICOLS),
-                                    ignore_index=True)
-                    aecgannset.anns.append(copy.deepcopy(ann))
+                                val_rows.append(valrow4)
+                    aecgannset.anns.append(ann.copy())
             anngrpid = anngrpid + 1
 
-    logger.info(
-        f'{xml_filename},{zip_filename},'
-        f'{valgroup} {anngrpid-anngrpid_from_beats} annotations groups'
-        f' without an associated beat found')
+    logger.info('%s,%s,%s %d annotations groups without an associated beat '
+                'found', xml_filename, zip_filename, valgroup,
+                anngrpid - anngrpid_from_beats)
+
+    return aecgannset, val_rows
+
+
+def parse_annotations(xml_filename: str,
+                      zip_filename: str,
+                      aecg_doc: etree._ElementTree,
+                      aecgannset: AecgAnnotationSet,
+                      path_prefix: str,
+                      annsset_xmlnode_path: str,
+                      valgroup: str = "RHYTHM",
+                      log_validation: bool = False) -> Tuple[
+                          AecgAnnotationSet, pd.DataFrame]:
+    """Parses `aecg_doc` XML document and extracts annotations
+
+    Args:
+        xml_filename (str): Filename of the aECG XML file.
+        zip_filename (str): Filename of zip file containint the aECG XML file.
+            If '', then xml file is not stored in a zip file.
+        aecg_doc (etree._ElementTree): XML document of the aECG XML file.
+        aecgannset (AecgAnnotationSet): Annotation set to which append found
+            annotations.
+        path_prefix (str): Prefix of xml path from which start searching for
+            annotations.
+        annsset_xmlnode_path (str): Path to xml node of the annotation set
+            containing the annotations.
+        valgroup (str, optional): Indicates whether to search annotations in
+            rhythm or derived waveform. Defaults to "RHYTHM".
+        log_validation (bool, optional): Indicates whether to maintain the
+            validation results in `aecg.validatorResults`. Defaults to
+            False.
+
+    Returns:
+        Tuple[AecgAnnotationSet, pd.DataFrame]: Annotation set updated with
+        found annotations and dataframe with results of validation.
+    """
+    aecgannset, val_rows = _parse_annotations(
+        xml_filename, zip_filename, aecg_doc, aecgannset, path_prefix,
+        annsset_xmlnode_path, valgroup, log_validation)
+    return aecgannset, pd.DataFrame(val_rows, columns=_VALICOLS_INDEX)
+
+
+def _validate_found(nodes: List[etree._Element], xpath: str, attr: str,
+                    valrow: Dict, failcat: str = "ERROR") -> Dict:
+    """Validates nodes already looked up with ElementPath
+
+    Same as :any:`validate_xpath` but for callers that found the nodes
+    with `find`/`findall`; `xpath` is only recorded in the XPATH column.
+
+    Args:
+        nodes (List[etree._Element]): Nodes found in the xml document.
+        xpath (str): XPath reported for the nodes in the validation row.
+        attr (str): Attribute to retrieve (empty string for node text).
+        valrow (Dict): Validation row to update.
+        failcat (str, optional): Failure category. Defaults to "ERROR".
+
+    Returns:
+        Dict: `valrow` updated with the result of the validation.
+    """
+    valrow["XPATH"] = xpath
+    return validate_nodes(nodes, attr, valrow, failcat)
 
-    return aecgannset, valpd
+
+def _validation_row_factory(egxfile: str, log_validation: bool) -> Callable[
+        [str, str], Dict]:
+    """Returns the function used by the parsers to get validation rows
+
+    When logging, the function returns new rows (see
+    :any:`new_validation_row`). Otherwise rows are only read right after each
+    validation, so the function returns the same scratch row every time, with
+    its VALUE, VALIOUT and VALIMSG cleared as in a new row.
+
+    Args:
+        egxfile (str): Filename of the xml file containing the aECG.
+        log_validation (bool): Indicates whether the validation rows are kept.
+
+    Returns:
+        Callable[[str, str], Dict]: Function taking the validation group and
+        parameter and returning the row to populate.
+    """
+    if log_validation:
+        return partial(new_validation_row, egxfile)
+    scratch_row = new_validation_row(egxfile, "", "")
+
+    def scratch(valgroup: str, param: str) -> Dict:
+        scratch_row["VALUE"] = ""
+        scratch_row["VALIOUT"] = ""
+        scratch_row["VALIMSG"] = ""
+        return scratch_row
+
+    return scratch
+
+
+def _append_validation_rows(aecg: Aecg, val_rows: List[Dict]) -> None:
+    """Appends validation rows to `aecg.validatorResults`
+
+    Args:
+        aecg (Aecg): The aECG object to update
+        val_rows (List[Dict]): Validation rows (see :any:`new_validation_row`)
+    """
+    aecg._validator_rows.extend(val_rows)
+
+
+def _parse_info_fields(aecg_doc: etree._ElementTree, aecg: Aecg,
+                       fields: Tuple[_InfoField, ...],
+                       log_validation: bool = False) -> Aecg:
+    """Validates and stores in `aecg` the fields described in `fields`
+
+    Fields read from the same node share a single lookup of the node.
+
+    Args:
+        aecg_doc (etree._ElementTree): aECG XML document
+        aecg (Aecg): The aECG object to update
+        fields (Tuple[_InfoField, ...]): Fields to read
+        log_validation (bool, optional): Indicates whether to maintain the
+            validation results in `aecg.validatorResults`. Defaults to
+            False.
+
+    Returns:
+        Aecg: `aecg` updated with the information found in the xml document.
+    """
+    val_rows = []
+    new_row = _validation_row_factory(aecg.filename, log_validation)
+    found = {}
+    for field in fields:
+        nodes = found.get(field.xpath)
+        if nodes is None:
+            nodes = compiled_xpath(field.xpath, _NSURI)(aecg_doc)
+            found[field.xpath] = nodes
+        xpath = field.xpath
+        if field.child != "":
+            tag = f'{{{_NSURI}}}{field.child}'
+            nodes = [c for n in nodes for c in n.iterchildren(tag)]
+            xpath = xpath + "/" + field.child
+        valrow = _validate_found(nodes,
+                                 xpath,
+                                 field.attr,
+                                 new_row(field.valgroup, field.param),
+                                 failcat="WARNING")
+        if valrow["VALIOUT"] == "PASSED":
+            value = valrow["VALUE"]
+            logger.log(
+                field.found_level, '%s,%s,%s found: %s',
+                aecg.filename, aecg.zipContainer, field.label, value)
+            getattr(aecg, field.target)[field.key] = value
+            if field.expected is not None and \
+                    value != field.expected:
+                logger.warning(
+                    '%s,%s,%s unexpected %s found: %s',
+                    aecg.filename, aecg.zipContainer, field.valgroup,
+                    field.key, value)
+                valrow["VALIOUT"] = "WARNING"
+                valrow["VALIMSG"] = "Unexpected value found"
+        else:
+            logger.log(
+                field.missing_level, '%s,%s,%s not found',
+                aecg.filename, aecg.zipContainer, field.label)
+        if log_validation:
+            val_rows.append(valrow)
+    if log_validation:
+        _append_validation_rows(aecg, val_rows)
+    return aecg
+
+
+def _parse_digits(sdigits: str) -> np.ndarray:
+    """Converts the whitespace separated digits of a sequence to integers
+
+    Args:
+        sdigits (str): Text of a sequence digits node.
+
+    Raises:
+        ValueError: if `sdigits` is blank, contains anything other than
+            integers or integers that do not fit in 64 bits.
+
+    Returns:
+        np.ndarray: The digits as an array of 64-bit integers.
+    """
+    # numpy returns [0] for a blank string instead of failing
+    if sdigits.strip() == "":
+        raise ValueError("No digits found")
+    # numpy may only warn and stop at the first value it cannot parse; turn
+    # that into an error instead of returning a truncated lead
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            digits = np.fromstring(sdigits, dtype=np.int64, sep=" ")
+        except DeprecationWarning as ex:
+            raise ValueError(str(ex)) from None
+    # Out of range values are clamped to the int64 limits, so values at the
+    # limits are checked against the text
+    limits = np.iinfo(np.int64)
+    if np.any((digits == limits.max) | (digits == limits.min)):
+        for value in sdigits.split():
+            if not limits.min <= int(value) <= limits.max:
+                raise ValueError(f"Digit out of range: {value}")
+    return digits
 
 
 def parse_generalinfo(aecg_doc: etree._ElementTree,
@@ -731,156 +968,100 @@ def parse_generalinfo(aecg_doc: etree._ElementTree,
     Returns:
         Aecg: `aecg` updated with the information found in the xml document.
     """
+    val_rows = []
+    new_row = _validation_row_factory(aecg.filename, log_validation)
+    root = aecg_doc.getroot()
     # =======================================
     # UUID
     # =======================================
-    valrow = validate_xpath(aecg_doc,
-                            "./*[local-name() = \"id\"]",
-                            "",
-                            "root",
-                            new_validation_row(aecg.filename,
-                                               "GENERAL",
-                                               "UUID"))
+    # Both UUID parts live on the same id children of the root element.
+    # ElementPath wildcards beat a local-name() XPath predicate here.
+    id_nodes = root.findall("{*}id")
+    valrow = _validate_found(id_nodes,
+                             "./*[local-name() = \"id\"]",
+                             "root",
+                             new_row("GENERAL", "UUID"))
     if log_validation:
-        aecg.validatorResults = aecg.validatorResults.append(
-            pd.DataFrame([valrow], columns=VALICOLS), ignore_index=True)
+        val_rows.append(valrow)
     if valrow["VALIOUT"] == "PASSED":
         logger.info(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'UUID found: {valrow["VALUE"]}')
+            '%s,%s,UUID found: %s',
+            aecg.filename, aecg.zipContainer, valrow["VALUE"])
         aecg.UUID = valrow["VALUE"]
     else:
         logger.critical(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'UUID not found')
+            '%s,%s,UUID not found',
+            aecg.filename, aecg.zipContainer)
 
-    valrow = validate_xpath(aecg_doc,
-                            "./*[local-name() = \"id\"]",
-                            "",
-                            "extension",
-                            new_validation_row(aecg.filename,
-                                               "GENERAL",
-                                               "UUID"))
+    valrow = _validate_found(id_nodes,
+                             "./*[local-name() = \"id\"]",
+                             "extension",
+                             new_row("GENERAL", "UUID"))
     if log_validation:
-        aecg.validatorResults = aecg.validatorResults.append(
-            pd.DataFrame([valrow], columns=VALICOLS), ignore_index=True)
+        val_rows.append(valrow)
     if valrow["VALIOUT"] == "PASSED":
         logger.debug(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'UUID extension found: {valrow["VALUE"]}')
+            '%s,%s,UUID extension found: %s',
+            aecg.filename, aecg.zipContainer, valrow["VALUE"])
         aecg.UUID += valrow["VALUE"]
         logger.info(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'UUID updated to: {aecg.UUID}')
+            '%s,%s,UUID updated to: %s',
+            aecg.filename, aecg.zipContainer, aecg.UUID)
     else:
         logger.debug(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'UUID extension not found')
+            '%s,%s,UUID extension not found',
+            aecg.filename, aecg.zipContainer)
 
     # =======================================
     # EGDTC
     # =======================================
-    valpd = pd.DataFrame()
     egdtc_found = False
-    for n in ["low", "center", "high"]:
-        valrow = validate_xpath(aecg_doc,
-                                "./*[local-name() = \"effectiveTime\"]/"
-                                "*[local-name() = \"" + n + "\"]",
-                                "",
-                                "value",
-                                new_validation_row(aecg.filename, "GENERAL",
-                                                   "EGDTC_" + n),
-                                "WARNING")
+    for n, epath, xpath, param in _EGDTC_LOOKUPS:
+        valrow = _validate_found(root.findall(epath),
+                                 xpath,
+                                 "value",
+                                 new_row("GENERAL", param),
+                                 "WARNING")
         if valrow["VALIOUT"] == "PASSED":
             egdtc_found = True
             logger.info(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'EGDTC {n} found: {valrow["VALUE"]}')
+                '%s,%s,EGDTC %s found: %s',
+                aecg.filename, aecg.zipContainer, n, valrow["VALUE"])
             aecg.EGDTC[n] = valrow["VALUE"]
         if log_validation:
-            valpd = valpd.append(pd.DataFrame([valrow], columns=VALICOLS),
-                                 ignore_index=True)
+            val_rows.append(valrow)
     if not egdtc_found:
         logger.critical(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'EGDTC not found')
-    if log_validation:
-        aecg.validatorResults = aecg.validatorResults.append(valpd,
-                                                             ignore_index=True)
+            '%s,%s,EGDTC not found',
+            aecg.filename, aecg.zipContainer)
 
     # =======================================
     # DEVICE
     # =======================================
     # DEVICE = {"manufacturer": "", "model": "", "software": ""}
 
-    valrow = validate_xpath(aecg_doc,
-                            "./component/series/author/"
-                            "seriesAuthor/manufacturerOrganization/name",
-                            "urn:hl7-org:v3",
-                            "",
-                            new_validation_row(aecg.filename, "GENERAL",
-                                               "DEVICE_manufacturer"),
-                            "WARNING")
-    if valrow["VALIOUT"] == "PASSED":
-        tmp = valrow["VALUE"].replace("\n", "|")
-        logger.info(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'DEVICE manufacturer found: {tmp}')
-        aecg.DEVICE["manufacturer"] = valrow["VALUE"]
-    else:
-        logger.warning(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'DEVICE manufacturer not found')
-    if log_validation:
-        aecg.validatorResults = aecg.validatorResults.append(
-            pd.DataFrame([valrow], columns=VALICOLS), ignore_index=True)
-
-    valrow = validate_xpath(aecg_doc,
-                            "./component/series/author/"
-                            "seriesAuthor/manufacturedSeriesDevice/"
-                            "manufacturerModelName",
-                            "urn:hl7-org:v3",
-                            "",
-                            new_validation_row(aecg.filename, "GENERAL",
-                                               "DEVICE_model"),
-                            "WARNING")
-    if valrow["VALIOUT"] == "PASSED":
-        tmp = valrow["VALUE"].replace("\n", "|")
-        logger.info(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'DEVICE model found: {tmp}')
-        aecg.DEVICE["model"] = valrow["VALUE"]
-    else:
-        logger.warning(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'DEVICE model not found')
-    if log_validation:
-        aecg.validatorResults = aecg.validatorResults.append(
-            pd.DataFrame([valrow], columns=VALICOLS), ignore_index=True)
+    author_nodes = root.findall(_SERIES_AUTHOR_ELEMPATH)
+    for n, path, tags in _DEVICE_FIELDS:
+        valrow = _validate_found(_find_path(author_nodes, tags),
+                                 _SERIES_AUTHOR_PATH + "/" + path,
+                                 "",
+                                 new_row("GENERAL", "DEVICE_" + n),
+                                 "WARNING")
+        if valrow["VALIOUT"] == "PASSED":
+            tmp = valrow["VALUE"].replace("\n", "|")
+            logger.info(
+                '%s,%s,DEVICE %s found: %s',
+                aecg.filename, aecg.zipContainer, n, tmp)
+            aecg.DEVICE[n] = valrow["VALUE"]
+        else:
+            logger.warning(
+                '%s,%s,DEVICE %s not found',
+                aecg.filename, aecg.zipContainer, n)
+        if log_validation:
+            val_rows.append(valrow)
 
-    valrow = validate_xpath(aecg_doc,
-                            "./component/series/author/"
-                            "seriesAuthor/manufacturedSeriesDevice/"
-                            "softwareName",
-                            "urn:hl7-org:v3",
-                            "",
-                            new_validation_row(aecg.filename, "GENERAL",
-                                               "DEVICE_software"),
-                            "WARNING")
-    if valrow["VALIOUT"] == "PASSED":
-        tmp = valrow["VALUE"].replace("\n", "|")
-        logger.info(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'DEVICE software found: {tmp}')
-        aecg.DEVICE["software"] = valrow["VALUE"]
-    else:
-        logger.warning(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'DEVICE software not found')
     if log_validation:
-        aecg.validatorResults = aecg.validatorResults.append(
-            pd.DataFrame([valrow], columns=VALICOLS), ignore_index=True)
-
+        _append_validation_rows(aecg, val_rows)
     return aecg
 
 
@@ -903,122 +1084,107 @@ def parse_subjectinfo(aecg_doc: etree._ElementTree,
     Returns:
         Aecg: `aecg` updated with the information found in the xml document.
     """
+    val_rows = []
+    new_row = _validation_row_factory(aecg.filename, log_validation)
     # =======================================
     # USUBJID
     # =======================================
-    valpd = pd.DataFrame()
+    subject_nodes = aecg_doc.getroot().findall(_TRIAL_SUBJECT_ELEMPATH)
+    person_nodes = _find_path(subject_nodes,
+                              (_T_SUBJECTDEMOGRAPHICPERSON,))
+    # root and extension are read from the same id node, looked up once
+    xpath = _TRIAL_SUBJECT_PATH + "/id"
+    nodes = _find_path(subject_nodes, (_T_ID,))
     for n in ["root", "extension"]:
-        valrow = validate_xpath(aecg_doc,
-                                "./componentOf/timepointEvent/componentOf/"
-                                "subjectAssignment/subject/trialSubject/id",
-                                "urn:hl7-org:v3",
-                                n,
-                                new_validation_row(aecg.filename,
-                                                   "SUBJECTINFO",
-                                                   "USUBJID_" + n))
+        valrow = _validate_found(nodes,
+                                 xpath,
+                                 n,
+                                 new_row("SUBJECTINFO", "USUBJID_" + n))
         if valrow["VALIOUT"] == "PASSED":
             logger.info(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'DM.USUBJID ID {n} found: {valrow["VALUE"]}')
+                '%s,%s,DM.USUBJID ID %s found: %s',
+                aecg.filename, aecg.zipContainer, n, valrow["VALUE"])
             aecg.USUBJID[n] = valrow["VALUE"]
         else:
             if n == "root":
                 logger.warning(
-                    f'{aecg.filename},{aecg.zipContainer},'
-                    f'DM.USUBJID ID {n} not found')
+                    '%s,%s,DM.USUBJID ID %s not found',
+                    aecg.filename, aecg.zipContainer, n)
             else:
                 logger.warning(
-                    f'{aecg.filename},{aecg.zipContainer},'
-                    f'DM.USUBJID ID {n} not found')
+                    '%s,%s,DM.USUBJID ID %s not found',
+                    aecg.filename, aecg.zipContainer, n)
         if log_validation:
-            valpd = valpd.append(pd.DataFrame([valrow], columns=VALICOLS),
-                                 ignore_index=True)
+            val_rows.append(valrow)
     if (aecg.USUBJID["root"] == "") and (aecg.USUBJID["extension"] == ""):
         logger.error(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'DM.USUBJID cannot be established.')
-
-    if log_validation:
-        aecg.validatorResults = aecg.validatorResults.append(valpd,
-                                                             ignore_index=True)
+            '%s,%s,DM.USUBJID cannot be established.',
+            aecg.filename, aecg.zipContainer)
 
     # =======================================
     # SEX / GENDER
     # =======================================
-    valrow = validate_xpath(aecg_doc,
-                            "./componentOf/timepointEvent/componentOf/"
-                            "subjectAssignment/subject/trialSubject/"
-                            "subjectDemographicPerson/"
-                            "administrativeGenderCode",
-                            "urn:hl7-org:v3",
-                            "code",
-                            new_validation_row(aecg.filename, "SUBJECTINFO",
-                                               "SEX"),
-                            failcat="WARNING")
+    valrow = _validate_found(
+        _find_path(person_nodes, (_T_ADMINISTRATIVEGENDERCODE,)),
+        _DEMOGRAPHIC_PERSON_PATH + "/administrativeGenderCode",
+        "code",
+        new_row("SUBJECTINFO", "SEX"),
+        failcat="WARNING")
     if valrow["VALIOUT"] == "PASSED":
         logger.info(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'DM.SEX found: {valrow["VALUE"]}')
+            '%s,%s,DM.SEX found: %s',
+            aecg.filename, aecg.zipContainer, valrow["VALUE"])
         aecg.SEX = valrow["VALUE"]
     else:
         logger.debug(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'DM.SEX not found')
+            '%s,%s,DM.SEX not found',
+            aecg.filename, aecg.zipContainer)
     if log_validation:
-        aecg.validatorResults = aecg.validatorResults.append(
-            pd.DataFrame([valrow], columns=VALICOLS), ignore_index=True)
+        val_rows.append(valrow)
 
     # =======================================
     # BIRTHTIME
     # =======================================
-    valrow = validate_xpath(aecg_doc,
-                            "./componentOf/timepointEvent/componentOf/"
-                            "subjectAssignment/subject/trialSubject/"
-                            "subjectDemographicPerson/birthTime",
-                            "urn:hl7-org:v3",
-                            "value",
-                            new_validation_row(aecg.filename, "SUBJECTINFO",
-                                               "BIRTHTIME"),
-                            failcat="WARNING")
+    valrow = _validate_found(_find_path(person_nodes, (_T_BIRTHTIME,)),
+                             _DEMOGRAPHIC_PERSON_PATH + "/birthTime",
+                             "value",
+                             new_row("SUBJECTINFO", "BIRTHTIME"),
+                             failcat="WARNING")
     if valrow["VALIOUT"] == "PASSED":
         logger.info(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'DM.BIRTHTIME found.')
+            '%s,%s,DM.BIRTHTIME found.',
+            aecg.filename, aecg.zipContainer)
         aecg.BIRTHTIME = valrow["VALUE"]
         # age_in_years = aecg.subject_age_in_years()
     else:
         logger.debug(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'DM.BIRTHTIME not found')
+            '%s,%s,DM.BIRTHTIME not found',
+            aecg.filename, aecg.zipContainer)
     if log_validation:
-        aecg.validatorResults = aecg.validatorResults.append(
-            pd.DataFrame([valrow], columns=VALICOLS), ignore_index=True)
+        val_rows.append(valrow)
 
     # =======================================
     # RACE
     # =======================================
-    valrow = validate_xpath(aecg_doc,
-                            "./componentOf/timepointEvent/componentOf/"
-                            "subjectAssignment/subject/trialSubject/"
-                            "subjectDemographicPerson/raceCode",
-                            "urn:hl7-org:v3",
-                            "code",
-                            new_validation_row(aecg.filename, "SUBJECTINFO",
-                                               "RACE"),
-                            failcat="WARNING")
+    valrow = _validate_found(_find_path(person_nodes, (_T_RACECODE,)),
+                             _DEMOGRAPHIC_PERSON_PATH + "/raceCode",
+                             "code",
+                             new_row("SUBJECTINFO", "RACE"),
+                             failcat="WARNING")
     if valrow["VALIOUT"] == "PASSED":
         logger.info(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'DM.RACE found:  {valrow["VALUE"]}')
+            '%s,%s,DM.RACE found:  %s',
+            aecg.filename, aecg.zipContainer, valrow["VALUE"])
     else:
         logger.debug(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'DM.RACE not found')
+            '%s,%s,DM.RACE not found',
+            aecg.filename, aecg.zipContainer)
         aecg.RACE = valrow["VALUE"]
     if log_validation:
-        aecg.validatorResults = aecg.validatorResults.append(
-            pd.DataFrame([valrow], columns=VALICOLS), ignore_index=True)
+        val_rows.append(valrow)
 
+    if log_validation:
+        _append_validation_rows(aecg, val_rows)
     return aecg
 
 
@@ -1040,28 +1206,30 @@ def parse_trtainfo(aecg_doc: etree._ElementTree,
     Returns:
         Aecg: `aecg` updated with the information found in the xml document.
     """
+    val_rows = []
+    new_row = _validation_row_factory(aecg.filename, log_validation)
     valrow = validate_xpath(aecg_doc,
                             "./componentOf/timepointEvent/componentOf/"
                             "subjectAssignment/definition/"
                             "treatmentGroupAssignment/code",
-                            "urn:hl7-org:v3",
+                            _NSURI,
                             "code",
-                            new_validation_row(aecg.filename, "STUDYINFO",
-                                               "TRTA"),
+                            new_row("STUDYINFO", "TRTA"),
                             failcat="WARNING")
     if valrow["VALIOUT"] == "PASSED":
         logger.info(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'TRTA information found: {valrow["VALUE"]}')
+            '%s,%s,TRTA information found: %s',
+            aecg.filename, aecg.zipContainer, valrow["VALUE"])
         aecg.TRTA = valrow["VALUE"]
     else:
         logger.debug(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'TRTA information not found')
+            '%s,%s,TRTA information not found',
+            aecg.filename, aecg.zipContainer)
     if log_validation:
-        aecg.validatorResults = aecg.validatorResults.append(
-            pd.DataFrame([valrow], columns=VALICOLS), ignore_index=True)
+        val_rows.append(valrow)
 
+    if log_validation:
+        _append_validation_rows(aecg, val_rows)
     return aecg
 
 
@@ -1084,58 +1252,54 @@ def parse_studyinfo(aecg_doc: etree._ElementTree,
     Returns:
         Aecg: `aecg` updated with the information found in the xml document.
     """
-    valpd = pd.DataFrame()
+    val_rows = []
+    new_row = _validation_row_factory(aecg.filename, log_validation)
+    # root and extension are read from the same id node, looked up once
+    xpath = "./componentOf/timepointEvent/componentOf/" \
+            "subjectAssignment/componentOf/clinicalTrial/id"
+    nodes = compiled_xpath(xpath, _NSURI)(aecg_doc)
     for n in ["root", "extension"]:
-        valrow = validate_xpath(aecg_doc,
-                                "./componentOf/timepointEvent/componentOf/"
-                                "subjectAssignment/componentOf/"
-                                "clinicalTrial/id",
-                                "urn:hl7-org:v3",
-                                n,
-                                new_validation_row(aecg.filename,
-                                                   "STUDYINFO",
-                                                   "STUDYID_" + n),
-                                failcat="WARNING")
+        valrow = _validate_found(nodes,
+                                 xpath,
+                                 n,
+                                 new_row("STUDYINFO", "STUDYID_" + n),
+                                 failcat="WARNING")
         if valrow["VALIOUT"] == "PASSED":
             logger.info(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'STUDYID {n} found: {valrow["VALUE"]}')
+                '%s,%s,STUDYID %s found: %s',
+                aecg.filename, aecg.zipContainer, n, valrow["VALUE"])
             aecg.STUDYID[n] = valrow["VALUE"]
         else:
             logger.debug(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'STUDYID {n} not found')
+                '%s,%s,STUDYID %s not found',
+                aecg.filename, aecg.zipContainer, n)
         if log_validation:
-            valpd = valpd.append(pd.DataFrame([valrow], columns=VALICOLS),
-                                 ignore_index=True)
-    if log_validation:
-        aecg.validatorResults = \
-            aecg.validatorResults.append(valpd, ignore_index=True)
+            val_rows.append(valrow)
 
     valrow = validate_xpath(aecg_doc,
                             "./componentOf/timepointEvent/componentOf/"
                             "subjectAssignment/componentOf/"
                             "clinicalTrial/title",
-                            "urn:hl7-org:v3",
+                            _NSURI,
                             "",
-                            new_validation_row(aecg.filename, "STUDYINFO",
-                                               "STUDYTITLE"),
+                            new_row("STUDYINFO", "STUDYTITLE"),
                             failcat="WARNING")
     if valrow["VALIOUT"] == "PASSED":
         tmp = valrow["VALUE"].replace("\n", "")
         logger.info(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'STUDYTITLE found: {tmp}')
+            '%s,%s,STUDYTITLE found: %s',
+            aecg.filename, aecg.zipContainer, tmp)
         aecg.STUDYTITLE = valrow["VALUE"]
     else:
         logger.debug(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'STUDYTITLE not found')
+            '%s,%s,STUDYTITLE not found',
+            aecg.filename, aecg.zipContainer)
 
     if log_validation:
-        aecg.validatorResults = aecg.validatorResults.append(
-            pd.DataFrame([valrow], columns=VALICOLS), ignore_index=True)
+        val_rows.append(valrow)
 
+    if log_validation:
+        _append_validation_rows(aecg, val_rows)
     return aecg
 
 
@@ -1159,359 +1323,31 @@ def parse_timepoints(aecg_doc: etree._ElementTree,
     Returns:
         Aecg: `aecg` updated with the information found in the xml document.
     """
-    # =======================================
-    # TPT
-    # =======================================
-    valpd = pd.DataFrame()
-    for n in ["code", "displayName"]:
-        valrow = validate_xpath(aecg_doc,
-                                "./componentOf/timepointEvent/code",
-                                "urn:hl7-org:v3",
-                                n,
-                                new_validation_row(aecg.filename,
-                                                   "STUDYINFO",
-                                                   "TPT_" + n),
-                                failcat="WARNING")
-        if valrow["VALIOUT"] == "PASSED":
-            logger.info(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'TPT {n} found: {valrow["VALUE"]}')
-            aecg.TPT[n] = valrow["VALUE"]
-        else:
-            logger.debug(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'TPT {n} not found')
-        if log_validation:
-            valpd = valpd.append(pd.DataFrame([valrow], columns=VALICOLS),
-                                 ignore_index=True)
-    if log_validation:
-        aecg.validatorResults = \
-            aecg.validatorResults.append(valpd, ignore_index=True)
-
-    valrow = validate_xpath(aecg_doc,
-                            "./componentOf/timepointEvent/reasonCode",
-                            "urn:hl7-org:v3",
-                            "code",
-                            new_validation_row(aecg.filename, "STUDYINFO",
-                                               "TPT_reasonCode"),
-                            failcat="WARNING")
-    if valrow["VALIOUT"] == "PASSED":
-        logger.info(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'TPT reasonCode found: {valrow["VALUE"]}')
-        aecg.TPT["reasonCode"] = valrow["VALUE"]
-    else:
-        logger.debug(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'TPT reasonCode not found')
-    if log_validation:
-        aecg.validatorResults = aecg.validatorResults.append(
-            pd.DataFrame([valrow], columns=VALICOLS), ignore_index=True)
-
-    valpd = pd.DataFrame()
-    for n in ["low", "high"]:
-        valrow = validate_xpath(aecg_doc,
-                                "./componentOf/timepointEvent/"
-                                "effectiveTime/" + n,
-                                "urn:hl7-org:v3",
-                                "value",
-                                new_validation_row(aecg.filename,
-                                                   "STUDYINFO",
-                                                   "TPT_" + n),
-                                failcat="WARNING")
-        if valrow["VALIOUT"] == "PASSED":
-            logger.info(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'TPT {n} found: {valrow["VALUE"]}')
-            aecg.TPT[n] = valrow["VALUE"]
-        else:
-            logger.debug(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'TPT {n} not found')
-        if log_validation:
-            valpd = valpd.append(pd.DataFrame([valrow], columns=VALICOLS),
-                                 ignore_index=True)
-    if log_validation:
-        aecg.validatorResults = \
-            aecg.validatorResults.append(valpd, ignore_index=True)
-
-    # =======================================
-    # RTPT
-    # =======================================
-    valpd = pd.DataFrame()
-    for n in ["code", "displayName"]:
-        valrow = validate_xpath(aecg_doc,
-                                "./definition/relativeTimepoint/code",
-                                "urn:hl7-org:v3",
-                                "code",
-                                new_validation_row(aecg.filename,
-                                                   "STUDYINFO",
-                                                   "RTPT_" + n),
-                                failcat="WARNING")
-        if valrow["VALIOUT"] == "PASSED":
-            logger.info(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'RTPT {n} found: {valrow["VALUE"]}')
-            aecg.RTPT[n] = valrow["VALUE"]
-        else:
-            logger.debug(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'RTPT {n} not found')
-        if log_validation:
-            valpd = valpd.append(pd.DataFrame([valrow], columns=VALICOLS),
-                                 ignore_index=True)
-    if log_validation:
-        aecg.validatorResults = \
-            aecg.validatorResults.append(valpd, ignore_index=True)
-
-    valrow = validate_xpath(aecg_doc,
-                            "./definition/relativeTimepoint/componentOf/"
-                            "pauseQuantity",
-                            "urn:hl7-org:v3",
-                            "value",
-                            new_validation_row(aecg.filename, "STUDYINFO",
-                                               "RTPT_pauseQuantity"),
-                            failcat="WARNING")
-    if valrow["VALIOUT"] == "PASSED":
-        logger.info(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'RTPT pauseQuantity value found: {valrow["VALUE"]}')
-        aecg.RTPT["pauseQuantity"] = valrow["VALUE"]
-    else:
-        logger.debug(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'RTPT pauseQuantity value not found')
-    if log_validation:
-        aecg.validatorResults = \
-            aecg.validatorResults.append(pd.DataFrame([valrow],
-                                                      columns=VALICOLS),
-                                         ignore_index=True)
-
-    valrow = validate_xpath(aecg_doc,
-                            "./definition/relativeTimepoint/componentOf/"
-                            "pauseQuantity",
-                            "urn:hl7-org:v3",
-                            "unit",
-                            new_validation_row(aecg.filename, "STUDYINFO",
-                                               "RTPT_pauseQuantity_unit"),
-                            failcat="WARNING")
-    if valrow["VALIOUT"] == "PASSED":
-        logger.info(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'RTPT pauseQuantity unit found: {valrow["VALUE"]}')
-        aecg.RTPT["pauseQuantity_unit"] = valrow["VALUE"]
-    else:
-        logger.debug(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'RTPT pauseQuantity unit not found')
-    if log_validation:
-        aecg.validatorResults = \
-            aecg.validatorResults.append(pd.DataFrame([valrow],
-                                                      columns=VALICOLS),
-                                         ignore_index=True)
-
-    # =======================================
-    # PTPT
-    # =======================================
-    valpd = pd.DataFrame()
-    for n in ["code", "displayName"]:
-        valrow = validate_xpath(aecg_doc,
-                                "./definition/relativeTimepoint/"
-                                "componentOf/protocolTimepointEvent/code",
-                                "urn:hl7-org:v3",
-                                n,
-                                new_validation_row(aecg.filename,
-                                                   "STUDYINFO",
-                                                   "PTPT_" + n),
-                                failcat="WARNING")
-        if valrow["VALIOUT"] == "PASSED":
-            logger.info(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'PTPT {n} found: {valrow["VALUE"]}')
-            aecg.PTPT[n] = valrow["VALUE"]
-        else:
-            logger.debug(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'PTPT {n} not found')
-        if log_validation:
-            valpd = valpd.append(pd.DataFrame([valrow], columns=VALICOLS),
-                                 ignore_index=True)
-    if log_validation:
-        aecg.validatorResults = \
-            aecg.validatorResults.append(valpd, ignore_index=True)
-
-    valrow = validate_xpath(aecg_doc,
-                            "./definition/relativeTimepoint/componentOf/"
-                            "protocolTimepointEvent/component/"
-                            "referenceEvent/code",
-                            "urn:hl7-org:v3",
-                            "code",
-                            new_validation_row(aecg.filename, "STUDYINFO",
-                                               "PTPT_referenceEvent"),
-                            failcat="WARNING")
-    if valrow["VALIOUT"] == "PASSED":
-        logger.info(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'PTPT referenceEvent code found: {valrow["VALUE"]}')
-        aecg.PTPT["referenceEvent"] = valrow["VALUE"]
-    else:
-        logger.debug(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'PTPT referenceEvent code not found')
-    if log_validation:
-        aecg.validatorResults = \
-            aecg.validatorResults.append(pd.DataFrame([valrow],
-                                                      columns=VALICOLS),
-                                         ignore_index=True)
-
-    valrow = validate_xpath(aecg_doc,
-                            "./definition/relativeTimepoint/componentOf/"
-                            "protocolTimepointEvent/component/"
-                            "referenceEvent/code",
-                            "urn:hl7-org:v3",
-                            "displayName",
-                            new_validation_row(aecg.filename, "STUDYINFO",
-                                               "PTPT_referenceEvent_"
-                                               "displayName"),
-                            failcat="WARNING")
-    if valrow["VALIOUT"] == "PASSED":
-        logger.info(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'PTPT referenceEvent displayName found: '
-            f'{valrow["VALUE"]}')
-        aecg.PTPT["referenceEvent_displayName"] = valrow["VALUE"]
-    else:
-        logger.debug(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'PTPT referenceEvent displayName not found')
-    if log_validation:
-        aecg.validatorResults = \
-            aecg.validatorResults.append(pd.DataFrame([valrow],
-                                                      columns=VALICOLS),
-                                         ignore_index=True)
-    return aecg
+    return _parse_info_fields(aecg_doc, aecg, _TIMEPOINT_FIELDS,
+                              log_validation)
 
 
 def parse_rhythm_waveform_info(aecg_doc: etree._ElementTree,
-                               aecg: Aecg,
-                               log_validation: bool = False) -> Aecg:
-    """Parses `aecg_doc` XML document and extracts rhythm waveform information
-
-    This function parses the `aecg_doc` xml document searching for rhythm
-    waveform information that includes in the returned `Aecg`: waveform
-    identifier, code, display name, and date and time of collection.
-
-    Args:
-        aecg_doc (etree._ElementTree): aECG XML document
-        aecg (Aecg): The aECG object to update
-        log_validation (bool, optional): Indicates whether to maintain the
-            validation results in `aecg.validatorResults`. Defaults to
-            False.
-
-    Returns:
-        Aecg: `aecg` updated with the information found in the xml document.
-    """
-    valpd = pd.DataFrame()
-    for n in ["root", "extension"]:
-        valrow = validate_xpath(aecg_doc,
-                                "./component/series/id",
-                                "urn:hl7-org:v3",
-                                n,
-                                new_validation_row(aecg.filename, "RHYTHM",
-                                                   "ID_" + n),
-                                failcat="WARNING")
-        if valrow["VALIOUT"] == "PASSED":
-            logger.info(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'RHYTHM ID {n} found: {valrow["VALUE"]}')
-            aecg.RHYTHMID[n] = valrow["VALUE"]
-        else:
-            if n == "root":
-                logger.warning(
-                    f'{aecg.filename},{aecg.zipContainer},'
-                    f'RHYTHM ID {n} not found')
-            else:
-                logger.warning(
-                    f'{aecg.filename},{aecg.zipContainer},'
-                    f'RHYTHM ID {n} not found')
-        if log_validation:
-            valpd = valpd.append(pd.DataFrame([valrow], columns=VALICOLS),
-                                 ignore_index=True)
-    if log_validation:
-        aecg.validatorResults = \
-            aecg.validatorResults.append(valpd, ignore_index=True)
-
-    valrow = validate_xpath(aecg_doc,
-                            "./component/series/code",
-                            "urn:hl7-org:v3",
-                            "code",
-                            new_validation_row(aecg.filename, "RHYTHM",
-                                               "CODE"),
-                            failcat="WARNING")
-    if valrow["VALIOUT"] == "PASSED":
-        logger.debug(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'RHYTHM code found: {valrow["VALUE"]}')
-        aecg.RHYTHMCODE["code"] = valrow["VALUE"]
-        if aecg.RHYTHMCODE["code"] != "RHYTHM":
-            logger.warning(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'RHYTHM unexpected code found: {valrow["VALUE"]}')
-            valrow["VALIOUT"] = "WARNING"
-            valrow["VALIMSG"] = "Unexpected value found"
-    else:
-        logger.warning(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'RHYTHM code not found')
-    if log_validation:
-        aecg.validatorResults = aecg.validatorResults.append(
-            pd.DataFrame([valrow], columns=VALICOLS), ignore_index=True)
+                               aecg: Aecg,
+                               log_validation: bool = False) -> Aecg:
+    """Parses `aecg_doc` XML document and extracts rhythm waveform information
 
-    valrow = validate_xpath(aecg_doc,
-                            "./component/series/code",
-                            "urn:hl7-org:v3",
-                            "displayName",
-                            new_validation_row(aecg.filename, "RHYTHM",
-                                               "CODE_displayName"),
-                            failcat="WARNING")
-    if valrow["VALIOUT"] == "PASSED":
-        logger.debug(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'RHYTHM displayName found: {valrow["VALUE"]}')
-        aecg.RHYTHMCODE["displayName"] = valrow["VALUE"]
-    else:
-        logger.debug(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'RHYTHM displayName not found')
-    if log_validation:
-        aecg.validatorResults = aecg.validatorResults.append(
-            pd.DataFrame([valrow], columns=VALICOLS), ignore_index=True)
-
-    valpd = pd.DataFrame()
-    for n in ["low", "high"]:
-        valrow = validate_xpath(aecg_doc,
-                                "./component/series/effectiveTime/" + n,
-                                "urn:hl7-org:v3",
-                                "value",
-                                new_validation_row(aecg.filename, "RHYTHM",
-                                                   "EGDTC_" + n),
-                                failcat="WARNING")
-        if valrow["VALIOUT"] == "PASSED":
-            logger.info(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'RHYTHMEGDTC {n} found: {valrow["VALUE"]}')
-            aecg.RHYTHMEGDTC[n] = valrow["VALUE"]
-        else:
-            logger.debug(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'RHYTHMEGDTC {n} not found')
-        if log_validation:
-            valpd = valpd.append(pd.DataFrame([valrow], columns=VALICOLS),
-                                 ignore_index=True)
-    if log_validation:
-        aecg.validatorResults = \
-            aecg.validatorResults.append(valpd, ignore_index=True)
-    return aecg
+    This function parses the `aecg_doc` xml document searching for rhythm
+    waveform information that includes in the returned `Aecg`: waveform
+    identifier, code, display name, and date and time of collection.
+
+    Args:
+        aecg_doc (etree._ElementTree): aECG XML document
+        aecg (Aecg): The aECG object to update
+        log_validation (bool, optional): Indicates whether to maintain the
+            validation results in `aecg.validatorResults`. Defaults to
+            False.
+
+    Returns:
+        Aecg: `aecg` updated with the information found in the xml document.
+    """
+    return _parse_info_fields(aecg_doc, aecg, _RHYTHM_INFO_FIELDS,
+                              log_validation)
 
 
 def parse_derived_waveform_info(aecg_doc: etree._ElementTree,
@@ -1533,112 +1369,8 @@ def parse_derived_waveform_info(aecg_doc: etree._ElementTree,
     Returns:
         Aecg: `aecg` updated with the information found in the xml document.
     """
-    valpd = pd.DataFrame()
-    for n in ["root", "extension"]:
-        valrow = validate_xpath(aecg_doc,
-                                "./component/series/derivation/"
-                                "derivedSeries/id",
-                                "urn:hl7-org:v3",
-                                n,
-                                new_validation_row(aecg.filename, "DERIVED",
-                                                   "ID_" + n),
-                                failcat="WARNING")
-        if valrow["VALIOUT"] == "PASSED":
-            logger.info(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'DERIVED ID {n} found: {valrow["VALUE"]}')
-            aecg.DERIVEDID[n] = valrow["VALUE"]
-        else:
-            if n == "root":
-                logger.warning(
-                    f'{aecg.filename},{aecg.zipContainer},'
-                    f'DERIVED ID {n} not found')
-            else:
-                logger.warning(
-                    f'{aecg.filename},{aecg.zipContainer},'
-                    f'DERIVED ID {n} not found')
-        if log_validation:
-            valpd = valpd.append(pd.DataFrame([valrow], columns=VALICOLS),
-                                 ignore_index=True)
-    if log_validation:
-        aecg.validatorResults = \
-            aecg.validatorResults.append(valpd, ignore_index=True)
-
-    valrow = validate_xpath(aecg_doc,
-                            "./component/series/derivation/"
-                            "derivedSeries/code",
-                            "urn:hl7-org:v3",
-                            "code",
-                            new_validation_row(aecg.filename, "DERIVED",
-                                               "CODE"),
-                            failcat="WARNING")
-    if valrow["VALIOUT"] == "PASSED":
-        logger.debug(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'DERIVED code found: {valrow["VALUE"]}')
-        aecg.DERIVEDCODE["code"] = valrow["VALUE"]
-        if aecg.DERIVEDCODE["code"] != "REPRESENTATIVE_BEAT":
-            logger.warning(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'DERIVED unexpected code found: {valrow["VALUE"]}')
-            valrow["VALIOUT"] = "WARNING"
-            valrow["VALIMSG"] = "Unexpected value found"
-    else:
-        logger.warning(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'DERIVED code not found')
-    if log_validation:
-        aecg.validatorResults = aecg.validatorResults.append(
-            pd.DataFrame([valrow], columns=VALICOLS), ignore_index=True)
-
-    valrow = validate_xpath(aecg_doc,
-                            "./component/series/derivation/"
-                            "derivedSeries/code",
-                            "urn:hl7-org:v3",
-                            "displayName",
-                            new_validation_row(aecg.filename, "DERIVED",
-                                               "CODE_displayName"),
-                            failcat="WARNING")
-    if valrow["VALIOUT"] == "PASSED":
-        logger.debug(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'DERIVED displayName found: {valrow["VALUE"]}')
-        aecg.DERIVEDCODE["displayName"] = valrow["VALUE"]
-    else:
-        logger.debug(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'DERIVED displayName not found')
-    if log_validation:
-        aecg.validatorResults = aecg.validatorResults.append(
-            pd.DataFrame([valrow], columns=VALICOLS), ignore_index=True)
-
-    valpd = pd.DataFrame()
-    for n in ["low", "high"]:
-        valrow = validate_xpath(aecg_doc,
-                                "./component/series/derivation/"
-                                "derivedSeries/effectiveTime/" + n,
-                                "urn:hl7-org:v3",
-                                "value",
-                                new_validation_row(aecg.filename, "DERIVED",
-                                                   "EGDTC_" + n),
-                                failcat="WARNING")
-        if valrow["VALIOUT"] == "PASSED":
-            logger.info(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'DERIVEDEGDTC {n} found: {valrow["VALUE"]}')
-            aecg.DERIVEDEGDTC[n] = valrow["VALUE"]
-        else:
-            logger.debug(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'DERIVEDEGDTC {n} not found')
-        if log_validation:
-            valpd = valpd.append(pd.DataFrame([valrow], columns=VALICOLS),
-                                 ignore_index=True)
-    if log_validation:
-        aecg.validatorResults = \
-            aecg.validatorResults.append(valpd, ignore_index=True)
-
-    return aecg
+    return _parse_info_fields(aecg_doc, aecg, _DERIVED_INFO_FIELDS,
+                              log_validation)
 
 
 def parse_rhythm_waveform_timeseries(aecg_doc: etree._ElementTree,
@@ -1664,126 +1396,120 @@ def parse_rhythm_waveform_timeseries(aecg_doc: etree._ElementTree,
     Returns:
         Aecg: `aecg` updated with the information found in the xml document.
     """
-    path_prefix = './component/series/component/sequenceSet/' \
-                  'component/sequence'
-    seqnodes = aecg_doc.xpath((path_prefix + '/code').replace('/', '/ns:'),
-                              namespaces={'ns': 'urn:hl7-org:v3'})
+    val_rows = []
+    new_row = _validation_row_factory(aecg.filename, log_validation)
+    seqnodes = aecg_doc.getroot().findall(_RHYTHM_SEQUENCE_CODE_PATH)
     if len(seqnodes) > 0:
         logger.info(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'RHYTHM sequenceSet(s) found: '
-            f'{len(seqnodes)} sequenceSet nodes')
+            '%s,%s,RHYTHM sequenceSet(s) found: %s sequenceSet nodes',
+            aecg.filename, aecg.zipContainer, len(seqnodes))
+        if not include_digits:
+            logger.info(
+                '%s,%s,DIGITS were not requested by the user',
+                aecg.filename, aecg.zipContainer)
     else:
         logger.warning(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'RHYTHM sequenceSet not found')
+            '%s,%s,RHYTHM sequenceSet not found',
+            aecg.filename, aecg.zipContainer)
 
     for xmlnode in seqnodes:
-        xmlnode_path = aecg_doc.getpath(xmlnode)
-        valrow = validate_xpath(aecg_doc,
-                                xmlnode_path,
-                                "urn:hl7-org:v3",
-                                "code",
-                                new_validation_row(aecg.filename, "RHYTHM",
-                                                   "SEQUENCE_CODE"),
-                                failcat="WARNING")
-        valpd = pd.DataFrame()
+        # The sequence values are looked up from the sequence node itself;
+        # the absolute path of the code node is only needed for the XPATH
+        # column of the validation rows
+        seqnode = xmlnode.getparent()
+        if log_validation:
+            xmlnode_path = aecg_doc.getpath(xmlnode)
+            xpath_prefix = xmlnode_path + "/"
+        else:
+            xmlnode_path = xpath_prefix = ""
+        valrow = _validate_found([xmlnode],
+                                 xmlnode_path,
+                                 "code",
+                                 new_row("RHYTHM", "SEQUENCE_CODE"),
+                                 failcat="WARNING")
+        seq_rows = []
         if valrow["VALIOUT"] == "PASSED":
-            if not valrow["VALUE"] in SEQUENCE_CODES:
+            seqcode = valrow["VALUE"]
+            if seqcode not in SEQUENCE_CODES:
                 logger.warning(
-                    f'{aecg.filename},{aecg.zipContainer},'
-                    f'RHYTHM unexpected sequenceSet code '
-                    f'found: {valrow["VALUE"]}')
+                    '%s,%s,RHYTHM unexpected sequenceSet code found: %s',
+                    aecg.filename, aecg.zipContainer, seqcode)
                 valrow["VALIOUT"] = "WARNING"
                 valrow["VALIMSG"] = "Unexpected sequence code found"
-            if valrow["VALUE"] in TIME_CODES:
+            if seqcode in TIME_CODES:
                 logger.info(
-                    f'{aecg.filename},{aecg.zipContainer},'
-                    f'RHYTHM sequenceSet code found: {valrow["VALUE"]}')
-                aecg.RHYTHMTIME["code"] = valrow["VALUE"]
+                    '%s,%s,RHYTHM sequenceSet code found: %s',
+                    aecg.filename, aecg.zipContainer, seqcode)
+                aecg.RHYTHMTIME["code"] = seqcode
                 # Retrieve time head info from value node
                 rel_path = "../value/head"
-                valrow2 = validate_xpath(
-                    xmlnode,
-                    rel_path,
-                    "urn:hl7-org:v3",
+                valrow2 = _validate_found(
+                    seqnode.findall(_SEQUENCE_VALUE_PATHS[rel_path]),
+                    xpath_prefix + rel_path,
                     "value",
-                    new_validation_row(
-                        aecg.filename, "RHYTHM", "SEQUENCE_TIME_HEAD"),
+                    new_row("RHYTHM", "SEQUENCE_TIME_HEAD"),
                     failcat="WARNING")
-                valrow2["XPATH"] = xmlnode_path + "/" + rel_path
                 if valrow2["VALIOUT"] == "PASSED":
                     logger.info(
-                        f'{aecg.filename},{aecg.zipContainer},'
-                        f'RHYTHM SEQUENCE_TIME_HEAD found: {valrow2["VALUE"]}')
+                        '%s,%s,RHYTHM SEQUENCE_TIME_HEAD found: %s',
+                        aecg.filename, aecg.zipContainer, valrow2["VALUE"])
                     aecg.RHYTHMTIME["head"] = valrow2["VALUE"]
                 else:
                     logger.debug(
-                        f'{aecg.filename},{aecg.zipContainer},'
-                        f'RHYTHM SEQUENCE_TIME_HEAD not found')
+                        '%s,%s,RHYTHM SEQUENCE_TIME_HEAD not found',
+                        aecg.filename, aecg.zipContainer)
                 if log_validation:
-                    valpd = valpd.append(
-                        pd.DataFrame([valrow2], columns=VALICOLS),
-                        ignore_index=True)
+                    seq_rows.append(valrow2)
                 # Retrieve time increment info from value node
                 rel_path = "../value/increment"
+                nodes = seqnode.findall(_SEQUENCE_VALUE_PATHS[rel_path])
                 for n in ["value", "unit"]:
-                    valrow2 = validate_xpath(
-                        xmlnode,
-                        rel_path,
-                        "urn:hl7-org:v3",
+                    valrow2 = _validate_found(
+                        nodes,
+                        xpath_prefix + rel_path,
                         n,
-                        new_validation_row(
-                            aecg.filename, "RHYTHM", "SEQUENCE_TIME_" + n),
+                        new_row("RHYTHM", "SEQUENCE_TIME_" + n),
                         failcat="WARNING")
-                    valrow2["XPATH"] = xmlnode_path + "/" + rel_path
                     if valrow2["VALIOUT"] == "PASSED":
                         logger.info(
-                            f'{aecg.filename},{aecg.zipContainer},'
-                            f'RHYTHM SEQUENCE_TIME_{n} found: '
-                            f'{valrow2["VALUE"]}')
+                            '%s,%s,RHYTHM SEQUENCE_TIME_%s found: %s',
+                            aecg.filename, aecg.zipContainer, n,
+                            valrow2["VALUE"])
                         if n == "value":
                             aecg.RHYTHMTIME["increment"] = float(
                                 valrow2["VALUE"])
                         else:
                             aecg.RHYTHMTIME[n] = valrow2["VALUE"]
                     if log_validation:
-                        valpd = \
-                            valpd.append(pd.DataFrame([valrow2],
-                                                      columns=VALICOLS),
-                                         ignore_index=True)
+                        seq_rows.append(valrow2)
             else:
                 logger.info(
-                    f'{aecg.filename},{aecg.zipContainer},'
-                    f'RHYTHM sequenceSet code found: '
-                    f'{valrow["VALUE"]}')
+                    '%s,%s,RHYTHM sequenceSet code found: %s',
+                    aecg.filename, aecg.zipContainer, seqcode)
                 logger.info(
-                    f'{aecg.filename},{aecg.zipContainer},'
-                    f'LEADNAME from RHYTHM sequenceSet code: '
-                    f'{valrow["VALUE"]}')
+                    '%s,%s,LEADNAME from RHYTHM sequenceSet code: %s',
+                    aecg.filename, aecg.zipContainer, seqcode)
                 # Assume is a lead
                 aecglead = AecgLead()
-                aecglead.leadname = valrow["VALUE"]
-                # Inherit last parsed RHYTHMTIME
-                aecglead.LEADTIME = copy.deepcopy(aecg.RHYTHMTIME)
+                aecglead.leadname = seqcode
+                # Inherit last parsed RHYTHMTIME (a flat dict of scalars, so
+                # a shallow copy is enough)
+                aecglead.LEADTIME = dict(aecg.RHYTHMTIME)
                 # Retrive lead origin info
                 rel_path = "../value/origin"
+                nodes = seqnode.findall(_SEQUENCE_VALUE_PATHS[rel_path])
                 for n in ["value", "unit"]:
-                    valrow2 = validate_xpath(
-                        xmlnode,
-                        rel_path,
-                        "urn:hl7-org:v3",
+                    valrow2 = _validate_found(
+                        nodes,
+                        xpath_prefix + rel_path,
                         n,
-                        new_validation_row(
-                            aecg.filename, "RHYTHM",
-                            "SEQUENCE_LEAD_ORIGIN_" + n),
+                        new_row("RHYTHM", "SEQUENCE_LEAD_ORIGIN_" + n),
                         failcat="WARNING")
-                    valrow2["XPATH"] = xmlnode_path + "/" + rel_path
                     if valrow2["VALIOUT"] == "PASSED":
                         logger.info(
-                            f'{aecg.filename},{aecg.zipContainer},'
-                            f'RHYTHM SEQUENCE_LEAD_ORIGIN_{n} '
-                            f'found: {valrow2["VALUE"]}')
+                            '%s,%s,RHYTHM SEQUENCE_LEAD_ORIGIN_%s found: %s',
+                            aecg.filename, aecg.zipContainer, n,
+                            valrow2["VALUE"])
                         if n == "value":
                             try:
                                 aecglead.origin = float(valrow2["VALUE"])
@@ -1796,38 +1522,33 @@ def parse_rhythm_waveform_timeseries(aecg_doc: etree._ElementTree,
                             aecglead.origin_unit = valrow2["VALUE"]
                     else:
                         logger.debug(
-                            f'{aecg.filename},{aecg.zipContainer},'
-                            f'RHYTHM SEQUENCE_LEAD_ORIGIN_{n} not found')
+                            '%s,%s,RHYTHM SEQUENCE_LEAD_ORIGIN_%s not found',
+                            aecg.filename, aecg.zipContainer, n)
                     if log_validation:
-                        valpd = valpd.append(
-                            pd.DataFrame([valrow2], columns=VALICOLS),
-                            ignore_index=True)
+                        seq_rows.append(valrow2)
                 # Retrive lead scale info
                 rel_path = "../value/scale"
+                nodes = seqnode.findall(_SEQUENCE_VALUE_PATHS[rel_path])
                 for n in ["value", "unit"]:
-                    valrow2 = validate_xpath(
-                        xmlnode,
-                        rel_path,
-                        "urn:hl7-org:v3",
+                    valrow2 = _validate_found(
+                        nodes,
+                        xpath_prefix + rel_path,
                         n,
-                        new_validation_row(
-                            aecg.filename, "RHYTHM",
-                            "SEQUENCE_LEAD_SCALE_" + n),
+                        new_row("RHYTHM", "SEQUENCE_LEAD_SCALE_" + n),
                         failcat="WARNING")
-                    valrow2["XPATH"] = xmlnode_path + "/" + rel_path
                     if valrow2["VALIOUT"] == "PASSED":
                         logger.info(
-                            f'{aecg.filename},{aecg.zipContainer},'
-                            f'RHYTHM SEQUENCE_LEAD_SCALE_{n} '
-                            f'found: {valrow2["VALUE"]}')
+                            '%s,%s,RHYTHM SEQUENCE_LEAD_SCALE_%s found: %s',
+                            aecg.filename, aecg.zipContainer, n,
+                            valrow2["VALUE"])
                         if n == "value":
                             try:
                                 aecglead.scale = float(valrow2["VALUE"])
                             except Exception as ex:
                                 logger.error(
-                                    f'{aecg.filename},{aecg.zipContainer},'
-                                    f'RHYTHM SEQUENCE_LEAD_SCALE '
-                                    f'value is not a valid number: \"{ex}\"')
+                                    '%s,%s,RHYTHM SEQUENCE_LEAD_SCALE value '
+                                    'is not a valid number: "%s"',
+                                    aecg.filename, aecg.zipContainer, ex)
                                 valrow2["VALIOUT"] == "ERROR"
                                 valrow2["VALIMSG"] = "SEQUENCE_LEAD_"\
                                                      "SCALE is not a "\
@@ -1836,79 +1557,56 @@ def parse_rhythm_waveform_timeseries(aecg_doc: etree._ElementTree,
                             aecglead.scale_unit = valrow2["VALUE"]
                     else:
                         logger.debug(
-                            f'{aecg.filename},{aecg.zipContainer},'
-                            f'RHYTHM SEQUENCE_LEAD_SCALE_{n} not found')
+                            '%s,%s,RHYTHM SEQUENCE_LEAD_SCALE_%s not found',
+                            aecg.filename, aecg.zipContainer, n)
                     if log_validation:
-                        valpd = valpd.append(
-                            pd.DataFrame([valrow2], columns=VALICOLS),
-                            ignore_index=True)
+                        seq_rows.append(valrow2)
                 # Include digits if requested
                 if include_digits:
                     rel_path = "../value/digits"
-                    valrow2 = validate_xpath(
-                        xmlnode,
-                        rel_path,
-                        "urn:hl7-org:v3",
+                    valrow2 = _validate_found(
+                        seqnode.findall(_SEQUENCE_VALUE_PATHS[rel_path]),
+                        xpath_prefix + rel_path,
                         "",
-                        new_validation_row(
-                            aecg.filename, "RHYTHM", "SEQUENCE_LEAD_DIGITS"),
+                        new_row("RHYTHM", "SEQUENCE_LEAD_DIGITS"),
                         failcat="WARNING")
-                    valrow2["XPATH"] = xmlnode_path + "/" + rel_path
                     if valrow2["VALIOUT"] == "PASSED":
                         try:
-                            # Convert string of digits to list of integers
-                            # remove new lines
-                            sdigits = valrow2["VALUE"].replace("\n", " ")
-                            # remove carriage retruns
-                            sdigits = sdigits.replace("\r", " ")
-                            # remove tabs
-                            sdigits = sdigits.replace("\t", " ")
-                            # collapse 2 or more spaces into 1 space char
-                            # and remove leading/trailing white spaces
-                            sdigits = re.sub("\\s+", " ", sdigits).strip()
-                            # Convert string into list of integers
-                            aecglead.digits = [int(s) for s in
-                                               sdigits.split(' ')]
+                            # Convert string of digits to array of integers
+                            aecglead.digits = _parse_digits(valrow2["VALUE"])
                             logger.info(
-                                f'{aecg.filename},{aecg.zipContainer},'
-                                f'DIGITS added to lead'
-                                f' {aecglead.leadname} (n: '
-                                f'{len(aecglead.digits)})')
+                                '%s,%s,DIGITS added to lead %s (n: %s)',
+                                aecg.filename, aecg.zipContainer,
+                                aecglead.leadname, len(aecglead.digits))
                         except Exception as ex:
                             logger.error(
-                                f'{aecg.filename},{aecg.zipContainer},'
-                                f'Error parsing DIGITS from '
-                                f'string to list of integers: \"{ex}\"')
+                                '%s,%s,Error parsing DIGITS from string to '
+                                'list of integers: "%s"',
+                                aecg.filename, aecg.zipContainer, ex)
                             valrow2["VALIOUT"] == "ERROR"
                             valrow2["VALIMSG"] = "Error parsing SEQUENCE_"\
                                                  "LEAD_DIGITS from string"\
                                                  " to list of integers"
                     else:
                         logger.error(
-                            f'{aecg.filename},{aecg.zipContainer},'
-                            f'DIGITS not found for lead {aecglead.leadname}')
+                            '%s,%s,DIGITS not found for lead %s',
+                            aecg.filename, aecg.zipContainer,
+                            aecglead.leadname)
                     if log_validation:
-                        valpd = valpd.append(
-                            pd.DataFrame([valrow2], columns=VALICOLS),
-                            ignore_index=True)
-                else:
-                    logger.info(
-                        f'{aecg.filename},{aecg.zipContainer},'
-                        f'DIGITS were not requested by the user')
-                aecg.RHYTHMLEADS.append(copy.deepcopy(aecglead))
+                        seq_rows.append(valrow2)
+                # aecglead is created for this sequence only
+                aecg.RHYTHMLEADS.append(aecglead)
         else:
             logger.warning(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'RHYTHM sequenceSet code not found')
+                '%s,%s,RHYTHM sequenceSet code not found',
+                aecg.filename, aecg.zipContainer)
 
         if log_validation:
-            aecg.validatorResults = aecg.validatorResults.append(
-                pd.DataFrame([valrow], columns=VALICOLS),
-                ignore_index=True)
-            if valpd.shape[0] > 0:
-                aecg.validatorResults = \
-                    aecg.validatorResults.append(valpd, ignore_index=True)
+            val_rows.append(valrow)
+            val_rows.extend(seq_rows)
 
+    if log_validation:
+        _append_validation_rows(aecg, val_rows)
     return aecg
 
 
@@ -1935,124 +1633,120 @@ def parse_derived_waveform_timeseries(aecg_doc: etree._ElementTree,
     Returns:
         Aecg: `aecg` updated with the information found in the xml document.
     """
-    path_prefix = './component/series/derivation/derivedSeries/component'\
-                  '/sequenceSet/component/sequence'
-    seqnodes = aecg_doc.xpath((path_prefix + '/code').replace('/', '/ns:'),
-                              namespaces={'ns': 'urn:hl7-org:v3'})
+    val_rows = []
+    new_row = _validation_row_factory(aecg.filename, log_validation)
+    seqnodes = aecg_doc.getroot().findall(_DERIVED_SEQUENCE_CODE_PATH)
     if len(seqnodes) > 0:
         logger.info(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'DERIVED sequenceSet(s) found: '
-            f'{len(seqnodes)} sequenceSet nodes')
+            '%s,%s,DERIVED sequenceSet(s) found: %s sequenceSet nodes',
+            aecg.filename, aecg.zipContainer, len(seqnodes))
+        if not include_digits:
+            logger.info(
+                '%s,%s,DIGITS were not requested by the user',
+                aecg.filename, aecg.zipContainer)
     else:
         logger.warning(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'DERIVED sequenceSet not found')
+            '%s,%s,DERIVED sequenceSet not found',
+            aecg.filename, aecg.zipContainer)
 
     for xmlnode in seqnodes:
-        xmlnode_path = aecg_doc.getpath(xmlnode)
-        valrow = validate_xpath(aecg_doc,
-                                xmlnode_path,
-                                "urn:hl7-org:v3",
-                                "code",
-                                new_validation_row(aecg.filename, "DERIVED",
-                                                   "SEQUENCE_CODE"),
-                                failcat="WARNING")
-        valpd = pd.DataFrame()
+        # The sequence values are looked up from the sequence node itself;
+        # the absolute path of the code node is only needed for the XPATH
+        # column of the validation rows
+        seqnode = xmlnode.getparent()
+        if log_validation:
+            xmlnode_path = aecg_doc.getpath(xmlnode)
+            xpath_prefix = xmlnode_path + "/"
+        else:
+            xmlnode_path = xpath_prefix = ""
+        valrow = _validate_found([xmlnode],
+                                 xmlnode_path,
+                                 "code",
+                                 new_row("DERIVED", "SEQUENCE_CODE"),
+                                 failcat="WARNING")
+        seq_rows = []
         if valrow["VALIOUT"] == "PASSED":
-            if not valrow["VALUE"] in SEQUENCE_CODES:
+            seqcode = valrow["VALUE"]
+            if seqcode not in SEQUENCE_CODES:
                 logger.warning(
-                    f'{aecg.filename},{aecg.zipContainer},'
-                    f'DERIVED unexpected sequenceSet code '
-                    f'found: {valrow["VALUE"]}')
+                    '%s,%s,DERIVED unexpected sequenceSet code found: %s',
+                    aecg.filename, aecg.zipContainer, seqcode)
                 valrow["VALIOUT"] = "WARNING"
                 valrow["VALIMSG"] = "Unexpected sequence code found"
-            if valrow["VALUE"] in TIME_CODES:
+            if seqcode in TIME_CODES:
                 logger.info(
-                    f'{aecg.filename},{aecg.zipContainer},'
-                    f'DERIVED sequenceSet code found: {valrow["VALUE"]}')
-                aecg.DERIVEDTIME["code"] = valrow["VALUE"]
+                    '%s,%s,DERIVED sequenceSet code found: %s',
+                    aecg.filename, aecg.zipContainer, seqcode)
+                aecg.DERIVEDTIME["code"] = seqcode
                 # Retrieve time head info from value node
                 rel_path = "../value/head"
-                valrow2 = validate_xpath(
-                    xmlnode,
-                    rel_path,
-                    "urn:hl7-org:v3",
+                valrow2 = _validate_found(
+                    seqnode.findall(_SEQUENCE_VALUE_PATHS[rel_path]),
+                    xpath_prefix + rel_path,
                     "value",
-                    new_validation_row(aecg.filename, "DERIVED",
-                                       "SEQUENCE_TIME_HEAD"),
+                    new_row("DERIVED", "SEQUENCE_TIME_HEAD"),
                     failcat="WARNING")
-                valrow2["XPATH"] = xmlnode_path + "/" + rel_path
                 if valrow2["VALIOUT"] == "PASSED":
                     logger.info(
-                        f'{aecg.filename},{aecg.zipContainer},'
-                        f'DERIVED SEQUENCE_TIME_HEAD found: '
-                        f'{valrow2["VALUE"]}')
+                        '%s,%s,DERIVED SEQUENCE_TIME_HEAD found: %s',
+                        aecg.filename, aecg.zipContainer, valrow2["VALUE"])
                     aecg.DERIVEDTIME["head"] = valrow2["VALUE"]
                 else:
                     logger.debug(
-                        f'{aecg.filename},{aecg.zipContainer},'
-                        f'DERIVED SEQUENCE_TIME_HEAD not found')
+                        '%s,%s,DERIVED SEQUENCE_TIME_HEAD not found',
+                        aecg.filename, aecg.zipContainer)
                 if log_validation:
-                    valpd = valpd.append(
-                        pd.DataFrame([valrow2], columns=VALICOLS),
-                        ignore_index=True)
+                    seq_rows.append(valrow2)
                 # Retrieve time increment info from value node
                 rel_path = "../value/increment"
+                nodes = seqnode.findall(_SEQUENCE_VALUE_PATHS[rel_path])
                 for n in ["value", "unit"]:
-                    valrow2 = validate_xpath(
-                        xmlnode,
-                        rel_path,
-                        "urn:hl7-org:v3",
+                    valrow2 = _validate_found(
+                        nodes,
+                        xpath_prefix + rel_path,
                         n,
-                        new_validation_row(aecg.filename, "DERIVED",
-                                           "SEQUENCE_TIME_" + n),
+                        new_row("DERIVED", "SEQUENCE_TIME_" + n),
                         failcat="WARNING")
-                    valrow2["XPATH"] = xmlnode_path + "/" + rel_path
                     if valrow2["VALIOUT"] == "PASSED":
                         logger.info(
-                            f'{aecg.filename},{aecg.zipContainer},'
-                            f'DERIVED SEQUENCE_TIME_{n} found: '
-                            f'{valrow2["VALUE"]}')
+                            '%s,%s,DERIVED SEQUENCE_TIME_%s found: %s',
+                            aecg.filename, aecg.zipContainer, n,
+                            valrow2["VALUE"])
                         if n == "value":
                             aecg.DERIVEDTIME["increment"] =\
                                 float(valrow2["VALUE"])
                         else:
                             aecg.DERIVEDTIME[n] = valrow2["VALUE"]
                     if log_validation:
-                        valpd = valpd.append(
-                            pd.DataFrame([valrow2], columns=VALICOLS),
-                            ignore_index=True)
+                        seq_rows.append(valrow2)
             else:
                 logger.debug(
-                    f'{aecg.filename},{aecg.zipContainer},'
-                    f'DERIVED sequenceSet code found: {valrow["VALUE"]}')
+                    '%s,%s,DERIVED sequenceSet code found: %s',
+                    aecg.filename, aecg.zipContainer, seqcode)
                 logger.info(
-                    f'{aecg.filename},{aecg.zipContainer},'
-                    f'LEADNAME from DERIVED sequenceSet code: '
-                    f'{valrow["VALUE"]}')
+                    '%s,%s,LEADNAME from DERIVED sequenceSet code: %s',
+                    aecg.filename, aecg.zipContainer, seqcode)
                 # Assume is a lead
                 aecglead = AecgLead()
-                aecglead.leadname = valrow["VALUE"]
-                # Inherit last parsed DERIVEDTIME
-                aecglead.LEADTIME = copy.deepcopy(aecg.DERIVEDTIME)
+                aecglead.leadname = seqcode
+                # Inherit last parsed DERIVEDTIME (a flat dict of scalars, so
+                # a shallow copy is enough)
+                aecglead.LEADTIME = dict(aecg.DERIVEDTIME)
                 # Retrive lead origin info
                 rel_path = "../value/origin"
+                nodes = seqnode.findall(_SEQUENCE_VALUE_PATHS[rel_path])
                 for n in ["value", "unit"]:
-                    valrow2 = validate_xpath(
-                        xmlnode,
-                        rel_path,
-                        "urn:hl7-org:v3",
+                    valrow2 = _validate_found(
+                        nodes,
+                        xpath_prefix + rel_path,
                         n,
-                        new_validation_row(aecg.filename, "DERIVED",
-                                           "SEQUENCE_LEAD_ORIGIN_" + n),
+                        new_row("DERIVED", "SEQUENCE_LEAD_ORIGIN_" + n),
                         failcat="WARNING")
-                    valrow2["XPATH"] = xmlnode_path + "/" + rel_path
                     if valrow2["VALIOUT"] == "PASSED":
                         logger.info(
-                            f'{aecg.filename},{aecg.zipContainer},'
-                            f'DERIVED SEQUENCE_LEAD_ORIGIN_{n} '
-                            f'found: {valrow2["VALUE"]}')
+                            '%s,%s,DERIVED SEQUENCE_LEAD_ORIGIN_%s found: %s',
+                            aecg.filename, aecg.zipContainer, n,
+                            valrow2["VALUE"])
                         if n == "value":
                             try:
                                 aecglead.origin = float(valrow2["VALUE"])
@@ -2064,37 +1758,33 @@ def parse_derived_waveform_timeseries(aecg_doc: etree._ElementTree,
                             aecglead.origin_unit = valrow2["VALUE"]
                     else:
                         logger.debug(
-                            f'{aecg.filename},{aecg.zipContainer},'
-                            f'DERIVED SEQUENCE_LEAD_ORIGIN_{n} not found')
+                            '%s,%s,DERIVED SEQUENCE_LEAD_ORIGIN_%s not found',
+                            aecg.filename, aecg.zipContainer, n)
                     if log_validation:
-                        valpd = valpd.append(
-                            pd.DataFrame([valrow2], columns=VALICOLS),
-                            ignore_index=True)
+                        seq_rows.append(valrow2)
                 # Retrive lead scale info
                 rel_path = "../value/scale"
+                nodes = seqnode.findall(_SEQUENCE_VALUE_PATHS[rel_path])
                 for n in ["value", "unit"]:
-                    valrow2 = validate_xpath(
-                        xmlnode,
-                        rel_path,
-                        "urn:hl7-org:v3",
+                    valrow2 = _validate_found(
+                        nodes,
+                        xpath_prefix + rel_path,
                         n,
-                        new_validation_row(aecg.filename, "DERIVED",
-                                           "SEQUENCE_LEAD_SCALE_" + n),
+                        new_row("DERIVED", "SEQUENCE_LEAD_SCALE_" + n),
                         failcat="WARNING")
-                    valrow2["XPATH"] = xmlnode_path + "/" + rel_path
                     if valrow2["VALIOUT"] == "PASSED":
                         logger.info(
-                            f'{aecg.filename},{aecg.zipContainer},'
-                            f'DERIVED SEQUENCE_LEAD_SCALE_{n} '
-                            f'found: {valrow2["VALUE"]}')
+                            '%s,%s,DERIVED SEQUENCE_LEAD_SCALE_%s found: %s',
+                            aecg.filename, aecg.zipContainer, n,
+                            valrow2["VALUE"])
                         if n == "value":
                             try:
                                 aecglead.scale = float(valrow2["VALUE"])
                             except Exception as ex:
                                 logger.error(
-                                    f'{aecg.filename},{aecg.zipContainer},'
-                                    f'DERIVED SEQUENCE_LEAD_SCALE'
-                                    f' value is not a valid number: \"{ex}\"')
+                                    '%s,%s,DERIVED SEQUENCE_LEAD_SCALE value '
+                                    'is not a valid number: "%s"',
+                                    aecg.filename, aecg.zipContainer, ex)
                                 valrow2["VALIOUT"] == "ERROR"
                                 valrow2["VALIMSG"] = "SEQUENCE_LEAD_SCALE"\
                                                      " is not a number"
@@ -2102,82 +1792,150 @@ def parse_derived_waveform_timeseries(aecg_doc: etree._ElementTree,
                             aecglead.scale_unit = valrow2["VALUE"]
                     else:
                         logger.debug(
-                            f'{aecg.filename},{aecg.zipContainer},'
-                            f'DERIVED SEQUENCE_LEAD_SCALE_{n} not found')
+                            '%s,%s,DERIVED SEQUENCE_LEAD_SCALE_%s not found',
+                            aecg.filename, aecg.zipContainer, n)
                     if log_validation:
-                        valpd = valpd.append(
-                            pd.DataFrame([valrow2], columns=VALICOLS),
-                            ignore_index=True)
+                        seq_rows.append(valrow2)
                 # Include digits if requested
                 if include_digits:
                     rel_path = "../value/digits"
-                    valrow2 = validate_xpath(
-                        xmlnode,
-                        rel_path,
-                        "urn:hl7-org:v3",
+                    valrow2 = _validate_found(
+                        seqnode.findall(_SEQUENCE_VALUE_PATHS[rel_path]),
+                        xpath_prefix + rel_path,
                         "",
-                        new_validation_row(aecg.filename, "DERIVED",
-                                           "SEQUENCE_LEAD_DIGITS"),
+                        new_row("DERIVED", "SEQUENCE_LEAD_DIGITS"),
                         failcat="WARNING")
-                    valrow2["XPATH"] = xmlnode_path + "/" + rel_path
                     if valrow2["VALIOUT"] == "PASSED":
                         try:
-                            # Convert string of digits to list of integers
-                            # remove new lines
-                            sdigits = valrow2["VALUE"].replace("\n", " ")
-                            # remove carriage retruns
-                            sdigits = sdigits.replace("\r", " ")
-                            # remove tabs
-                            sdigits = sdigits.replace("\t", " ")
-                            # collapse 2 or more spaces into 1 space char
-                            # and remove leading/trailing white spaces
-                            sdigits = re.sub("\\s+", " ", sdigits).strip()
-                            # Convert string into list of integers
-                            aecglead.digits = [int(s) for s in
-                                               sdigits.split(' ')]
+                            # Convert string of digits to array of integers
+                            aecglead.digits = _parse_digits(valrow2["VALUE"])
                             logger.info(
-                                f'{aecg.filename},{aecg.zipContainer},'
-                                f'DIGITS added to lead'
-                                f' {aecglead.leadname} (n: '
-                                f'{len(aecglead.digits)})')
+                                '%s,%s,DIGITS added to lead %s (n: %s)',
+                                aecg.filename, aecg.zipContainer,
+                                aecglead.leadname, len(aecglead.digits))
                         except Exception as ex:
                             logger.error(
-                                f'{aecg.filename},{aecg.zipContainer},'
-                                f'Error parsing DIGITS from '
-                                f'string to list of integers: \"{ex}\"')
+                                '%s,%s,Error parsing DIGITS from string to '
+                                'list of integers: "%s"',
+                                aecg.filename, aecg.zipContainer, ex)
                             valrow2["VALIOUT"] == "ERROR"
                             valrow2["VALIMSG"] = "Error parsing SEQUENCE_"\
                                                  "LEAD_DIGITS from string"\
                                                  " to list of integers"
                     else:
                         logger.error(
-                            f'{aecg.filename},{aecg.zipContainer},'
-                            f'DIGITS not found for lead {aecglead.leadname}')
+                            '%s,%s,DIGITS not found for lead %s',
+                            aecg.filename, aecg.zipContainer,
+                            aecglead.leadname)
                     if log_validation:
-                        valpd = valpd.append(
-                            pd.DataFrame([valrow2], columns=VALICOLS),
-                            ignore_index=True)
-                else:
-                    logger.info(
-                        f'{aecg.filename},{aecg.zipContainer},'
-                        f'DIGITS were not requested by the user')
-                aecg.DERIVEDLEADS.append(copy.deepcopy(aecglead))
+                        seq_rows.append(valrow2)
+                # aecglead is created for this sequence only
+                aecg.DERIVEDLEADS.append(aecglead)
         else:
             logger.warning(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'RHYTHM sequenceSet code not found')
+                '%s,%s,RHYTHM sequenceSet code not found',
+                aecg.filename, aecg.zipContainer)
 
         if log_validation:
-            aecg.validatorResults = aecg.validatorResults.append(
-                pd.DataFrame([valrow], columns=VALICOLS),
-                ignore_index=True)
-            if valpd.shape[0] > 0:
-                aecg.validatorResults = \
-                    aecg.validatorResults.append(valpd, ignore_index=True)
+            val_rows.append(valrow)
+            val_rows.extend(seq_rows)
 
+    if log_validation:
+        _append_validation_rows(aecg, val_rows)
     return aecg
 
 
+def _parse_annset_author(annset_node: etree._Element,
+                         aecg: Aecg,
+                         xmlnode_path: str,
+                         val_grp: str,
+                         aecgannset: AecgAnnotationSet,
+                         log_validation: bool = False) -> List[Dict]:
+    """Extracts the human and device authors of an annotation set
+
+    Args:
+        annset_node (etree._Element): annotationSet node
+        aecg (Aecg): The aECG being parsed (used for logging)
+        xmlnode_path (str): Path to xml node of the annotation set (used for
+            the XPATH of the validation rows)
+        val_grp (str): RHYTHM or DERIVED (used for logging)
+        aecgannset (AecgAnnotationSet): Annotation set to update with the
+            authors found.
+        log_validation (bool, optional): Indicates whether to return the
+            validation rows. Defaults to False.
+
+    Returns:
+        List[Dict]: Validation rows of the author lookups (empty if
+        `log_validation` is False).
+    """
+    set_rows = []
+    new_row = _validation_row_factory(aecg.filename, log_validation)
+    author_types = _ANNSET_AUTHOR_TYPE_XPATH(annset_node)
+    # Annotation set: human author information
+    valrow = _validate_found(
+        [node for author_type in author_types
+         for node in author_type.findall(
+             _ANNSET_AUTHOR_SUBPATHS[_ANNSET_PERSON_PATH])],
+        xmlnode_path + "/" + _ANNSET_PERSON_PATH,
+        "",
+        new_row("RHYTHM", "ANNSET_AUTHOR_NAME"),
+        failcat="WARNING")
+    if valrow["VALIOUT"] == "PASSED":
+        logger.info(
+            '%s,%s,%s annotations author: %s',
+            aecg.filename, aecg.zipContainer, val_grp, valrow["VALUE"])
+        aecgannset.person = valrow["VALUE"]
+    else:
+        logger.debug(
+            '%s,%s,%s annotations author not found',
+            aecg.filename, aecg.zipContainer, val_grp)
+    if log_validation:
+        set_rows.append(valrow)
+    # Annotation set: device author information
+    valrow = _validate_found(
+        [node for author_type in author_types
+         for node in author_type.findall(
+             _ANNSET_AUTHOR_SUBPATHS[_ANNSET_MODEL_PATH])],
+        xmlnode_path + "/" + _ANNSET_MODEL_PATH,
+        "",
+        new_row("RHYTHM", "ANNSET_AUTHOR_DEVICE_MODEL"),
+        failcat="WARNING")
+    if valrow["VALIOUT"] == "PASSED":
+        tmp = valrow["VALUE"].replace("\n", "")
+        logger.info(
+            '%s,%s,%s annotations device model: %s',
+            aecg.filename, aecg.zipContainer, val_grp, tmp)
+        aecgannset.device["model"] = valrow["VALUE"]
+    else:
+        logger.debug(
+            '%s,%s,%s annotations device model not found',
+            aecg.filename, aecg.zipContainer, val_grp)
+    if log_validation:
+        set_rows.append(valrow)
+    valrow = _validate_found(
+        [node for author_type in author_types
+         for node in author_type.findall(
+             _ANNSET_AUTHOR_SUBPATHS[_ANNSET_DEVICE_NAME_PATH])],
+        xmlnode_path + "/" + _ANNSET_DEVICE_NAME_PATH,
+        "",
+        new_row("RHYTHM", "ANNSET_AUTHOR_DEVICE_NAME"),
+        failcat="WARNING")
+    if valrow["VALIOUT"] == "PASSED":
+        tmp = valrow["VALUE"].replace("\n", "")
+        logger.info(
+            '%s,%s,%s annotations device name: %s',
+            aecg.filename, aecg.zipContainer, val_grp, tmp)
+        aecgannset.device["name"] = valrow["VALUE"]
+    else:
+        logger.debug(
+            '%s,%s,%s annotations device name not found',
+            aecg.filename, aecg.zipContainer, val_grp)
+    if log_validation:
+        set_rows.append(valrow)
+
+    return set_rows
+
+
 def parse_waveform_annotations(aecg_doc: etree._ElementTree,
                                aecg: Aecg,
                                anngrp: Dict,
@@ -2206,118 +1964,50 @@ def parse_waveform_annotations(aecg_doc: etree._ElementTree,
     """
     val_grp = anngrp["valgroup"]
     logger.debug(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'{val_grp}: searching annotations started')
+        '%s,%s,%s: searching annotations started',
+        aecg.filename, aecg.zipContainer, val_grp)
     path_prefix = anngrp["path_prefix"]
-    anns_setnodes = aecg_doc.xpath(path_prefix.replace('/', '/ns:'),
-                                   namespaces={'ns': 'urn:hl7-org:v3'})
+    anns_setnodes = compiled_xpath(path_prefix, _NSURI)(aecg_doc)
     if len(anns_setnodes) == 0:
         logger.warning(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'{anngrp["valgroup"]}: no annotation nodes found')
+            '%s,%s,%s: no annotation nodes found',
+            aecg.filename, aecg.zipContainer, anngrp["valgroup"])
+    val_rows = []
+    # Annotation nodes found in the document, shared by all annotation sets
+    doc_nodes = {}
     for xmlnode in anns_setnodes:
         aecgannset = AecgAnnotationSet()
-        xmlnode_path = aecg_doc.getpath(xmlnode)
-        # Annotation set: human author information
-        valrow = validate_xpath(
-            aecg_doc,
-            xmlnode_path + "/author/assignedEntity/assignedAuthorType/"
-                           "assignedPerson/name",
-            "urn:hl7-org:v3",
-            "",
-            new_validation_row(aecg.filename, "RHYTHM", "ANNSET_AUTHOR_NAME"),
-            failcat="WARNING")
-        if valrow["VALIOUT"] == "PASSED":
-            logger.info(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'{val_grp} annotations author: {valrow["VALUE"]}')
-            aecgannset.person = valrow["VALUE"]
-        else:
-            logger.debug(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'{val_grp} annotations author not found')
-        if log_validation:
-            aecg.validatorResults = aecg.validatorResults.append(
-                pd.DataFrame([valrow], columns=VALICOLS),
-                ignore_index=True)
-        # Annotation set: device author information
-        valrow = validate_xpath(aecg_doc,
-                                xmlnode_path + "/author/assignedEntity"
-                                               "/assignedAuthorType/"
-                                               "assignedDevice/"
-                                               "manufacturerModelName",
-                                "urn:hl7-org:v3",
-                                "",
-                                new_validation_row(
-                                    aecg.filename,
-                                    "RHYTHM",
-                                    "ANNSET_AUTHOR_DEVICE_MODEL"),
-                                failcat="WARNING")
-        if valrow["VALIOUT"] == "PASSED":
-            tmp = valrow["VALUE"].replace("\n", "")
-            logger.info(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'{val_grp} annotations device model: {tmp}')
-            aecgannset.device["model"] = valrow["VALUE"]
-        else:
-            logger.debug(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'{val_grp} annotations device model not found')
-        if log_validation:
-            aecg.validatorResults = aecg.validatorResults.append(
-                pd.DataFrame([valrow], columns=VALICOLS),
-                ignore_index=True)
-        valrow = validate_xpath(aecg_doc,
-                                xmlnode_path +
-                                "/author/assignedEntity/"
-                                "assignedAuthorType/assignedDevice/"
-                                "playedManufacturedDevice/"
-                                "manufacturerOrganization/name",
-                                "urn:hl7-org:v3",
-                                "",
-                                new_validation_row(
-                                    aecg.filename,
-                                    "RHYTHM",
-                                    "ANNSET_AUTHOR_DEVICE_NAME"),
-                                failcat="WARNING")
-        if valrow["VALIOUT"] == "PASSED":
-            tmp = valrow["VALUE"].replace("\n", "")
-            logger.info(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'{val_grp} annotations device name: {tmp}')
-            aecgannset.device["name"] = valrow["VALUE"]
-        else:
-            logger.debug(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'{val_grp} annotations device name not found')
-        if log_validation:
-            aecg.validatorResults = aecg.validatorResults.append(
-                pd.DataFrame([valrow], columns=VALICOLS),
-                ignore_index=True)
-
-        aecgannset, valpd = parse_annotations(aecg.filename, aecg.zipContainer,
-                                              aecg_doc,
-                                              aecgannset,
-                                              path_prefix,
-                                              xmlnode_path,
-                                              anngrp["valgroup"],
-                                              log_validation)
+        # The annotation set path is only used for the XPATH column of the
+        # validation rows
+        xmlnode_path = aecg_doc.getpath(xmlnode) if log_validation else ""
+        set_rows = _parse_annset_author(xmlnode, aecg, xmlnode_path,
+                                        val_grp, aecgannset, log_validation)
+        aecgannset, ann_rows = _parse_annotations(aecg.filename,
+                                                  aecg.zipContainer,
+                                                  aecg_doc,
+                                                  aecgannset,
+                                                  path_prefix,
+                                                  xmlnode_path,
+                                                  anngrp["valgroup"],
+                                                  log_validation,
+                                                  doc_nodes)
         if len(aecgannset.anns) == 0:
             logger.debug(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'{val_grp} no annotations set found')
+                '%s,%s,%s no annotations set found',
+                aecg.filename, aecg.zipContainer, val_grp)
 
-        if log_validation:
-            aecg.validatorResults = \
-                aecg.validatorResults.append(valpd, ignore_index=True)
+        val_rows.extend(set_rows)
+        val_rows.extend(ann_rows)
+        # aecgannset is created for this annotation set only
         if anngrp["valgroup"] == "RHYTHM":
-            aecg.RHYTHMANNS.append(copy.deepcopy(aecgannset))
+            aecg.RHYTHMANNS.append(aecgannset)
         else:
-            aecg.DERIVEDANNS.append(copy.deepcopy(aecgannset))
+            aecg.DERIVEDANNS.append(aecgannset)
+    _append_validation_rows(aecg, val_rows)
 
     logger.debug(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'{val_grp}: searching annotations finished')
+        '%s,%s,%s: searching annotations finished',
+        aecg.filename, aecg.zipContainer, val_grp)
     return aecg
 
 
@@ -2378,12 +2068,301 @@ def parse_derived_waveform_annotations(aecg_doc: etree._ElementTree,
     return aecg
 
 
+def parse_annotations_stream(xml_filename: str,
+                             zip_filename: str = "",
+                             aecg_doc: etree._ElementTree = None,
+                             log_validation: bool = False) -> Aecg:
+    """Reads the waveform annotations of an aECG file with `iterparse`
+
+    Waveform sequence sets are cleared as soon as their closing tag is read,
+    so the digits of large files (e.g., with long rhythm strips) are never
+    fully held in memory. The annotations are then parsed from the rest of
+    the document with :any:`parse_rhythm_waveform_annotations` and
+    :any:`parse_derived_waveform_annotations`, so the annotation sets and
+    validation results are the same as those of :any:`read_aecg`. If
+    `aecg_doc` is provided the already parsed document is used instead.
+
+    Annotation sets are not parsed as they are read because, as in
+    :any:`read_aecg`, each set gets the annotations of all the annotation
+    sets of its waveform. Cleared sequence sets are not deleted from their
+    parents so that positional paths reported in the validation results
+    match those of :any:`read_aecg`.
+
+    Args:
+        xml_filename (str): Filename of the aECG XML file.
+        zip_filename (str, optional): Zip file containing the aECG XML file.
+            If '', then xml file is not stored in a zip file. Defaults to "".
+        aecg_doc (etree._ElementTree, optional): Already parsed XML document
+            of the aECG XML file. Defaults to None.
+        log_validation (bool, optional): Indicates whether to maintain the
+            validation results in `aecg.validatorResults`. Defaults to
+            False.
+
+    Returns:
+        Aecg: aECG with :any:`Aecg.RHYTHMANNS` and :any:`Aecg.DERIVEDANNS`
+        populated. `xmlfound` is False if the file could not be read, in
+        which case a READFILE validation row with the error is logged.
+    """
+    aecg = Aecg()
+    aecg.filename = xml_filename
+    aecg.zipContainer = zip_filename
+    if aecg_doc is not None:
+        aecg.xmlfound = True
+        aecg = parse_rhythm_waveform_annotations(aecg_doc, aecg,
+                                                 log_validation)
+        aecg = parse_derived_waveform_annotations(aecg_doc, aecg,
+                                                  log_validation)
+        return aecg
+
+    # Row logged if reading fails: it refers to the zip container until the
+    # container is opened, and to the xml file afterwards
+    readfile_row = new_validation_row(xml_filename, "READFILE",
+                                      "ZIPCONTAINER")
+    readfile_row["VALUE"] = zip_filename
+    try:
+        with contextlib.ExitStack() as stack:
+            if zip_filename != "":
+                zf = stack.enter_context(zipfile.ZipFile(zip_filename, "r"))
+            readfile_row = new_validation_row(xml_filename, "READFILE",
+                                              "FILENAME")
+            readfile_row["VALUE"] = xml_filename
+            if zip_filename == "":
+                source = stack.enter_context(open(xml_filename, "rb"))
+            else:
+                source = stack.enter_context(zf.open(xml_filename))
+            context = etree.iterparse(
+                source, events=("end",), tag=_T_SEQUENCESET,
+                remove_blank_text=True, remove_comments=True,
+                collect_ids=False, resolve_entities=False,
+                no_network=True, huge_tree=True)
+            for event, elem in context:
+                elem.clear()
+            aecg_doc = etree.ElementTree(context.root)
+    except Exception as ex:
+        msg = f'Could not read or parse XML file: \"{ex}\"'
+        logger.error(
+            '%s,%s,%s',
+            aecg.filename, aecg.zipContainer, msg)
+        readfile_row["VALIOUT"] = "ERROR"
+        readfile_row["VALIMSG"] = msg
+        if log_validation:
+            _append_validation_rows(aecg, [readfile_row])
+        return aecg
+    aecg.xmlfound = True
+    aecg = parse_rhythm_waveform_annotations(aecg_doc, aecg, log_validation)
+    aecg = parse_derived_waveform_annotations(aecg_doc, aecg, log_validation)
+    return aecg
+
+
+def _read_xml_doc(aecg: Aecg,
+                  log_validation: bool = False) -> etree._ElementTree:
+    """Reads and parses the xml file referenced by `aecg`
+
+    Sets `aecg.xmlfound` to True if the file was read and parsed. Otherwise,
+    a READFILE validation row with the error is added to
+    `aecg.validatorResults` if `log_validation` is True.
+
+    Args:
+        aecg (Aecg): aECG with `filename` and `zipContainer` set.
+        log_validation (bool, optional): Indicates whether to maintain the
+            validation results in `aecg.validatorResults`. Defaults to
+            False.
+
+    Returns:
+        etree._ElementTree: The parsed xml document, or None if the file
+        could not be read or parsed.
+    """
+    parser = _xml_parser()
+    # Row logged if reading fails: it refers to the zip container until the
+    # container is opened, and to the xml file afterwards
+    if aecg.zipContainer == "":
+        valrow = new_validation_row(aecg.filename, "READFILE", "FILENAME")
+        valrow["VALUE"] = aecg.filename
+    else:
+        valrow = new_validation_row(aecg.filename, "READFILE",
+                                    "ZIPCONTAINER")
+        valrow["VALUE"] = aecg.zipContainer
+    try:
+        if aecg.zipContainer == "":
+            aecg_doc = etree.parse(aecg.filename, parser)
+        else:
+            with zipfile.ZipFile(aecg.zipContainer, "r") as zf:
+                valrow = new_validation_row(aecg.filename, "READFILE",
+                                            "FILENAME")
+                valrow["VALUE"] = aecg.filename
+                with zf.open(aecg.filename) as xml_file:
+                    aecg_doc = etree.parse(xml_file, parser)
+    except Exception as ex:
+        msg = f'Could not read or parse XML file: \"{ex}\"'
+        logger.error(
+            '%s,%s,%s',
+            aecg.filename, aecg.zipContainer, msg)
+        valrow["VALIOUT"] = "ERROR"
+        valrow["VALIMSG"] = msg
+        if log_validation:
+            _append_validation_rows(aecg, [valrow])
+        return None
+    aecg.xmlfound = True
+    return aecg_doc
+
+
+def _parse_file_annotations(xml_zip: Tuple[str, str],
+                            log_validation: bool = False) -> Aecg:
+    """Reads one aECG file and parses its rhythm and derived annotations
+
+    Worker of :any:`parse_annotations_batch`. The XML is loaded and parsed
+    in the calling process so only the resulting :any:`Aecg` (without XML
+    document) has to be sent back.
+
+    Args:
+        xml_zip (Tuple[str, str]): aECG xml filename and zip container (empty
+            string if the xml file is not stored in a zip file).
+        log_validation (bool, optional): Indicates whether to maintain the
+            validation results in `aecg.validatorResults`. Defaults to
+            False.
+
+    Returns:
+        Aecg: aECG with :any:`Aecg.RHYTHMANNS` and :any:`Aecg.DERIVEDANNS`
+        populated. `xmlfound` is False if the file could not be read, in
+        which case a READFILE validation row with the error is logged.
+    """
+    aecg = Aecg()
+    aecg.filename, aecg.zipContainer = xml_zip
+    aecg_doc = _read_xml_doc(aecg, log_validation)
+    if aecg_doc is None:
+        return aecg
+    aecg = parse_rhythm_waveform_annotations(aecg_doc, aecg, log_validation)
+    aecg = parse_derived_waveform_annotations(aecg_doc, aecg, log_validation)
+    return aecg
+
+
+def _parse_file_info(xml_zip: Tuple[str, str],
+                     log_validation: bool = False) -> Aecg:
+    """Reads one aECG file and parses its general, subject and study info
+
+    Worker of :any:`parse_info_batch`. Runs :any:`parse_generalinfo`,
+    :any:`parse_subjectinfo`, :any:`parse_trtainfo`, :any:`parse_studyinfo`
+    and :any:`parse_timepoints` on the document read in the worker process.
+
+    Args:
+        xml_zip (Tuple[str, str]): aECG xml filename and zip container (empty
+            string if the xml file is not stored in a zip file).
+        log_validation (bool, optional): Indicates whether to maintain the
+            validation results in `aecg.validatorResults`. Defaults to
+            False.
+
+    Returns:
+        Aecg: aECG with the general, subject, treatment, study and timepoint
+        information found. `xmlfound` is False if the file could not be read,
+        in which case a READFILE validation row with the error is logged.
+    """
+    aecg = Aecg()
+    aecg.filename, aecg.zipContainer = xml_zip
+    aecg_doc = _read_xml_doc(aecg, log_validation)
+    if aecg_doc is None:
+        return aecg
+    aecg = parse_generalinfo(aecg_doc, aecg, log_validation)
+    aecg = parse_subjectinfo(aecg_doc, aecg, log_validation)
+    aecg = parse_trtainfo(aecg_doc, aecg, log_validation)
+    aecg = parse_studyinfo(aecg_doc, aecg, log_validation)
+    aecg = parse_timepoints(aecg_doc, aecg, log_validation)
+    return aecg
+
+
+def _map_files(parse_func, files: List[Tuple[str, str]],
+               num_processes: int = 1) -> Tuple[List[Aecg], pd.DataFrame]:
+    """Applies `parse_func` to each (xml filename, zip container) in `files`
+
+    Args:
+        parse_func (Callable): Picklable function returning an :any:`Aecg`
+            for one (xml filename, zip container) tuple.
+        files (List[Tuple[str, str]]): Files to parse.
+        num_processes (int, optional): Number of parallel processes. Use 1
+            for no parallel processing. Defaults to 1.
+
+    Returns:
+        Tuple[List[Aecg], pd.DataFrame]: aECGs returned by `parse_func` (in
+        the same order as `files`) and the validation results of all files.
+    """
+    if num_processes > 1:
+        # A few chunks per worker keeps IPC low while balancing the load
+        chunksize = max(1, len(files) // (4 * num_processes))
+        with Pool(num_processes) as pool:
+            aecgs = pool.map(parse_func, files, chunksize)
+    else:
+        aecgs = [parse_func(xml_zip) for xml_zip in files]
+    val_frames = [a.validatorResults for a in aecgs
+                  if a.validatorResults.shape[0] > 0]
+    if len(val_frames) > 0:
+        valpd = pd.concat(val_frames, ignore_index=True)
+    else:
+        valpd = pd.DataFrame(columns=VALICOLS)
+    return aecgs, valpd
+
+
+def parse_annotations_batch(files: List[Tuple[str, str]],
+                            log_validation: bool = False,
+                            num_processes: int = 1) -> Tuple[
+                                List[Aecg], pd.DataFrame]:
+    """Parses the waveform annotations of several aECG files
+
+    Each file is read, parsed and its annotations extracted in a worker
+    process, so independent files are processed in parallel.
+
+    Args:
+        files (List[Tuple[str, str]]): List of (xml filename, zip container)
+            tuples. Zip container is an empty string for xml files not stored
+            in a zip file.
+        log_validation (bool, optional): Indicates whether to collect the
+            validation results. Defaults to False.
+        num_processes (int, optional): Number of parallel processes. Use 1
+            for no parallel processing. Defaults to 1.
+
+    Returns:
+        Tuple[List[Aecg], pd.DataFrame]: aECGs with the annotation sets found
+        (in the same order as `files`) and the validation results of all
+        files.
+    """
+    return _map_files(partial(_parse_file_annotations,
+                              log_validation=log_validation),
+                      files, num_processes)
+
+
+def parse_info_batch(files: List[Tuple[str, str]],
+                     log_validation: bool = False,
+                     num_processes: int = 1) -> Tuple[
+                         List[Aecg], pd.DataFrame]:
+    """Parses the general, subject and study information of several aECGs
+
+    Each file is read and parsed in a worker process, so independent files
+    are processed in parallel. Waveforms and annotations are not parsed.
+
+    Args:
+        files (List[Tuple[str, str]]): List of (xml filename, zip container)
+            tuples. Zip container is an empty string for xml files not stored
+            in a zip file.
+        log_validation (bool, optional): Indicates whether to collect the
+            validation results. Defaults to False.
+        num_processes (int, optional): Number of parallel processes. Use 1
+            for no parallel processing. Defaults to 1.
+
+    Returns:
+        Tuple[List[Aecg], pd.DataFrame]: aECGs with the information found
+        (in the same order as `files`) and the validation results of all
+        files.
+    """
+    return _map_files(partial(_parse_file_info,
+                              log_validation=log_validation),
+                      files, num_processes)
+
+
 def read_aecg(xml_filename: str, zip_container: str = "",
               include_digits: bool = False,
               aecg_schema_filename: str = "",
               ns_clean: bool = True, remove_blank_text: bool = True,
               in_memory_xml: bool = False,
-              log_validation: bool = False) -> Aecg:
+              log_validation: bool = False,
+              include_waveforms: bool = True) -> Aecg:
     """Reads an aECG HL7 XML file and returns an `Aecg` object.
 
     Args:
@@ -2405,6 +2384,10 @@ def read_aecg(xml_filename: str, zip_container: str = "",
         log_validation (bool, optional): If True, populates
             :attr:`validatorResults` with parsing information retrieved while
             reading and parsing the aECG xml file.
+        include_waveforms (bool, optional): Rhythm and derived waveforms
+            timeseries and annotations are not parsed if False, leaving the
+            leads, annotation sets, RHYTHMTIME and DERIVEDTIME empty.
+            Defaults to True.
     Returns:
         Aecg: An aECG object instantiated with the information read from
         the `xml_filename` file.
@@ -2421,12 +2404,13 @@ def read_aecg(xml_filename: str, zip_container: str = "",
     # Read XML document
     # =======================================
     aecg_doc = None
-    parser = etree.XMLParser(ns_clean=ns_clean,
-                             remove_blank_text=remove_blank_text)
+    parser = _xml_parser(ns_clean, remove_blank_text)
+    # READFILE validation rows
+    val_rows = []
     if zip_container == "":
         logger.info(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'Reading aecg from {xml_filename} [no zip container]')
+            '%s,%s,Reading aecg from %s [no zip container]',
+            aecg.filename, aecg.zipContainer, xml_filename)
         valrow = new_validation_row(xml_filename, "READFILE", "FILENAME")
         valrow["VALUE"] = xml_filename
         try:
@@ -2434,98 +2418,90 @@ def read_aecg(xml_filename: str, zip_container: str = "",
             valrow["VALIOUT"] = "PASSED"
             valrow["VALIMSG"] = ""
             logger.debug(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'XML file loaded and parsed')
+                '%s,%s,XML file loaded and parsed',
+                aecg.filename, aecg.zipContainer)
             if log_validation:
-                aecg.validatorResults = aecg.validatorResults.append(
-                    pd.DataFrame([valrow], columns=VALICOLS),
-                    ignore_index=True)
+                val_rows.append(valrow)
         except Exception as ex:
             msg = f'Could not open or parse XML file: \"{ex}\"'
             logger.error(
-                f'{aecg.filename},{aecg.zipContainer},{msg}')
+                '%s,%s,%s',
+                aecg.filename, aecg.zipContainer, msg)
             valrow["VALIOUT"] = "ERROR"
             valrow["VALIMSG"] = msg
             if log_validation:
-                aecg.validatorResults = aecg.validatorResults.append(
-                    pd.DataFrame([valrow], columns=VALICOLS),
-                    ignore_index=True)
+                val_rows.append(valrow)
         # Add row with zipcontainer rule as PASSED because there is no zip
         # container to test
         valrow = new_validation_row(xml_filename, "READFILE", "ZIPCONTAINER")
         valrow["VALIOUT"] = "PASSED"
         if log_validation:
-            aecg.validatorResults = aecg.validatorResults.append(
-                pd.DataFrame([valrow], columns=VALICOLS), ignore_index=True)
+            val_rows.append(valrow)
     else:
         logger.info(
-            f'{aecg.filename},{aecg.zipContainer},'
-            f'Reading aecg from {xml_filename} '
-            f'[zip container: {zip_container}]')
+            '%s,%s,Reading aecg from %s [zip container: %s]',
+            aecg.filename, aecg.zipContainer, xml_filename, zip_container)
         valrow = new_validation_row(xml_filename, "READFILE", "ZIPCONTAINER")
         valrow["VALUE"] = zip_container
         try:
             with zipfile.ZipFile(zip_container, "r") as zf:
                 logger.debug(
-                    f'{aecg.filename},{aecg.zipContainer},'
-                    f'Zip file opened')
+                    '%s,%s,Zip file opened',
+                    aecg.filename, aecg.zipContainer)
                 valrow2 = new_validation_row(xml_filename, "READFILE",
                                              "FILENAME")
                 valrow2["VALUE"] = xml_filename
                 try:
-                    aecg0 = zf.read(xml_filename)
-                    logger.debug(
-                        f'{aecg.filename},{aecg.zipContainer},'
-                        f'XML file read from zip file')
-                    try:
-                        aecg_doc = etree.fromstring(aecg0, parser)
+                    # Parse straight from the zip member instead of reading
+                    # it into memory first
+                    with zf.open(xml_filename) as xml_file:
                         logger.debug(
-                            f'{aecg.filename},{aecg.zipContainer},'
-                            f'XML file loaded and parsed')
-                    except Exception as ex:
-                        msg = f'Could not parse XML file: \"{ex}\"'
-                        logger.error(
-                            f'{aecg.filename},{aecg.zipContainer},{msg}')
-                        valrow2["VALIOUT"] = "ERROR"
-                        valrow2["VALIMSG"] = msg
-                        if log_validation:
-                            aecg.validatorResults = \
-                                aecg.validatorResults.append(
-                                    pd.DataFrame([valrow2], columns=VALICOLS),
-                                    ignore_index=True)
+                            '%s,%s,XML file opened in zip file',
+                            aecg.filename, aecg.zipContainer)
+                        try:
+                            aecg_doc = etree.parse(xml_file, parser)
+                            logger.debug(
+                                '%s,%s,XML file loaded and parsed',
+                                aecg.filename, aecg.zipContainer)
+                        except Exception as ex:
+                            msg = f'Could not parse XML file: \"{ex}\"'
+                            logger.error(
+                                '%s,%s,%s',
+                                aecg.filename, aecg.zipContainer, msg)
+                            valrow2["VALIOUT"] = "ERROR"
+                            valrow2["VALIMSG"] = msg
+                            if log_validation:
+                                # valrow2 is updated and logged again below
+                                val_rows.append(dict(valrow2))
                     valrow2["VALIOUT"] = "PASSED"
                     valrow2["VALIMSG"] = ""
                     if log_validation:
-                        aecg.validatorResults = aecg.validatorResults.append(
-                            pd.DataFrame([valrow2], columns=VALICOLS),
-                            ignore_index=True)
+                        val_rows.append(valrow2)
                 except Exception as ex:
                     msg = f'Could not find or read XML file in the zip file: '\
                           f'\"{ex}\"'
                     logger.error(
-                        f'{aecg.filename},{aecg.zipContainer},{msg}')
+                        '%s,%s,%s',
+                        aecg.filename, aecg.zipContainer, msg)
                     valrow2["VALIOUT"] = "ERROR"
                     valrow2["VALIMSG"] = msg
                     if log_validation:
-                        aecg.validatorResults = aecg.validatorResults.append(
-                            pd.DataFrame([valrow2], columns=VALICOLS),
-                            ignore_index=True)
+                        val_rows.append(valrow2)
             valrow["VALIOUT"] = "PASSED"
             valrow["VALIMSG"] = ""
             if log_validation:
-                aecg.validatorResults = aecg.validatorResults.append(
-                    pd.DataFrame([valrow], columns=VALICOLS),
-                    ignore_index=True)
+                val_rows.append(valrow)
         except Exception as ex:
             msg = f'Could not open zip file container: \"{ex}\"'
             logger.error(
-                f'{aecg.filename},{aecg.zipContainer},{msg}')
+                '%s,%s,%s',
+                aecg.filename, aecg.zipContainer, msg)
             valrow["VALIOUT"] = "ERROR"
             valrow["VALIMSG"] = msg
             if log_validation:
-                aecg.validatorResults = aecg.validatorResults.append(
-                    pd.DataFrame([valrow], columns=VALICOLS),
-                    ignore_index=True)
+                val_rows.append(valrow)
+
+    _append_validation_rows(aecg, val_rows)
 
     if aecg_doc is not None:
         aecg.xmlfound = True
@@ -2534,11 +2510,11 @@ def read_aecg(xml_filename: str, zip_container: str = "",
 
     if (aecg.xmlfound and
             (not log_validation or
-                ((aecg.validatorResults.shape[0] == 1 and
-                  aecg.validatorResults["VALIOUT"][0] == "PASSED") or
-                 (aecg.validatorResults.shape[0] == 2 and
-                  aecg.validatorResults["VALIOUT"][0] == "PASSED" and
-                  aecg.validatorResults["VALIOUT"][1] == "PASSED")))):
+                ((len(val_rows) == 1 and
+                  val_rows[0]["VALIOUT"] == "PASSED") or
+                 (len(val_rows) == 2 and
+                  val_rows[0]["VALIOUT"] == "PASSED" and
+                  val_rows[1]["VALIOUT"] == "PASSED")))):
         # =======================================
         # ECG file loaded and parsed to XML doc successfully
         # =======================================
@@ -2549,13 +2525,13 @@ def read_aecg(xml_filename: str, zip_container: str = "",
         # =======================================
         if in_memory_xml:
             logger.debug(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'XML document cached in memory')
+                '%s,%s,XML document cached in memory',
+                aecg.filename, aecg.zipContainer)
             aecg.xmldoc = aecg_doc
         else:
             logger.debug(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'XML document not cached in memory')
+                '%s,%s,XML document not cached in memory',
+                aecg.filename, aecg.zipContainer)
 
         # =======================================
         # Validate XML doc if schema was provided
@@ -2566,44 +2542,52 @@ def read_aecg(xml_filename: str, zip_container: str = "",
         if aecg_schema_filename is not None and aecg_schema_filename != "":
             valrow["VALUE"] = aecg_schema_filename
             try:
-                aecg_schema_doc = etree.parse(aecg_schema_filename)
+                aecg_schema = _xml_schema(aecg_schema_filename)
                 try:
-                    aecg_schema = etree.XMLSchema(aecg_schema_doc)
                     if aecg_schema.validate(aecg_doc):
                         logger.info(
-                            f'{aecg.filename},{aecg.zipContainer},'
-                            f'XML file passed Schema validation')
+                            '%s,%s,XML file passed Schema validation',
+                            aecg.filename, aecg.zipContainer)
                         aecg.isValid = "Y"
                         valrow["VALIOUT"] = "PASSED"
                         valrow["VALIMSG"] = ""
                     else:
                         msg = f'XML file did not pass Schema validation'
                         logger.warning(
-                            f'{aecg.filename},{aecg.zipContainer},{msg}')
+                            '%s,%s,%s',
+                            aecg.filename, aecg.zipContainer, msg)
                         aecg.isValid = "N"
                         valrow["VALIOUT"] = "ERROR"
                         valrow["VALIMSG"] = msg
                 except Exception as ex:
                     msg = f'XML Schema is not valid: \"{ex}\"'
                     logger.error(
-                            f'{aecg.filename},{aecg.zipContainer},{msg}')
+                        '%s,%s,%s',
+                        aecg.filename, aecg.zipContainer, msg)
                     valrow["VALIOUT"] = "ERROR"
                     valrow["VALIMSG"] = msg
+            except etree.XMLSchemaParseError as ex:
+                msg = f'XML Schema is not valid: \"{ex}\"'
+                logger.error(
+                    '%s,%s,%s',
+                    aecg.filename, aecg.zipContainer, msg)
+                valrow["VALIOUT"] = "ERROR"
+                valrow["VALIMSG"] = msg
             except Exception as ex:
                 msg = f'Schema file not found or parsing of schema failed: '\
                       f'\"{ex}\"'
                 logger.error(
-                            f'{aecg.filename},{aecg.zipContainer},{msg}')
+                    '%s,%s,%s',
+                    aecg.filename, aecg.zipContainer, msg)
                 valrow["VALIOUT"] = "ERROR"
                 valrow["VALIMSG"] = msg
         else:
             logger.warning(
-                f'{aecg.filename},{aecg.zipContainer},'
-                f'Schema not provided for XML validation')
+                '%s,%s,Schema not provided for XML validation',
+                aecg.filename, aecg.zipContainer)
 
         if log_validation:
-            aecg.validatorResults = aecg.validatorResults.append(
-                pd.DataFrame([valrow], columns=VALICOLS), ignore_index=True)
+            _append_validation_rows(aecg, [valrow])
 
         # =======================================
         # UUID and EGDTC and DEVICE
@@ -2640,6 +2624,12 @@ def read_aecg(xml_filename: str, zip_container: str = "",
         # =======================================
         aecg = parse_derived_waveform_info(aecg_doc, aecg, log_validation)
 
+        if not include_waveforms:
+            logger.debug(
+                '%s,%s,Waveforms were not requested by the user',
+                aecg.filename, aecg.zipContainer)
+            return aecg
+
         # =======================================
         # Rhythm Waveforms timeseries
         # =======================================
@@ -2662,3 +2652,70 @@ def read_aecg(xml_filename: str, zip_container: str = "",
             aecg_doc, aecg, log_validation)
 
     return aecg
+
+
+def _read_aecg_file(xml_zip: Tuple[str, str], **kwargs) -> Aecg:
+    """Reads one aECG file with :any:`read_aecg`
+
+    Worker of :any:`read_aecg_batch`.
+
+    Args:
+        xml_zip (Tuple[str, str]): aECG xml filename and zip container (empty
+            string if the xml file is not stored in a zip file).
+        **kwargs: Keyword arguments passed to :any:`read_aecg`.
+
+    Returns:
+        Aecg: An aECG object instantiated with the information read from
+        the file.
+    """
+    return read_aecg(xml_zip[0], xml_zip[1], **kwargs)
+
+
+def read_aecg_batch(files: List[Tuple[str, str]],
+                    include_digits: bool = False,
+                    aecg_schema_filename: str = "",
+                    ns_clean: bool = True, remove_blank_text: bool = True,
+                    log_validation: bool = False,
+                    include_waveforms: bool = True,
+                    num_processes: int = 1) -> Tuple[List[Aecg],
+                                                     pd.DataFrame]:
+    """Reads several aECG HL7 XML files with :any:`read_aecg`
+
+    Each file is read and parsed in a worker process, so independent files
+    are processed in parallel. Parsed XML documents are not kept in memory
+    (i.e., :any:`read_aecg` is called with `in_memory_xml` False).
+
+    Args:
+        files (List[Tuple[str, str]]): List of (xml filename, zip container)
+            tuples. Zip container is an empty string for xml files not stored
+            in a zip file.
+        include_digits (bool, optional): Waveform values are not read nor
+            parsed if False. Defaults to False.
+        aecg_schema_filename (str, optional): xsd file used for validating
+            the aECG xml documents. Schema validation is not performed if
+            empty string is provided. Defaults to "".
+        ns_clean (bool, optional): Indicates whether to clean up namespaces
+            during XML parsing. Defaults to True.
+        remove_blank_text (bool, optional): Indicates whether to clean up blank
+            text during parsing. Defaults to True.
+        log_validation (bool, optional): Indicates whether to collect the
+            validation results. Defaults to False.
+        include_waveforms (bool, optional): Rhythm and derived waveforms
+            timeseries and annotations are not parsed if False, leaving the
+            leads, annotation sets, RHYTHMTIME and DERIVEDTIME empty.
+            Defaults to True.
+        num_processes (int, optional): Number of parallel processes. Use 1
+            for no parallel processing. Defaults to 1.
+
+    Returns:
+        Tuple[List[Aecg], pd.DataFrame]: aECGs read (in the same order as
+        `files`) and the validation results of all files.
+    """
+    return _map_files(partial(_read_aecg_file,
+                              include_digits=include_digits,
+                              aecg_schema_filename=aecg_schema_filename,
+                              ns_clean=ns_clean,
+                              remove_blank_text=remove_blank_text,
+                              log_validation=log_validation,
+                              include_waveforms=include_waveforms),
+                      files, num_processes)
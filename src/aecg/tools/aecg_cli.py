@@ -15,12 +15,16 @@ import argparse
 import datetime
 import logging
 import logging.config
+import matplotlib
 import matplotlib.pyplot as plt
 import os
 import pandas as pd
 
 from tqdm.cli import tqdm
 
+# Figures are only written to files, so no interactive backend is needed
+matplotlib.use("Agg")
+
 __toolname__ = "aecg.tools.aecg_clt"
 
 
@@ -50,26 +54,68 @@ def valid_appnum(appnum: str) -> str:
     return appnum
 
 
+def schema_filename(args) -> str:
+    """Returns the aECG schema to validate against if requested in `args`
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+
+    Returns:
+        str: Location of the aECG schema if `args.validate` is True, empty
+        string (i.e., no schema validation) otherwise.
+    """
+    if args.validate:
+        return aecg.get_aecg_schema_location()
+    return ""
+
+
+def add_validate_args(parser: argparse.ArgumentParser) -> None:
+    """Adds the --validate/--no-validate options to `parser`
+
+    Schema validation is not performed by default.
+
+    Args:
+        parser (argparse.ArgumentParser): Parser of a sub-command reading an
+            aECG XML file
+    """
+    parser.add_argument(
+        "--validate",
+        dest="validate",
+        action="store_true",
+        help="Validate the aECG XML file against the aECG schema")
+    parser.add_argument(
+        "--no-validate",
+        dest="validate",
+        action="store_false",
+        help="Do not validate the aECG XML file against the aECG schema "
+             "(default)")
+    parser.set_defaults(validate=False)
+
+
 def inspect_aecg(args):
     logger = logging.getLogger(__toolname__ + '.inspect_aecg')
     logger.info(
-        f"{args.aecg_xml},{args.aecg_zip},Inspecting: '{args.aecg_xml}'")
+        "%s,%s,Inspecting: '%s'",
+        args.aecg_xml, args.aecg_zip, args.aecg_xml)
     zipfile = ''
     if args.aecg_zip is not None:
         zipfile = args.aecg_zip
+    # Inspection only logs the parsing, so waveforms are not parsed
     the_aecg = aecg.io.read_aecg(
         args.aecg_xml,
         zip_container=zipfile,
-        include_digits=True,
-        aecg_schema_filename=aecg.get_aecg_schema_location())
+        include_digits=False,
+        aecg_schema_filename=schema_filename(args),
+        include_waveforms=False)
     logger.info(
-        f"{args.aecg_xml},{args.aecg_zip},Inspection finished")
+        '%s,%s,Inspection finished', args.aecg_xml, args.aecg_zip)
 
 
 def print_aecg(args):
     logger = logging.getLogger(__toolname__ + '.print_aecg')
     logger.info(
-        f"{args.aecg_xml},{args.aecg_zip},Printing: '{args.aecg_xml}'")
+        "%s,%s,Printing: '%s'",
+        args.aecg_xml, args.aecg_zip, args.aecg_xml)
     zipfile = ''
     if args.aecg_zip is not None:
         zipfile = args.aecg_zip
@@ -77,31 +123,30 @@ def print_aecg(args):
         args.aecg_xml,
         zip_container=zipfile,
         include_digits=True,
-        aecg_schema_filename=aecg.get_aecg_schema_location())
+        aecg_schema_filename=schema_filename(args))
     ecgwf = the_aecg.rhythm_as_df()
     fig = aecg.utils.plot_aecg(
         ecgwf, the_aecg.rhythm_anns_in_ms(),
         aecg.utils.ECG_plot_layout.STACKED)
-    fig.savefig('aecg_rhythm.' + args.format, dpi=300)
+    fig.savefig('aecg_rhythm.' + args.format, dpi=args.dpi)
     logger.info(
-        f"{args.aecg_xml},{args.aecg_zip},"
-        f"Rhythm strip printed to aecg_rhythm.{args.format}")
+        '%s,%s,Rhythm strip printed to aecg_rhythm.%s',
+        args.aecg_xml, args.aecg_zip, args.format)
     ecgwf = the_aecg.derived_as_df()
     fig = aecg.utils.plot_aecg(
         ecgwf, the_aecg.derived_anns_in_ms(),
         aecg.utils.ECG_plot_layout.STACKED)
-    fig.savefig('aecg_derived.' + args.format, dpi=300)
+    fig.savefig('aecg_derived.' + args.format, dpi=args.dpi)
     logger.info(
-        f"{args.aecg_xml},{args.aecg_zip},"
-        f"Derived beat printed to aecg_derived.{args.format}")
+        '%s,%s,Derived beat printed to aecg_derived.%s',
+        args.aecg_xml, args.aecg_zip, args.format)
 
 
 def index_study_path(args):
     logger = logging.getLogger(__toolname__ + '.index_study_path_aecg')
     startmsg = f"Indexing: '{args.dir}' to: '{args.oxlsx}'"
     print(f"{startmsg}")
-    logger.info(
-        f",,{startmsg}")
+    logger.info(',,%s', startmsg)
     studyindex_info = aecg.tools.indexer.StudyInfo()
     studyindex_info.StudyDir = os.path.normpath(args.dir)
     studyindex_info.IndexFile = os.path.normpath(args.oxlsx)
@@ -121,7 +166,8 @@ def index_study_path(args):
     studyindex_info.Sponsor = args.sponsor
 
     n_cores = args.nprocs
-    pbar = tqdm(desc=f"Indexing {studyindex_info.StudyDir} directory")
+    pbar = tqdm(desc=f"Indexing {studyindex_info.StudyDir} directory",
+                mininterval=0.2)
     mycb = aecg.tools.indexer.IndexingProgressCallBack(pbar)
     studyindex_df = aecg.tools.indexer.index_study(
         studyindex_info,
@@ -169,6 +215,7 @@ def main():
         type=str,
         help="Filename of the zip file containing the aECG XML file to be "
              "inspected")
+    add_validate_args(parser_inspect)
     parser_inspect.set_defaults(func=inspect_aecg)
 
     # Plot an aECG xml file
@@ -191,6 +238,13 @@ def main():
         default='png',
         help="Format of the output files where to print the aECG "
              "(default: png) ")
+    parser_inspect.add_argument(
+        "--dpi",
+        type=int,
+        default=150,
+        help="Resolution in dots per inch of the png output files. pdf "
+             "output files are vector graphics (default: 150)")
+    add_validate_args(parser_inspect)
     parser_inspect.set_defaults(func=print_aecg)
 
     # Index aECG xml files in a directory
@@ -5,8 +5,9 @@ See authors, license and disclaimer at the top level directory of this project.
 """
 
 from lxml import etree
-from copy import deepcopy
+from multiprocessing import Pool
 from pathlib import Path
+from typing import Dict, List, Tuple
 
 import os
 import sys
@@ -15,122 +16,163 @@ import aecg
 
 aecgdir = os.path.dirname(aecg.core.__file__)
 
-# aECG file to use as input
-xml_filename = os.path.normpath(
-    os.path.join(
-        aecgdir,
-        "data/hl7/2003-12 Schema/example/Example aECG.xml"))
-if not Path(xml_filename).is_file():
-    print(f"aECG filename({xml_filename}) is not available.")
-    sys.exit(-1)
-
-# Parse aECG base file
+# XPath expressions used to locate the nodes to modify (compiled once)
+NS = {'ns': 'urn:hl7-org:v3'}
+XP_STUDYID = etree.XPath('//ns:componentOf/ns:clinicalTrial/ns:id',
+                         namespaces=NS)
+XP_ROOTID = etree.XPath('/ns:AnnotatedECG/ns:id', namespaces=NS)
+XP_SUBJID = etree.XPath(
+    '//ns:subjectAssignment/ns:subject/ns:trialSubject/ns:id', namespaces=NS)
+XP_TP = etree.XPath('//ns:componentOf/ns:timepointEvent/ns:code',
+                    namespaces=NS)
+XP_SERIES_LOW = etree.XPath(
+    '//ns:component/ns:series/ns:effectiveTime/ns:low', namespaces=NS)
+XP_SERIES_HEAD = etree.XPath(
+    '//ns:series/ns:component/ns:sequenceSet/'
+    'ns:component/ns:sequence/ns:value/ns:head', namespaces=NS)
+XP_SERIES_HIGH = etree.XPath(
+    '//ns:component/ns:series/ns:effectiveTime/ns:high', namespaces=NS)
+XP_DERIV_LOW = etree.XPath(
+    '//ns:component/ns:derivedSeries/ns:effectiveTime/ns:low', namespaces=NS)
+XP_DERIV_HIGH = etree.XPath(
+    '//ns:component/ns:derivedSeries/ns:effectiveTime/ns:high', namespaces=NS)
+# Times of the base aECG (2002-11-22 09h) to shift to each file start time
+BASE_TIME_PREFIX = "2002112209"
+XP_BASE_TIMES = etree.XPath(
+    f'//*[starts-with(@value, "{BASE_TIME_PREFIX}")]')
+
+# Parser of the base aECG and of the copies made from it
 parser = etree.XMLParser(ns_clean=True, remove_blank_text=True)
 
-aecg_doc = etree.parse(xml_filename, parser)
-
-# Define output path
-output_path = os.path.normpath(
-    os.path.join(
-        aecgdir,
-        "data/ectd_example/FDA000003/0000/m5/datasets/Test/misc/aecg"))
-
-if not Path(output_path).is_dir():
-    Path(output_path).mkdir(parents=True)
-
-# Define output files
-output_files = {
-    "subject1": [
-        {"timepoint": "Predose", "start": 20021122091000},
-        {"timepoint": "1hour", "start": 20021122101000},
-        {"timepoint": "2hour", "start": 20021122111000}
-    ],
-    "subject2": [
-        {"timepoint": "Predose", "start": 20021122091000},
-        {"timepoint": "1hour", "start": 20021122101000},
-        {"timepoint": "2hour", "start": 20021122111000}
-    ]
-}
-
-# Make general changes
-studyid = "Test"
-studyidnode = aecg_doc.getroot().xpath(
-    '//ns:componentOf/ns:clinicalTrial/ns:id',
-    namespaces={'ns': 'urn:hl7-org:v3'})
-if studyidnode is not None and len(studyidnode) == 1:
-    studyidnode[0].set('extension', studyid)
-
-# Create files
-for subjectid, files in output_files.items():
-    num = 0
-
-    for file in files:
-        # Prepare output location and copy base aECG
-        output_file = os.path.join(output_path, f"{subjectid}_{num}.xml")
-        newaecg = deepcopy(aecg_doc)
 
-        # Base modifications
-        rootid = newaecg.getroot().xpath(
-            '/ns:AnnotatedECG/ns:id', namespaces={'ns': 'urn:hl7-org:v3'})
+def write_examples(task: Tuple[int, Dict, List[str], bytes, str]):
+    """Writes the example aECG files of one file specification
+
+    The time modifications are applied once and only the subject specific
+    ids are changed before writing the file of each subject.
+
+    Args:
+        task (Tuple[int, Dict, List[str], bytes, str]): file number,
+            modifications for the file (timepoint and start time), ids of the
+            subjects sharing this file, serialized base aECG and output
+            directory.
+    """
+    num, file, subjectids, template, output_path = task
+    # Copy base aECG
+    newaecg = etree.fromstring(template, parser).getroottree()
+
+    # Additional modifications
+    for mod, value in file.items():
+        # Timepoint
+        if mod == "timepoint":
+            node = XP_TP(newaecg)
+            if node is not None and len(node) == 1:
+                node[0].set('code', value)
+                node[0].set('displayName', value)
+
+        # Effective start / stop
+        elif mod == "start":
+            node = XP_SERIES_LOW(newaecg)
+            if node is not None and len(node) == 1:
+                node[0].set('value', str(value))
+
+            node = XP_SERIES_HEAD(newaecg)
+            if node is not None and len(node) == 1:
+                node[0].set('value', str(value))
+
+            node = XP_SERIES_HIGH(newaecg)
+            if node is not None and len(node) == 1:
+                node[0].set('value', str(value + 10))
+
+            node = XP_DERIV_LOW(newaecg)
+            if node is not None and len(node) == 1:
+                node[0].set('value', str(value))
+
+            node = XP_DERIV_HIGH(newaecg)
+            if node is not None and len(node) == 1:
+                node[0].set('value', str(value + 10))
+
+    # Replace the original 2002112209 times with the start times
+    time_prefix = str(file["start"])[0:-4]
+    for node in XP_BASE_TIMES(newaecg):
+        node.set('value',
+                 time_prefix + node.get('value')[len(BASE_TIME_PREFIX):])
+
+    # Base modifications, made for each subject on the same document
+    rootid = XP_ROOTID(newaecg)
+    subjid = XP_SUBJID(newaecg)
+    for subjectid in subjectids:
         if rootid is not None and len(rootid) == 1:
             rootid[0].set('extension', f"{subjectid}_{num}")
 
-        subjid = newaecg.getroot().xpath(
-            '//ns:subjectAssignment/ns:subject/ns:trialSubject/ns:id',
-            namespaces={'ns': 'urn:hl7-org:v3'})
         if subjid is not None and len(subjid) == 1:
             subjid[0].set('extension', subjectid)
 
-        # Additional modifications
-        for mod, value in file.items():
-            # Timepoint
-            if mod == "timepoint":
-                node = newaecg.getroot().xpath(
-                    '//ns:componentOf/ns:timepointEvent/ns:code',
-                    namespaces={'ns': 'urn:hl7-org:v3'})
-
-                if node is not None and len(node) == 1:
-                    node[0].set('code', value)
-                    node[0].set('displayName', value)
-
-            # Effective start / stop
-            elif mod == "start":
-                node = newaecg.getroot().xpath(
-                    '//ns:component/ns:series/ns:effectiveTime/ns:low',
-                    namespaces={'ns': 'urn:hl7-org:v3'})
-                if node is not None and len(node) == 1:
-                    node[0].set('value', str(value))
-
-                node = newaecg.getroot().xpath(
-                    '//ns:series/ns:component/ns:sequenceSet/'
-                    'ns:component/ns:sequence/ns:value/ns:head',
-                    namespaces={'ns': 'urn:hl7-org:v3'})
-                if node is not None and len(node) == 1:
-                    node[0].set('value', str(value))
-
-                node = newaecg.getroot().xpath(
-                    '//ns:component/ns:series/ns:effectiveTime/ns:high',
-                    namespaces={'ns': 'urn:hl7-org:v3'})
-                if node is not None and len(node) == 1:
-                    node[0].set('value', str(value + 10))
-
-                node = newaecg.getroot().xpath(
-                    '//ns:component/ns:derivedSeries/ns:effectiveTime/ns:low',
-                    namespaces={'ns': 'urn:hl7-org:v3'})
-                if node is not None and len(node) == 1:
-                    node[0].set('value', str(value))
-
-                node = newaecg.getroot().xpath(
-                    '//ns:component/ns:derivedSeries/ns:effectiveTime/ns:high',
-                    namespaces={'ns': 'urn:hl7-org:v3'})
-                if node is not None and len(node) == 1:
-                    node[0].set('value', str(value + 10))
-
-        # Replace the original 2002112209 times with the start times
-        xmlstr = etree.tostring(newaecg, pretty_print=True).decode()
-        xmlstr = xmlstr.replace("2002112209", str(file["start"])[0:-4])
         # Save
-        with open(output_file, "w") as f:
-            f.write(xmlstr)
-
-        num = num + 1
+        output_file = os.path.join(output_path, f"{subjectid}_{num}.xml")
+        newaecg.write(output_file, pretty_print=True)
+
+
+def main():
+    # aECG file to use as input
+    xml_filename = os.path.normpath(
+        os.path.join(
+            aecgdir,
+            "data/hl7/2003-12 Schema/example/Example aECG.xml"))
+    if not Path(xml_filename).is_file():
+        print(f"aECG filename({xml_filename}) is not available.")
+        sys.exit(-1)
+
+    # Parse aECG base file
+    aecg_doc = etree.parse(xml_filename, parser)
+
+    # Define output path
+    output_path = os.path.normpath(
+        os.path.join(
+            aecgdir,
+            "data/ectd_example/FDA000003/0000/m5/datasets/Test/misc/aecg"))
+
+    if not Path(output_path).is_dir():
+        Path(output_path).mkdir(parents=True)
+
+    # Define output files
+    output_files = {
+        "subject1": [
+            {"timepoint": "Predose", "start": 20021122091000},
+            {"timepoint": "1hour", "start": 20021122101000},
+            {"timepoint": "2hour", "start": 20021122111000}
+        ],
+        "subject2": [
+            {"timepoint": "Predose", "start": 20021122091000},
+            {"timepoint": "1hour", "start": 20021122101000},
+            {"timepoint": "2hour", "start": 20021122111000}
+        ]
+    }
+
+    # Make general changes
+    studyid = "Test"
+    studyidnode = XP_STUDYID(aecg_doc)
+    if studyidnode is not None and len(studyidnode) == 1:
+        studyidnode[0].set('extension', studyid)
+
+    # Serialized base aECG, parsed again for each output file (much cheaper
+    # than deep copying the parsed document)
+    template = etree.tostring(aecg_doc)
+
+    # Group the subjects with the same file specifications, so the time
+    # modifications are made once for all of them
+    file_subjects = {}
+    for subjectid, files in output_files.items():
+        for num, file in enumerate(files):
+            file_subjects.setdefault(
+                (num, tuple(file.items())), []).append(subjectid)
+
+    # Create files (each file is independent, so they are written in parallel)
+    tasks = [(num, dict(file), subjectids, template, output_path)
+             for (num, file), subjectids in file_subjects.items()]
+    with Pool() as pool:
+        pool.map(write_examples, tasks)
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,10 @@ import pandas as pd
 class IndexingProgressCallBack:
     """
     Class to connect and update tqdm progress bars from aecg.indexing
+
+    Progress is accumulated and the progress bar is updated once every
+    1/500th of the total number of elements (and on completion), so large
+    studies do not trigger a progress bar update per file.
     """
     def __init__(self, pbar: tqdm):
         """
@@ -28,11 +32,17 @@ class IndexingProgressCallBack:
             pbar (tqdm): Progress bar
         """
         self.pbar = pbar
+        self.pending = 0
 
     def emit(self, i, j):
         if j != self.pbar.total:
             self.pbar.reset(j)
-        self.pbar.update(i)
+            self.pending = 0
+        self.pending += i
+        if (self.pending >= max(1, j // 500)) or \
+                (self.pbar.n + self.pending >= j):
+            self.pbar.update(self.pending)
+            self.pending = 0
 
 
 class AnnotationMethod(Enum):
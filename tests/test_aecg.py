@@ -37,6 +37,8 @@ advantage in regulatory decisions.
 import os
 import sys
 
+import pytest
+
 import aecg
 
 
@@ -635,3 +637,245 @@ def test_new_validation_row():
 
     # Cleanup -- not needed
 # end test_utils_new_validation_row
+
+
+@pytest.mark.parametrize("the_num_processes", [1, 2])
+def test_parse_info_batch(tmp_path, the_num_processes):
+    """
+    Test parsing the information of several xml files returns one aECG per
+    file in the same order and merges their validation results, with error
+    rows for files that could not be read
+    """
+    # Setup
+    the_example_filename = os.path.normpath(
+        os.path.join(
+            os.path.dirname(aecg.core.__file__),
+            "data/hl7/2003-12 Schema/example/Example aECG.xml"))
+    the_minimum_filename = os.path.normpath(
+        os.path.join(
+            os.path.dirname(aecg.core.__file__),
+            "data/examples/minimum_aecg.xml"))
+    the_missing_filename = str(tmp_path / "nonexisting.xml")
+    the_malformed_filename = str(tmp_path / "malformed.xml")
+    with open(the_malformed_filename, "w") as xml_file:
+        xml_file.write('<AnnotatedECG xmlns="urn:hl7-org:v3"><component>')
+    the_zip_container = os.path.normpath(
+        os.path.join(
+            os.path.dirname(aecg.core.__file__), "data/hl7.zip"))
+    the_files = [(the_example_filename, ""),
+                 (the_missing_filename, ""),
+                 ("hl7/2003-12 Schema/example/Example aECG.xml",
+                  the_zip_container),
+                 (the_malformed_filename, ""),
+                 (the_minimum_filename, "")]
+
+    # Exercise
+    the_aecgs, the_valpd = aecg.io.parse_info_batch(
+        the_files, log_validation=True, num_processes=the_num_processes)
+
+    # Verify
+    assert [(a.filename, a.zipContainer) for a in the_aecgs] == the_files
+    assert [a.xmlfound for a in the_aecgs] == [True, False, True, False,
+                                               True]
+    for the_aecg in [the_aecgs[0], the_aecgs[2], the_aecgs[4]]:
+        truth_aecg = aecg.io.read_aecg(the_aecg.filename,
+                                       the_aecg.zipContainer,
+                                       include_waveforms=False)
+        assert the_aecg.UUID == truth_aecg.UUID
+        assert the_aecg.EGDTC == truth_aecg.EGDTC
+        assert the_aecg.USUBJID == truth_aecg.USUBJID
+        assert the_aecg.STUDYID == truth_aecg.STUDYID
+        assert the_aecg.TPT == truth_aecg.TPT
+    assert the_valpd.shape[0] == sum(a.validatorResults.shape[0]
+                                     for a in the_aecgs)
+    assert list(the_valpd.columns) == aecg.core.VALICOLS
+    assert list(the_valpd["EGXFN"].drop_duplicates()) == \
+        [xml_filename for xml_filename, _ in the_files]
+    for the_xml_filename in [the_missing_filename, the_malformed_filename]:
+        the_rows = the_valpd[the_valpd["EGXFN"] == the_xml_filename]
+        assert the_rows.shape[0] == 1
+        assert the_rows.iloc[0]["VALIGRP"] == "READFILE"
+        assert the_rows.iloc[0]["PARAM"] == "FILENAME"
+        assert the_rows.iloc[0]["VALIOUT"] == "ERROR"
+    for the_aecg in [the_aecgs[0], the_aecgs[2], the_aecgs[4]]:
+        assert the_aecg.RHYTHMLEADS == []
+        assert the_aecg.RHYTHMANNS == []
+
+    # Cleanup -- not needed
+# end test_parse_info_batch
+
+
+def assert_same_aecg(the_aecg, truth_aecg):
+    """
+    Asserts `the_aecg` holds the same information as `truth_aecg`
+    """
+    for attr in aecg.core.Aecg.__slots__:
+        if attr in ["xmldoc", "_validator_rows", "_validator_df",
+                    "RHYTHMLEADS", "DERIVEDLEADS",
+                    "RHYTHMANNS", "DERIVEDANNS"]:
+            continue
+        assert getattr(the_aecg, attr) == getattr(truth_aecg, attr), attr
+    for leads, truth_leads in [
+            (the_aecg.RHYTHMLEADS, truth_aecg.RHYTHMLEADS),
+            (the_aecg.DERIVEDLEADS, truth_aecg.DERIVEDLEADS)]:
+        assert len(leads) == len(truth_leads)
+        for lead, truth_lead in zip(leads, truth_leads):
+            for attr in aecg.core.AecgLead.__slots__:
+                if attr == "digits":
+                    assert lead.digits.tolist() == truth_lead.digits.tolist()
+                else:
+                    assert getattr(lead, attr) == getattr(truth_lead, attr)
+    for annsets, truth_annsets in [
+            (the_aecg.RHYTHMANNS, truth_aecg.RHYTHMANNS),
+            (the_aecg.DERIVEDANNS, truth_aecg.DERIVEDANNS)]:
+        assert [(s.person, s.device, s.anns) for s in annsets] == \
+            [(s.person, s.device, s.anns) for s in truth_annsets]
+    assert the_aecg.validatorResults.equals(truth_aecg.validatorResults)
+
+
+@pytest.mark.parametrize("the_num_processes", [1, 2])
+def test_read_aecg_batch(the_num_processes):
+    """
+    Test reading several xml files in a batch returns the same aECGs as
+    reading them one by one
+    """
+    # Setup
+    the_zip_container = os.path.normpath(
+        os.path.join(
+            os.path.dirname(aecg.core.__file__), "data/hl7.zip"))
+    the_files = [
+        (os.path.normpath(os.path.join(
+            os.path.dirname(aecg.core.__file__),
+            "data/hl7/2003-12 Schema/example/Example aECG.xml")), ""),
+        (os.path.normpath(os.path.join(
+            os.path.dirname(aecg.core.__file__),
+            "data/examples/minimum_aecg.xml")), ""),
+        ("hl7/2003-12 Schema/example/Example aECG.xml", the_zip_container),
+        (os.path.normpath(os.path.join(
+            os.path.dirname(aecg.core.__file__),
+            "data/nonexisting.xml")), "")]
+    truth_aecgs = [aecg.io.read_aecg(xml_filename, zip_container,
+                                     include_digits=True,
+                                     log_validation=True)
+                   for xml_filename, zip_container in the_files]
+
+    # Exercise
+    the_aecgs, the_valpd = aecg.io.read_aecg_batch(
+        the_files, include_digits=True, log_validation=True,
+        num_processes=the_num_processes)
+
+    # Verify
+    assert len(the_aecgs) == len(truth_aecgs)
+    for the_aecg, truth_aecg in zip(the_aecgs, truth_aecgs):
+        assert_same_aecg(the_aecg, truth_aecg)
+    assert the_valpd.shape[0] == sum(a.validatorResults.shape[0]
+                                     for a in truth_aecgs)
+
+    # Cleanup -- not needed
+# end test_read_aecg_batch
+
+
+def test_read_existing_xmlfile_without_waveforms():
+    """
+    Test reading an xml file without parsing its waveforms timeseries and
+    annotations
+    """
+    # Setup
+    the_xml_filename = os.path.normpath(
+        os.path.join(
+            os.path.dirname(aecg.core.__file__),
+            "data/hl7/2003-12 Schema/example/Example aECG.xml"))
+    truth_aecg = aecg.io.read_aecg(the_xml_filename, include_digits=True,
+                                   log_validation=True)
+
+    # Exercise
+    the_aecg = aecg.io.read_aecg(the_xml_filename, include_digits=True,
+                                 log_validation=True,
+                                 include_waveforms=False)
+
+    # Verify
+    assert the_aecg.xmlfound
+    assert the_aecg.RHYTHMLEADS == []
+    assert the_aecg.DERIVEDLEADS == []
+    assert the_aecg.RHYTHMANNS == []
+    assert the_aecg.DERIVEDANNS == []
+    assert len(truth_aecg.RHYTHMLEADS) > 0
+    assert len(truth_aecg.RHYTHMANNS) > 0
+    # RHYTHMTIME and DERIVEDTIME are read with the waveforms timeseries
+    for attr in aecg.core.Aecg.__slots__:
+        if attr in ["xmldoc", "_validator_rows", "_validator_df",
+                    "RHYTHMTIME", "DERIVEDTIME",
+                    "RHYTHMLEADS", "DERIVEDLEADS",
+                    "RHYTHMANNS", "DERIVEDANNS"]:
+            continue
+        assert getattr(the_aecg, attr) == getattr(truth_aecg, attr), attr
+    # Header and waveform information are validated before the waveforms
+    num_rows = the_aecg.validatorResults.shape[0]
+    assert 0 < num_rows < truth_aecg.validatorResults.shape[0]
+    assert the_aecg.validatorResults.equals(
+        truth_aecg.validatorResults.iloc[:num_rows])
+
+    # Cleanup -- not needed
+# end test_read_existing_xmlfile_without_waveforms
+
+
+def test_validator_results_rebuilt_after_appending_rows():
+    """
+    Test the validation results DataFrame is rebuilt when rows are appended
+    and reused otherwise
+    """
+    # Setup
+    the_aecg = aecg.core.Aecg()
+    the_rows = [aecg.new_validation_row("a.xml", "READFILE", "FILENAME"),
+                aecg.new_validation_row("a.xml", "READFILE", "ZIPCONTAINER"),
+                aecg.new_validation_row("a.xml", "SCHEMA", "VALIDATION")]
+
+    # Exercise and verify
+    assert the_aecg.validatorResults.shape[0] == 0
+
+    aecg.io._append_validation_rows(the_aecg, the_rows[:2])
+    the_valpd = the_aecg.validatorResults
+    assert the_valpd.shape[0] == 2
+    assert list(the_valpd.columns) == aecg.core.VALICOLS
+    assert the_valpd.to_dict("records") == the_rows[:2]
+    assert the_aecg.validatorResults is the_valpd
+
+    aecg.io._append_validation_rows(the_aecg, the_rows[2:])
+    assert the_aecg.validatorResults is not the_valpd
+    assert the_aecg.validatorResults.to_dict("records") == the_rows
+
+    # Cleanup -- not needed
+# end test_validator_results_rebuilt_after_appending_rows
+
+
+def test_validator_results_setter():
+    """
+    Test assigning a validation results DataFrame round-trips and keeps
+    accepting new rows
+    """
+    # Setup
+    the_xml_filename = os.path.normpath(
+        os.path.join(
+            os.path.dirname(aecg.core.__file__),
+            "data/examples/minimum_aecg.xml"))
+    the_valpd = aecg.io.read_aecg(the_xml_filename,
+                                  log_validation=True).validatorResults
+    the_row = aecg.new_validation_row(the_xml_filename, "SCHEMA",
+                                      "VALIDATION")
+    the_aecg = aecg.core.Aecg()
+
+    # Exercise
+    the_aecg.validatorResults = the_valpd
+
+    # Verify
+    assert the_aecg.validatorResults.equals(the_valpd)
+    assert the_aecg.validatorResults.to_dict("records") == \
+        the_valpd.to_dict("records")
+
+    aecg.io._append_validation_rows(the_aecg, [the_row])
+    assert the_aecg.validatorResults.shape[0] == the_valpd.shape[0] + 1
+    assert the_aecg.validatorResults.iloc[:-1].equals(the_valpd)
+    assert the_aecg.validatorResults.iloc[-1].to_dict() == the_row
+
+    # Cleanup -- not needed
+# end test_validator_results_setter
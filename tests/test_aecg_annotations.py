@@ -0,0 +1,222 @@
+"""Unit tests for aecg package: waveform annotations parsing.
+
+**Authors**
+
+***Jose Vicente Ruiz*** <jose.vicenteruiz@fda.hhs.gov><br>
+
+    Division of Cardiology and Nephrology
+    Office of Cardiology, Hematology, Endocrinology and Nephrology
+    Office of New Drugs
+    Center for Drug Evaluation and Research
+    U.S. Food and Drug Administration
+
+
+* LICENSE *
+===========
+This code is in the public domain within the United States, and copyright and
+related rights in the work worldwide are waived through the CC0 1.0 Universal
+Public Domain Dedication. This example is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See DISCLAIMER section
+below, the COPYING file in the root directory of this project and
+https://creativecommons.org/publicdomain/zero/1.0/ for more details.
+
+* Disclaimer *
+==============
+FDA assumes no responsibility whatsoever for use by other parties of the
+Software, its source code, documentation or compiled executables, and makes no
+guarantees, expressed or implied, about its quality, reliability, or any other
+characteristic. Further, FDA makes no representations that the use of the
+Software will not infringe any patent or proprietary rights of third parties.
+The use of this code in no way implies endorsement by the FDA or confers any
+advantage in regulatory decisions.
+
+"""
+
+
+import glob
+import os
+
+import pytest
+from lxml import etree
+
+import aecg
+
+
+def example_aecg_files():
+    """
+    Returns the aECG xml files with annotations shipped with the package
+    """
+    data_dir = os.path.join(os.path.dirname(aecg.core.__file__), "data")
+    return [os.path.normpath(os.path.join(
+                data_dir, "hl7/2003-12 Schema/example/Example aECG.xml"))] + \
+        sorted(glob.glob(os.path.join(
+            data_dir, "ectd_example/**/*.xml"), recursive=True))
+
+
+def test_parse_annotations_stream_vs_dom():
+    """
+    Test streaming and parsed document modes of parse_annotations_stream
+    return the same annotation sets and validation results
+    """
+    for the_xml_filename in example_aecg_files():
+        # Setup
+        the_aecg_doc = etree.parse(the_xml_filename)
+
+        # Exercise
+        the_stream_aecg = aecg.io.parse_annotations_stream(
+            the_xml_filename, log_validation=True)
+        the_dom_aecg = aecg.io.parse_annotations_stream(
+            the_xml_filename, aecg_doc=the_aecg_doc, log_validation=True)
+
+        # Verify
+        assert the_stream_aecg.xmlfound
+        assert the_dom_aecg.xmlfound
+        for stream_sets, dom_sets in [
+                (the_stream_aecg.RHYTHMANNS, the_dom_aecg.RHYTHMANNS),
+                (the_stream_aecg.DERIVEDANNS, the_dom_aecg.DERIVEDANNS)]:
+            assert len(stream_sets) == len(dom_sets)
+            for stream_set, dom_set in zip(stream_sets, dom_sets):
+                assert stream_set.person == dom_set.person
+                assert stream_set.device == dom_set.device
+                assert stream_set.anns == dom_set.anns
+        assert the_stream_aecg.validatorResults.shape[0] > 0
+        assert the_stream_aecg.validatorResults.equals(
+            the_dom_aecg.validatorResults)
+
+    # Cleanup -- not needed
+# end test_parse_annotations_stream_vs_dom
+
+
+def test_parse_annotations_stream_vs_read_aecg():
+    """
+    Test streaming the annotations returns the same annotation sets and
+    validation results as read_aecg, where each annotation set includes the
+    annotations of all the annotation sets of its waveform
+    """
+    for the_xml_filename in example_aecg_files():
+        # Setup
+        the_aecg = aecg.io.read_aecg(the_xml_filename, log_validation=True)
+        truth_valpd = the_aecg.validatorResults[
+            the_aecg.validatorResults["PARAM"].str.startswith("ANNSET")
+        ].reset_index(drop=True)
+
+        # Exercise
+        the_stream_aecg = aecg.io.parse_annotations_stream(
+            the_xml_filename, log_validation=True)
+
+        # Verify
+        assert len(the_aecg.RHYTHMANNS) > 1
+        for stream_sets, truth_sets in [
+                (the_stream_aecg.RHYTHMANNS, the_aecg.RHYTHMANNS),
+                (the_stream_aecg.DERIVEDANNS, the_aecg.DERIVEDANNS)]:
+            assert [(s.person, s.device, s.anns) for s in stream_sets] == \
+                [(s.person, s.device, s.anns) for s in truth_sets]
+            for annset in truth_sets[1:]:
+                assert annset.anns == truth_sets[0].anns
+        assert the_stream_aecg.validatorResults.equals(truth_valpd)
+
+    # Cleanup -- not needed
+# end test_parse_annotations_stream_vs_read_aecg
+
+
+def test_parse_annotations_stream_malformed_xmlfile(tmp_path):
+    """
+    Test streaming the annotations of a malformed xml file logs an error
+    READFILE validation row, as read_aecg does
+    """
+    # Setup
+    the_xml_filename = str(tmp_path / "malformed.xml")
+    with open(the_xml_filename, "w") as xml_file:
+        xml_file.write('<AnnotatedECG xmlns="urn:hl7-org:v3"><component>')
+
+    # Exercise
+    the_aecg = aecg.io.parse_annotations_stream(the_xml_filename,
+                                                log_validation=True)
+
+    # Verify
+    assert not the_aecg.xmlfound
+    assert the_aecg.RHYTHMANNS == []
+    assert the_aecg.DERIVEDANNS == []
+    assert the_aecg.validatorResults.shape[0] == 1
+    the_row = the_aecg.validatorResults.iloc[0]
+    assert the_row["EGXFN"] == the_xml_filename
+    assert the_row["VALIGRP"] == "READFILE"
+    assert the_row["PARAM"] == "FILENAME"
+    assert the_row["VALUE"] == the_xml_filename
+    assert the_row["VALIOUT"] == "ERROR"
+    assert the_row["VALIMSG"].startswith("Could not read or parse XML file")
+
+    # Cleanup -- not needed
+# end test_parse_annotations_stream_malformed_xmlfile
+
+
+def test_parse_annotations_stream_nonexisting_zipfile():
+    """
+    Test streaming the annotations from a zip file that is not available
+    """
+    # Setup
+    the_xml_filename = "hl7/2003-12 Schema/example/Example aECG.xml"
+    the_zip_container = os.path.normpath(
+        os.path.join(
+            os.path.dirname(aecg.core.__file__), "data/nonexisiting.zip"))
+
+    # Exercise
+    the_aecg = aecg.io.parse_annotations_stream(the_xml_filename,
+                                                the_zip_container,
+                                                log_validation=True)
+
+    # Verify
+    assert not the_aecg.xmlfound
+    assert the_aecg.validatorResults.shape[0] == 1
+    the_row = the_aecg.validatorResults.iloc[0]
+    assert the_row["VALIGRP"] == "READFILE"
+    assert the_row["PARAM"] == "ZIPCONTAINER"
+    assert the_row["VALUE"] == the_zip_container
+    assert the_row["VALIOUT"] == "ERROR"
+
+    # Cleanup -- not needed
+# end test_parse_annotations_stream_nonexisting_zipfile
+
+
+@pytest.mark.parametrize("the_num_processes", [1, 2])
+def test_parse_annotations_batch(tmp_path, the_num_processes):
+    """
+    Test parsing annotations of several files returns one aECG per file in
+    the same order, with failed aECGs for missing or malformed files
+    """
+    # Setup
+    the_malformed_filename = str(tmp_path / "malformed.xml")
+    with open(the_malformed_filename, "w") as xml_file:
+        xml_file.write('<AnnotatedECG xmlns="urn:hl7-org:v3"><component>')
+    the_missing_filename = str(tmp_path / "nonexisting.xml")
+    the_good_filenames = example_aecg_files()
+    the_files = [(the_good_filenames[0], ""),
+                 (the_missing_filename, ""),
+                 (the_good_filenames[1], ""),
+                 (the_malformed_filename, ""),
+                 (the_good_filenames[2], "")]
+
+    # Exercise
+    the_aecgs, the_valpd = aecg.io.parse_annotations_batch(
+        the_files, log_validation=True, num_processes=the_num_processes)
+
+    # Verify
+    assert [(a.filename, a.zipContainer) for a in the_aecgs] == the_files
+    assert [a.xmlfound for a in the_aecgs] == [True, False, True, False,
+                                               True]
+    for the_aecg in [the_aecgs[1], the_aecgs[3]]:
+        assert the_aecg.RHYTHMANNS == []
+        assert the_aecg.DERIVEDANNS == []
+    for the_aecg, the_xml_filename in zip(
+            [the_aecgs[0], the_aecgs[2], the_aecgs[4]],
+            the_good_filenames[:3]):
+        truth_aecg = aecg.io.parse_annotations_stream(the_xml_filename)
+        assert [s.anns for s in the_aecg.RHYTHMANNS] == \
+            [s.anns for s in truth_aecg.RHYTHMANNS]
+        assert [s.anns for s in the_aecg.DERIVEDANNS] == \
+            [s.anns for s in truth_aecg.DERIVEDANNS]
+    assert set(the_valpd["EGXFN"]) >= set(the_good_filenames[:3])
+
+    # Cleanup -- not needed
+# end test_parse_annotations_batch
@@ -0,0 +1,173 @@
+"""Unit tests for aecg package: aecg command line tool.
+
+**Authors**
+
+***Jose Vicente Ruiz*** <jose.vicenteruiz@fda.hhs.gov><br>
+
+    Division of Cardiology and Nephrology
+    Office of Cardiology, Hematology, Endocrinology and Nephrology
+    Office of New Drugs
+    Center for Drug Evaluation and Research
+    U.S. Food and Drug Administration
+
+
+* LICENSE *
+===========
+This code is in the public domain within the United States, and copyright and
+related rights in the work worldwide are waived through the CC0 1.0 Universal
+Public Domain Dedication. This example is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See DISCLAIMER section
+below, the COPYING file in the root directory of this project and
+https://creativecommons.org/publicdomain/zero/1.0/ for more details.
+
+* Disclaimer *
+==============
+FDA assumes no responsibility whatsoever for use by other parties of the
+Software, its source code, documentation or compiled executables, and makes no
+guarantees, expressed or implied, about its quality, reliability, or any other
+characteristic. Further, FDA makes no representations that the use of the
+Software will not infringe any patent or proprietary rights of third parties.
+The use of this code in no way implies endorsement by the FDA or confers any
+advantage in regulatory decisions.
+
+"""
+
+
+import os
+import sys
+
+import matplotlib.image
+import pytest
+
+import aecg
+import aecg.tools.aecg_cli
+
+
+the_xml_filename = os.path.normpath(
+    os.path.join(
+        os.path.dirname(aecg.core.__file__),
+        "data/hl7/2003-12 Schema/example/Example aECG.xml"))
+
+
+def run_cli(monkeypatch, tmp_path, cli_args):
+    """
+    Runs the aecg command line tool with `cli_args` from `tmp_path` and
+    returns the keyword arguments of the read_aecg calls
+    """
+    logging_conf_file = tmp_path / "logging.conf"
+    logging_conf_file.write_text(
+        "[loggers]\nkeys=root\n\n"
+        "[handlers]\nkeys=nullHandler\n\n"
+        "[formatters]\nkeys=\n\n"
+        "[logger_root]\nlevel=WARNING\nhandlers=nullHandler\n\n"
+        "[handler_nullHandler]\nclass=NullHandler\nargs=()\n")
+    read_aecg = aecg.io.read_aecg
+    read_aecg_calls = []
+
+    def recording_read_aecg(*args, **kwargs):
+        read_aecg_calls.append(kwargs)
+        return read_aecg(*args, **kwargs)
+
+    monkeypatch.setattr(aecg.io, "read_aecg", recording_read_aecg)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, "argv",
+                        ["aecg", "-l", str(logging_conf_file)] + cli_args)
+    aecg.tools.aecg_cli.main()
+    return read_aecg_calls
+
+
+@pytest.mark.parametrize("the_command", [["inspect"], ["print"]])
+def test_cli_no_validation_by_default(monkeypatch, tmp_path, the_command):
+    """
+    Test inspect and print do not validate against the schema by default
+    """
+    # Exercise
+    read_aecg_calls = run_cli(monkeypatch, tmp_path,
+                              the_command + [the_xml_filename])
+
+    # Verify
+    assert len(read_aecg_calls) == 1
+    assert read_aecg_calls[0]["aecg_schema_filename"] == ""
+
+    # Cleanup -- not needed
+# end test_cli_no_validation_by_default
+
+
+@pytest.mark.parametrize("the_command", [["inspect"], ["print"]])
+def test_cli_validation(monkeypatch, tmp_path, the_command):
+    """
+    Test --validate and --no-validate options of inspect and print
+    """
+    # Exercise
+    validate_calls = run_cli(monkeypatch, tmp_path,
+                             the_command + [the_xml_filename, "--validate"])
+    no_validate_calls = run_cli(monkeypatch, tmp_path,
+                                the_command + [the_xml_filename,
+                                               "--no-validate"])
+
+    # Verify
+    assert validate_calls[0]["aecg_schema_filename"] == \
+        aecg.get_aecg_schema_location()
+    assert no_validate_calls[0]["aecg_schema_filename"] == ""
+
+    # Cleanup -- not needed
+# end test_cli_validation
+
+
+def test_cli_inspect_without_waveforms(monkeypatch, tmp_path):
+    """
+    Test inspect does not read the waveforms
+    """
+    # Exercise
+    read_aecg_calls = run_cli(monkeypatch, tmp_path,
+                              ["inspect", the_xml_filename])
+
+    # Verify
+    assert not read_aecg_calls[0]["include_digits"]
+    assert not read_aecg_calls[0]["include_waveforms"]
+
+    # Cleanup -- not needed
+# end test_cli_inspect_without_waveforms
+
+
+def test_cli_print_dpi(monkeypatch, tmp_path):
+    """
+    Test the resolution of the png files written by print, with the default
+    and the --dpi option
+    """
+    # Exercise
+    run_cli(monkeypatch, tmp_path, ["print", the_xml_filename])
+    default_shapes = [
+        matplotlib.image.imread(str(tmp_path / png_filename)).shape
+        for png_filename in ["aecg_rhythm.png", "aecg_derived.png"]]
+    run_cli(monkeypatch, tmp_path,
+            ["print", the_xml_filename, "--dpi", "50"])
+    dpi50_shapes = [
+        matplotlib.image.imread(str(tmp_path / png_filename)).shape
+        for png_filename in ["aecg_rhythm.png", "aecg_derived.png"]]
+
+    # Verify
+    for default_shape, dpi50_shape in zip(default_shapes, dpi50_shapes):
+        assert default_shape[0] == pytest.approx(3 * dpi50_shape[0], abs=3)
+        assert default_shape[1] == pytest.approx(3 * dpi50_shape[1], abs=3)
+
+    # Cleanup -- not needed
+# end test_cli_print_dpi
+
+
+def test_cli_print_pdf(monkeypatch, tmp_path):
+    """
+    Test print writes pdf files when requested
+    """
+    # Exercise
+    run_cli(monkeypatch, tmp_path,
+            ["print", the_xml_filename, "--format", "pdf"])
+
+    # Verify
+    for pdf_filename in ["aecg_rhythm.pdf", "aecg_derived.pdf"]:
+        with open(tmp_path / pdf_filename, "rb") as pdf_file:
+            assert pdf_file.read(5) == b"%PDF-"
+
+    # Cleanup -- not needed
+# end test_cli_print_pdf
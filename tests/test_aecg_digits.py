@@ -0,0 +1,155 @@
+"""Unit tests for aecg package: waveform digits parsing.
+
+**Authors**
+
+***Jose Vicente Ruiz*** <jose.vicenteruiz@fda.hhs.gov><br>
+
+    Division of Cardiology and Nephrology
+    Office of Cardiology, Hematology, Endocrinology and Nephrology
+    Office of New Drugs
+    Center for Drug Evaluation and Research
+    U.S. Food and Drug Administration
+
+
+* LICENSE *
+===========
+This code is in the public domain within the United States, and copyright and
+related rights in the work worldwide are waived through the CC0 1.0 Universal
+Public Domain Dedication. This example is distributed in the hope that it will
+be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See DISCLAIMER section
+below, the COPYING file in the root directory of this project and
+https://creativecommons.org/publicdomain/zero/1.0/ for more details.
+
+* Disclaimer *
+==============
+FDA assumes no responsibility whatsoever for use by other parties of the
+Software, its source code, documentation or compiled executables, and makes no
+guarantees, expressed or implied, about its quality, reliability, or any other
+characteristic. Further, FDA makes no representations that the use of the
+Software will not infringe any patent or proprietary rights of third parties.
+The use of this code in no way implies endorsement by the FDA or confers any
+advantage in regulatory decisions.
+
+"""
+
+
+import os
+
+import numpy as np
+import pytest
+
+import aecg
+
+
+def test_parse_digits():
+    """
+    Test parsing digits separated by any whitespace
+    """
+    # Setup
+    the_digits = " -5 10\n\t20\r\n 3000000000 "
+    truth_digits = [-5, 10, 20, 3000000000]
+
+    # Exercise
+    digits = aecg.io._parse_digits(the_digits)
+
+    # Verify
+    assert digits.dtype == np.int64
+    assert digits.tolist() == truth_digits
+
+    # Cleanup -- not needed
+# end test_parse_digits
+
+
+@pytest.mark.parametrize("the_digits", ["", "   ", "\n\t"])
+def test_parse_digits_blank(the_digits):
+    """
+    Test parsing blank digits raises a ValueError instead of returning a
+    made up or empty lead
+    """
+    # Exercise and verify
+    with pytest.raises(ValueError):
+        aecg.io._parse_digits(the_digits)
+
+    # Cleanup -- not needed
+# end test_parse_digits_blank
+
+
+@pytest.mark.parametrize("the_digits", ["1 a 2", "1 2.5 3", "1,2,3"])
+def test_parse_digits_non_numeric(the_digits):
+    """
+    Test parsing digits with non integer values raises a ValueError
+    """
+    # Exercise and verify
+    with pytest.raises(ValueError):
+        aecg.io._parse_digits(the_digits)
+
+    # Cleanup -- not needed
+# end test_parse_digits_non_numeric
+
+
+@pytest.mark.parametrize("the_digits", ["1 9223372036854775808",
+                                        "-9223372036854775809 1",
+                                        "99999999999999999999999"])
+def test_parse_digits_out_of_range(the_digits):
+    """
+    Test parsing digits that do not fit in 64 bits raises a ValueError
+    instead of returning wrapped or clamped values
+    """
+    # Exercise and verify
+    with pytest.raises(ValueError):
+        aecg.io._parse_digits(the_digits)
+
+    # Cleanup -- not needed
+# end test_parse_digits_out_of_range
+
+
+def test_parse_digits_int64_limits():
+    """
+    Test parsing digits at the 64 bits integer limits
+    """
+    # Setup
+    the_digits = "9223372036854775807 -9223372036854775808"
+
+    # Exercise
+    digits = aecg.io._parse_digits(the_digits)
+
+    # Verify
+    assert digits.tolist() == [9223372036854775807, -9223372036854775808]
+
+    # Cleanup -- not needed
+# end test_parse_digits_int64_limits
+
+
+def test_read_digits_as_int64_array():
+    """
+    Test lead digits are returned as 64-bit integer arrays, empty when
+    digits are not read
+    """
+    # Setup
+    the_xml_filename = os.path.normpath(
+        os.path.join(
+            os.path.dirname(aecg.core.__file__),
+            "data/hl7/2003-12 Schema/example/Example aECG.xml"))
+
+    # Exercise
+    the_aecg = aecg.io.read_aecg(the_xml_filename, include_digits=True)
+    the_aecg_nodigits = aecg.io.read_aecg(the_xml_filename,
+                                          include_digits=False)
+
+    # Verify
+    assert aecg.core.AecgLead().digits.dtype == np.int64
+    assert len(aecg.core.AecgLead().digits) == 0
+    assert len(the_aecg.RHYTHMLEADS) > 0
+    assert len(the_aecg.DERIVEDLEADS) > 0
+    for lead in the_aecg.RHYTHMLEADS + the_aecg.DERIVEDLEADS:
+        assert isinstance(lead.digits, np.ndarray)
+        assert lead.digits.dtype == np.int64
+        assert len(lead.digits) > 0
+    for lead in the_aecg_nodigits.RHYTHMLEADS + \
+            the_aecg_nodigits.DERIVEDLEADS:
+        assert lead.digits.dtype == np.int64
+        assert len(lead.digits) == 0
+
+    # Cleanup -- not needed
+# end test_read_digits_as_int64_array